@@ -0,0 +1,100 @@
+"""
+Benchmark für das virtualisierte Gantt-Chart (Offscreen-Qt).
+
+Aufruf (aus dem Projektordner):
+    python -m benchmarks.bench_gantt --tasks 10000 100000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt6.QtWidgets import QApplication
+
+from logic import tasks_db
+from logic.task_store import get_task_store
+
+def seed(count):
+    """
+    Legt ``count`` Aufgaben mit über drei Jahre verteilten Zeiträumen an.
+    """
+    tasks_db.add_tasks(
+        (
+            f"Aufgabe {i}",
+            "To Do",
+            None,
+            f"{2024 + i % 3}-{i % 12 + 1:02d}-{i % 28 + 1:02d}",
+            f"{2024 + i % 3}-{i % 12 + 1:02d}-28",
+            None,
+        )
+        for i in range(count)
+    )
+
+def timed(func, repeat=5):
+    """
+    Führt ``func`` mehrfach aus und gibt die mittlere Laufzeit in Millisekunden zurück.
+    """
+    start = time.perf_counter()
+    for i in range(repeat):
+        func(i)
+    return (time.perf_counter() - start) / repeat * 1000
+
+def run(count, app):
+    from gui.gantt import GanttPage
+    with tempfile.TemporaryDirectory() as tmp:
+        tasks_db.DB_PATH = os.path.join(tmp, "bench.db")
+        tasks_db.init_db()
+        seed(count)
+        store = get_task_store()
+        store.tasks()
+
+        start = time.perf_counter()
+        page = GanttPage()
+        page.resize(1200, 800)
+        page.show()
+        if page._job is not None:
+            # Große Datenmengen werden im Hintergrund aufbereitet
+            page._job.wait()
+        app.processEvents()
+        page.canvas.draw()
+        results = {"Aufbau + erstes Zeichnen": (time.perf_counter() - start) * 1000}
+
+        x0, x1 = page.full_range()
+        results["Intervall-Abfrage (1 Monat)"] = timed(
+            lambda i: page._index.overlapping(x0 + 30 * i, x0 + 30 * i + 30), repeat=50
+        )
+
+        def scroll(i):
+            page.scrollbar.setValue(page.scrollbar.value() + page.rows_per_page())
+            page.canvas.draw()
+        results["Scrollen (1 Seite)"] = timed(scroll)
+
+        def zoom(i):
+            page.set_window(x0 + 30 * i, x0 + 30 * i + 60)
+            page.canvas.draw()
+        results["Zoom/Pan (60 Tage)"] = timed(zoom)
+
+        def edit(i):
+            store.edit_task(1, f"Geändert {i}", "2024-01-01", f"2024-01-{i + 10}")
+            app.processEvents()
+        results["Aufgabe ändern (Store-Update)"] = timed(edit)
+
+        page.close()
+        page.deleteLater()
+        tasks_db.close_db()
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, nargs="+", default=[10000, 100000])
+    args = parser.parse_args()
+    app = QApplication.instance() or QApplication(sys.argv)
+    for count in args.tasks:
+        print(f"{count} Aufgaben")
+        for name, ms in run(count, app).items():
+            print(f"  {name:<32} {ms:9.3f} ms")
+
+if __name__ == "__main__":
+    main()
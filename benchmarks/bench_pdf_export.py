@@ -0,0 +1,65 @@
+"""
+Benchmark für den PDF-Export großer Aufgabenlisten.
+
+Aufruf (aus dem Projektordner):
+    python -m benchmarks.bench_pdf_export --tasks 50000
+"""
+import argparse
+import os
+import resource
+import tempfile
+import time
+import tracemalloc
+
+from logic import tasks_db
+
+def seed(count):
+    """
+    Legt ``count`` synthetische Aufgaben mit wechselnd langen Beschreibungen an.
+    """
+    statuses = ("To Do", "In Progress", "Done")
+    tasks_db.add_tasks(
+        (
+            f"Aufgabe {i}",
+            statuses[i % 3],
+            f"2025-{i % 12 + 1:02d}-{i % 28 + 1:02d}",
+            f"2025-{i % 12 + 1:02d}-01",
+            f"2025-{i % 12 + 1:02d}-28",
+            "Beschreibung " * (i % 40),
+        )
+        for i in range(count)
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=50000)
+    parser.add_argument("--tracemalloc", action="store_true",
+                        help="Python-Speicherspitze messen (verlangsamt den Export deutlich)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tasks_db.DB_PATH = os.path.join(tmp, "bench.db")
+        tasks_db.init_db()
+        seed(args.tasks)
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if args.tracemalloc:
+            tracemalloc.start()
+        start = time.perf_counter()
+        stats = tasks_db.export_tasks_to_pdf(os.path.join(tmp, "bench.pdf"))
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if args.tracemalloc else None
+        tracemalloc.stop()
+        rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        size = os.path.getsize(os.path.join(tmp, "bench.pdf"))
+        tasks_db.close_db()
+
+    print(f"Aufgaben:        {stats['rows']}")
+    print(f"Seiten:          {stats['pages']}")
+    print(f"Zeit:            {elapsed:.2f} s ({stats['pages_per_second']:.1f} Seiten/s)")
+    if peak is not None:
+        print(f"Python-Peak:     {peak / 1024 / 1024:.1f} MiB (tracemalloc)")
+    print(f"Max. RSS:        {rss_after / 1024:.1f} MiB (+{(rss_after - rss_before) / 1024:.1f} MiB beim Export)")
+    print(f"PDF-Größe:       {size / 1024 / 1024:.1f} MiB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Misst die Zeit bis zum ersten Fenster (Offscreen-Qt).
+
+Jeder Lauf startet einen frischen Interpreter, damit bereits geladene Module
+das Ergebnis nicht verfälschen. Gemessen wird ab Interpreterstart bis das
+Hauptfenster gezeichnet ist, danach das erste Öffnen des Gantt-Charts.
+
+Aufruf (aus dem Projektordner):
+    python -m benchmarks.bench_startup --runs 5
+    python -m benchmarks.bench_startup --importtime   # langsamste Imports (-X importtime)
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Läuft im Kindprozess; gibt die Messwerte als JSON aus
+CHILD = r"""
+import json, sys, time
+start = time.perf_counter()
+from PyQt6.QtWidgets import QApplication
+from logic.tasks_db import init_db, init_user_db
+from gui.main_window import MainWindow
+init_db()
+init_user_db()
+app = QApplication(sys.argv)
+window = MainWindow("bench")
+window.show()
+app.processEvents()
+first_window = time.perf_counter() - start
+heavy = sorted(m for m in ("matplotlib", "pandas", "reportlab") if m in sys.modules)
+start = time.perf_counter()
+window.show_gantt()
+app.processEvents()
+first_gantt = time.perf_counter() - start
+print(json.dumps({"first_window": first_window, "first_gantt": first_gantt, "heavy_modules": heavy}))
+"""
+
+def run_child(extra_args=()):
+    """
+    Startet die Anwendung in einem frischen Interpreter (leere DB im Temp-Ordner).
+
+    Returns:
+        subprocess.CompletedProcess: Ergebnis des Kindprozesses.
+    """
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", PYTHONPATH=ROOT)
+    with tempfile.TemporaryDirectory() as tmp:
+        return subprocess.run(
+            [sys.executable, *extra_args, "-c", CHILD],
+            cwd=tmp, env=env, capture_output=True, text=True, check=True,
+        )
+
+def measure(runs=5):
+    """
+    Führt ``runs`` Kaltstarts aus.
+
+    Returns:
+        dict: Median von first_window/first_gantt in ms und die beim Start geladenen schweren Module.
+    """
+    results = [json.loads(run_child().stdout.splitlines()[-1]) for _ in range(runs)]
+    return {
+        "first_window_ms": statistics.median(r["first_window"] for r in results) * 1000,
+        "first_gantt_ms": statistics.median(r["first_gantt"] for r in results) * 1000,
+        "heavy_modules": results[-1]["heavy_modules"],
+    }
+
+def slowest_imports(limit=15):
+    """
+    Wertet ``-X importtime`` für einen Kaltstart aus.
+
+    Returns:
+        list: (kumulierte Zeit in ms, Modul) der langsamsten Top-Level-Imports.
+    """
+    stderr = run_child(("-X", "importtime")).stderr
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            entries.append((int(cumulative) / 1000, name.strip()))
+    return sorted(entries, reverse=True)[:limit]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--importtime", action="store_true")
+    args = parser.parse_args()
+    result = measure(args.runs)
+    print(f"Erstes Fenster      {result['first_window_ms']:9.1f} ms")
+    print(f"Gantt erstmals      {result['first_gantt_ms']:9.1f} ms")
+    print(f"Beim Start geladen  {', '.join(result['heavy_modules']) or '-'}")
+    if args.importtime:
+        print("Langsamste Imports bis zum Gantt-Chart:")
+        for ms, name in slowest_imports():
+            print(f"  {ms:9.1f} ms  {name}")
+
+if __name__ == "__main__":
+    main()
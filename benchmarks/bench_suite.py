@@ -0,0 +1,251 @@
+"""
+Reproduzierbare Benchmark-Suite für Datenbank, Import/Export und Oberfläche (Offscreen-Qt).
+
+Für jede Boardgröße wird eine frische Datenbank mit denselben synthetischen
+Aufgaben befüllt und gemessen. Die Ergebnisse (Millisekunden, Median über
+mehrere Läufe) landen als JSON in einer Datei, damit sich Läufe vergleichen
+lassen.
+
+Aufruf (aus dem Projektordner):
+    python -m benchmarks.bench_suite --sizes 1000 10000 100000 -o bench.json
+    python -m benchmarks.bench_suite --sizes 1000 --skip pdf --compare bench.json --threshold 0.1
+"""
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt6.QtCore import QT_VERSION_STR, QDate, QThreadPool
+from PyQt6.QtWidgets import QApplication
+
+from logic import tasks_db
+from logic.task_store import get_task_store
+from benchmarks.bench_pdf_export import seed
+
+# add_task() einzeln ist pro Aufgabe ein Commit; mehr Zeilen bringen keine neue Erkenntnis
+INSERT_LOOP_LIMIT = 5000
+# Scroll-Schritte (Pixel) und Anzahl Bilder für die Kanban-Messung
+SCROLL_STEP = 120
+SCROLL_FRAMES = 200
+# Abweichung, ab der --compare eine Messung markiert
+REGRESSION_THRESHOLD = 0.2
+# Zeitraum der Startdaten aus seed() (feste Daten, unabhängig vom heutigen Tag)
+SEED_START_RANGE = ("2025-01-01", "2025-12-31")
+
+def timed(func, repeat=3):
+    """
+    Führt ``func`` ``repeat``-mal aus.
+
+    Returns:
+        float: Median der Laufzeit in Millisekunden.
+    """
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+def use_db(path):
+    """
+    Schaltet ``tasks_db`` auf eine neue, leere Datenbank um.
+    """
+    tasks_db.close_all_db()
+    tasks_db.DB_PATH = path
+    tasks_db.init_db()
+
+def bench_db(count, tmp, skip):
+    """
+    Misst Lesen, Einfügen sowie CSV- und PDF-Export/-Import.
+    """
+    results = {}
+    loop = min(count, INSERT_LOOP_LIMIT)
+    use_db(os.path.join(tmp, "loop.db"))
+    start = time.perf_counter()
+    for i in range(loop):
+        tasks_db.add_task(f"Aufgabe {i}", "To Do", "2025-05-01")
+    results["add_task_loop_per_task"] = (time.perf_counter() - start) * 1000 / loop
+    use_db(os.path.join(tmp, "bulk.db"))
+    start = time.perf_counter()
+    tasks_db.add_tasks((f"Aufgabe {i}", "To Do", "2025-05-01", None, None, None) for i in range(loop))
+    results["add_tasks_bulk_per_task"] = (time.perf_counter() - start) * 1000 / loop
+
+    use_db(os.path.join(tmp, "board.db"))
+    start = time.perf_counter()
+    seed(count)
+    results["seed_bulk"] = (time.perf_counter() - start) * 1000
+    results["get_tasks"] = timed(tasks_db.get_tasks)
+    results["get_task_stats"] = timed(tasks_db.get_task_stats, repeat=5)
+    results["search_tasks_selective"] = timed(lambda: tasks_db.search_tasks("aufgabe 99", 50), repeat=5)
+    results["search_tasks_common_prefix"] = timed(lambda: tasks_db.search_tasks("b", 50), repeat=5)
+    csv_path = os.path.join(tmp, "export.csv")
+    results["export_csv"] = timed(lambda: tasks_db.export_tasks_to_csv(csv_path))
+    if "pdf" not in skip:
+        results["export_pdf"] = timed(lambda: tasks_db.export_tasks_to_pdf(os.path.join(tmp, "export.pdf")), repeat=1)
+
+    use_db(os.path.join(tmp, "import.db"))
+    results["import_csv"] = timed(lambda: tasks_db.import_tasks_from_csv(csv_path), repeat=1)
+    use_db(os.path.join(tmp, "board.db"))
+    return results
+
+def bench_gui(app):
+    """
+    Misst die Seiten auf der aktuellen Datenbank (Offscreen-Qt).
+    """
+    from gui.tasks import TasksPage, KanbanListView
+    from gui.task_model import TaskListModel
+    from gui.dashboard import DashboardPage
+    from gui.gantt import GanttPage
+    results = {}
+    store = get_task_store()
+
+    start = time.perf_counter()
+    store.tasks()
+    results["task_store_load"] = (time.perf_counter() - start) * 1000
+
+    # Standardmäßig zeigt die Seite nur den letzten Monat, die Testdaten liegen
+    # aber in 2025: ohne angepassten Datumsfilter würde ein leeres Board gemessen
+    start = time.perf_counter()
+    tasks_page = TasksPage()
+    tasks_page.start_filter.blockSignals(True)
+    tasks_page.start_filter.setDate(QDate.fromString(SEED_START_RANGE[0], "yyyy-MM-dd"))
+    tasks_page.start_filter.blockSignals(False)
+    tasks_page.end_filter.setDate(QDate.fromString(SEED_START_RANGE[1], "yyyy-MM-dd"))
+    results["tasks_page_init"] = (time.perf_counter() - start) * 1000
+    results["tasks_page_refresh"] = timed(tasks_page.refresh)
+    if not any(model.rowCount() for model in tasks_page.models.values()):
+        raise RuntimeError(f"Aufgaben-Seite ist leer, Datumsfilter passt nicht zu seed(): {tasks_page._date_range()}")
+
+    # Bildaufbau beim Scrollen durch die größte Spalte (Budget für 60 fps: 16,7 ms)
+    # (eigene Spalte ohne Datumsfilter, also mit allen Aufgaben des Status)
+    # Öffnen der Spalte lädt nur die erste Seite, beim Scrollen folgt der Rest per fetchMore
+    model = TaskListModel("To Do")
+    def fetch_page(after, limit):
+        return tasks_db.query_task_page("To Do", after=after, limit=limit)
+    results["kanban_column_open"] = timed(lambda: model.set_source(fetch_page))
+    view = KanbanListView("To Do", model, tasks_page)
+    view.resize(360, 900)
+    view.show()
+    app.processEvents()
+    bar = view.verticalScrollBar()
+    start = time.perf_counter()
+    for frame in range(SCROLL_FRAMES):
+        bar.setValue(frame * SCROLL_STEP % (bar.maximum() + 1))
+        view.viewport().repaint()
+    results["kanban_scroll_frame"] = (time.perf_counter() - start) * 1000 / SCROLL_FRAMES
+    view.deleteLater()
+
+    pages = []
+    results["dashboard_page_init"] = timed(lambda: pages.append(DashboardPage("bench")))
+
+    gantt = GanttPage()
+    gantt.resize(1200, 800)
+
+    def plot():
+        gantt._tasks = None  # erzwingt komplette Neuberechnung
+        gantt.plot_gantt()
+        if gantt._job is not None:
+            gantt._job.wait()
+        app.processEvents()
+        gantt.canvas.draw()
+    results["gantt_plot"] = timed(plot)
+
+    for page in [tasks_page, gantt, *pages]:
+        page.deleteLater()
+    app.processEvents()
+    return results
+
+def run(count, app, skip):
+    """
+    Führt alle Messungen für ein Board mit ``count`` Aufgaben aus.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        results = bench_db(count, tmp, skip)
+        if "gui" not in skip:
+            results.update(bench_gui(app))
+        QThreadPool.globalInstance().waitForDone()
+        tasks_db.close_all_db()
+    return {name: round(ms, 3) for name, ms in results.items()}
+
+def metadata():
+    """
+    Umgebung des Laufs, damit Ergebnisse nur mit vergleichbaren Läufen verglichen werden.
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "qt": QT_VERSION_STR,
+        "platform": platform.platform(),
+    }
+
+def compare(current, previous, threshold=REGRESSION_THRESHOLD):
+    """
+    Vergleicht zwei Ergebnis-Dicts.
+
+    Args:
+        current (dict): Aktuelle Ergebnisse.
+        previous (dict): Frühere Ergebnisse.
+        threshold (float): Relative Verlangsamung, ab der eine Messung als langsamer gilt.
+
+    Returns:
+        list: (Größe, Messung, alt, neu, Faktor, langsamer) für alle gemeinsamen Messungen.
+    """
+    rows = []
+    for size, results in current["results"].items():
+        old_results = previous["results"].get(size, {})
+        for name, ms in results.items():
+            old = old_results.get(name)
+            if old:
+                factor = ms / old
+                rows.append((size, name, old, ms, factor, factor > 1 + threshold))
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("-o", "--output", default="bench_results.json")
+    parser.add_argument("--skip", nargs="*", default=[], choices=("pdf", "gui"))
+    parser.add_argument("--compare", help="Frühere Ergebnisdatei zum Vergleich")
+    parser.add_argument(
+        "--threshold", type=float, default=REGRESSION_THRESHOLD,
+        help="Relative Verlangsamung, ab der --compare eine Messung markiert (Standard: 0.2)",
+    )
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    report = {"meta": metadata(), "results": {}}
+    for count in args.sizes:
+        print(f"{count} Aufgaben")
+        results = report["results"][str(count)] = run(count, app, args.skip)
+        for name, ms in results.items():
+            print(f"  {name:<26} {ms:11.3f} ms")
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Ergebnisse gespeichert: {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)
+        print(f"Vergleich mit {args.compare} ({previous['meta'].get('commit')}):")
+        for size, name, old, new, factor, slower in compare(report, previous, args.threshold):
+            flag = "  <-- langsamer" if slower else ""
+            print(f"  {size:>7} {name:<26} {old:11.3f} -> {new:11.3f} ms  x{factor:5.2f}{flag}")
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,9 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout, QProgressBar, QSizePolicy, QMenu, QPushButton
 from PyQt6.QtGui import QAction, QCursor
 from PyQt6.QtCore import Qt
-from logic.tasks_db import get_tasks
+from logic import perf
+from logic.tasks_db import get_task_stats
+from logic.task_store import get_task_store
 
 class DashboardPage(QWidget):
     """
@@ -45,34 +47,29 @@ class DashboardPage(QWidget):
         main_layout.addLayout(header)
 
         stats_box = QHBoxLayout()
-        tasks = get_tasks()
-        total = len(tasks)
-        todo = sum(1 for t in tasks if t[2] == "To Do")
-        inprogress = sum(1 for t in tasks if t[2] == "In Progress")
-        done = sum(1 for t in tasks if t[2] == "Done")
-
         stat_labels = [
-            ("<span style='font-size:22px;'>📋</span><br>Gesamt", total, "#6366f1"),
-            ("<span style='font-size:22px;'>🕒</span><br>Offen", todo, "#f59e42"),
-            ("<span style='font-size:22px;'>🚧</span><br>In Arbeit", inprogress, "#3b82f6"),
-            ("<span style='font-size:22px;'>✅</span><br>Erledigt", done, "#22c55e"),
+            ("<span style='font-size:22px;'>📋</span><br>Gesamt", "total", "#6366f1"),
+            ("<span style='font-size:22px;'>🕒</span><br>Offen", "To Do", "#f59e42"),
+            ("<span style='font-size:22px;'>🚧</span><br>In Arbeit", "In Progress", "#3b82f6"),
+            ("<span style='font-size:22px;'>✅</span><br>Erledigt", "Done", "#22c55e"),
         ]
-        for label, value, color in stat_labels:
+        self.value_labels = {}
+        for label, key, color in stat_labels:
             box = QVBoxLayout()
             l = QLabel(label)
             l.setStyleSheet("font-size: 15px; color: #888; text-align: center;")
             l.setTextFormat(Qt.TextFormat.RichText)
-            v = QLabel(str(value))
+            v = QLabel()
             v.setStyleSheet(f"font-size: 32px; font-weight: bold; color: {color}; text-align: center;")
+            self.value_labels[key] = v
             box.addWidget(l, alignment=Qt.AlignmentFlag.AlignCenter)
             box.addWidget(v, alignment=Qt.AlignmentFlag.AlignCenter)
             stats_box.addLayout(box)
         main_layout.addLayout(stats_box)
 
-        progress = QProgressBar()
-        progress.setValue(int(done / total * 100) if total else 0)
-        progress.setFormat("Fortschritt: %p%")
-        progress.setStyleSheet("""
+        self.progress = QProgressBar()
+        self.progress.setFormat("Fortschritt: %p%")
+        self.progress.setStyleSheet("""
             QProgressBar {
                 border-radius: 8px;
                 background: #222;
@@ -84,26 +81,34 @@ class DashboardPage(QWidget):
                 border-radius: 8px;
             }
         """)
-        main_layout.addWidget(progress)
+        main_layout.addWidget(self.progress)
 
-        next_due = min(
-            (t for t in tasks if t[3]),
-            key=lambda t: t[3],
-            default=None
-        )
-        next_label = QLabel()
-        if next_due:
-            next_label.setText(f"Nächste Fälligkeit: <b>{next_due[1]}</b> am <b>{next_due[3]}</b>")
-        else:
-            next_label.setText("Keine fälligen Aufgaben.")
-        next_label.setStyleSheet("font-size: 15px; margin-top: 18px;")
-        main_layout.addWidget(next_label)
+        self.next_label = QLabel()
+        self.next_label.setStyleSheet("font-size: 15px; margin-top: 18px;")
+        main_layout.addWidget(self.next_label)
 
-    def refresh(self):
+        self.refresh()
+        store = get_task_store()
+        store.tasks_changed.connect(self.refresh)
+        store.tasks_reset.connect(self.refresh)
+
+    @perf.timed("DashboardPage.refresh")
+    def refresh(self, *_):
         """
-        Aktualisiert das Dashboard, indem es die Ansicht neu aufbaut.
+        Aktualisiert Zahlen, Fortschrittsbalken und nächste Fälligkeit in den vorhandenen Widgets.
         """
-        self.__init__()  # Einfach neu aufbauen, damit alles aktuell ist
+        stats = get_task_stats()
+        total = stats["total"]
+        done = stats["by_status"].get("Done", 0)
+        for key, label in self.value_labels.items():
+            value = total if key == "total" else stats["by_status"].get(key, 0)
+            label.setText(str(value))
+        self.progress.setValue(int(done / total * 100) if total else 0)
+        next_due = stats["next_due"]
+        if next_due:
+            self.next_label.setText(f"Nächste Fälligkeit: <b>{next_due[1]}</b> am <b>{next_due[2]}</b>")
+        else:
+            self.next_label.setText("Keine fälligen Aufgaben.")
 
     def show_profile_menu(self):
         """
@@ -120,13 +125,13 @@ class DashboardPage(QWidget):
         Meldet den aktuellen Benutzer ab und zeigt den Login-Dialog.
         """
         from gui.login import LoginDialog
-        app = self.window().parent()
-        self.window().close()
+        from logic.auth import logout
+        window = self.window()
+        logout(getattr(window, "session_token", None))
+        window.close()
         login = LoginDialog()
+        # Gleicher Benutzer mit gleichem Passwort: der Sitzungs-Cache spart Datenbank und Schlüsselableitung
         if login.exec() == login.DialogCode.Accepted:
-            username, password = login.get_credentials()
-            from logic.tasks_db import check_user
-            if check_user(username, password):
-                from gui.main_window import MainWindow
-                window = MainWindow()
-                window.show()
+            username, _ = login.get_credentials()
+            from gui.main_window import show_main_window
+            show_main_window(username, login.token)
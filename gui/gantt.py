@@ -1,68 +1,395 @@
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
-from logic.tasks_db import get_tasks
+from matplotlib.figure import Figure
+from matplotlib.collections import PolyCollection
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QScrollBar
+from PyQt6.QtCore import Qt
+from logic import perf
+from logic.task_store import get_task_store
+from logic.jobs import start_job
+from gui.task_delegate import STATUS_COLORS
+import numpy as np
 import pandas as pd
 import matplotlib.dates as mdates
+from matplotlib.ticker import FuncFormatter, MultipleLocator
+
+BAR_HEIGHT = 0.5
+# Pixel pro Gantt-Zeile; bestimmt, wie viele Zeilen gleichzeitig gezeichnet werden
+ROW_HEIGHT_PX = 26
+# Zoomfaktor pro Mausrad-Raste (Strg+Mausrad)
+ZOOM_STEP = 1.25
+# Ab so vielen Balken werden die Daten im Hintergrund aufbereitet
+ASYNC_PREPARE_ROWS = 20000
+# Balkenfarbe je Status wie auf den Kanban-Karten; unbekannte Status in Blau
+BAR_COLORS = {status: color.name() for status, color in STATUS_COLORS.items()}
+DEFAULT_BAR_COLOR = "#3b82f6"
+
+def gantt_fields(task):
+    """
+    Gibt die für das Gantt-Chart relevanten Felder einer Aufgabe zurück.
+
+    Returns:
+        tuple: (Titel, Status, Start, Ende) oder None, falls die Aufgabe nicht
+        angezeigt wird (ohne Start-/Enddatum oder Titel länger als 20 Zeichen).
+    """
+    if task is None or not (task[4] and task[5]) or len(task[1]) > 20:
+        return None
+    return task[1], task[2], task[4], task[5]
+
+def prepare_gantt_data(tasks):
+    """
+    Bereitet die Balken des Gantt-Charts vor.
+
+    Es werden nur Aufgaben mit gültigem Start- und Enddatum (Titel max. 20
+    Zeichen) berücksichtigt, nach Startdatum sortiert. Filtern, Parsen und
+    Sortieren laufen spaltenweise über pandas/NumPy statt Zeile für Zeile.
+
+    Args:
+        tasks (sequence): Aufgaben-Tupel wie aus ``get_tasks()``.
+
+    Returns:
+        tuple: (ids, titles, statuses, starts, ends) – NumPy-Arrays in
+        Zeilenreihenfolge; Titel und Status als Objekt-Arrays, Start und Ende
+        als Matplotlib-Datumszahlen (Tage).
+    """
+    if not tasks:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=object), np.empty(0, dtype=object), np.empty(0), np.empty(0)
+    ids, titles, statuses, _, starts, ends, _ = zip(*tasks)
+    titles = pd.Series(titles, dtype=object)
+    starts = pd.to_datetime(pd.Series(starts, dtype=object), errors="coerce")
+    ends = pd.to_datetime(pd.Series(ends, dtype=object), errors="coerce")
+    valid = (starts.notna() & ends.notna() & (titles.str.len() <= 20)).to_numpy()
+    starts = mdates.date2num(starts[valid].to_numpy())
+    ends = mdates.date2num(ends[valid].to_numpy())
+    order = np.argsort(starts, kind="stable")
+    return (
+        np.asarray(ids, dtype=np.int64)[valid][order],
+        titles[valid].to_numpy()[order],
+        np.asarray(statuses, dtype=object)[valid][order],
+        starts[order],
+        ends[order],
+    )
+
+def bar_vertices(starts, ends, height=BAR_HEIGHT):
+    """
+    Baut die Rechtecke aller Balken als (n, 4, 2)-Array für eine PolyCollection.
+    """
+    y = np.arange(len(starts), dtype=float)
+    bottom = y - height / 2
+    top = y + height / 2
+    return np.stack([
+        np.column_stack([starts, bottom]),
+        np.column_stack([starts, top]),
+        np.column_stack([ends, top]),
+        np.column_stack([ends, bottom]),
+    ], axis=1)
+
+class GanttIntervalIndex:
+    """
+    Index über die Zeiträume der Gantt-Balken für schnelle Überlappungsabfragen.
+
+    Die Balken sind nach Start sortiert. Für "normal lange" Balken reicht
+    deshalb eine binäre Suche im Bereich ``[x0 - längste Dauer, x1]``; die
+    wenigen sehr langen Balken (über dem Quantil) werden separat geprüft,
+    damit ein einzelner Ausreißer die Suche nicht auf alle Zeilen ausweitet.
+    """
+    def __init__(self, starts, ends, long_quantile=0.99):
+        """
+        Args:
+            starts (ndarray): Startwerte, aufsteigend sortiert.
+            ends (ndarray): Endwerte in derselben Reihenfolge.
+            long_quantile (float): Dauer-Quantil, ab dem ein Balken als "lang" gilt.
+        """
+        self.starts = starts
+        self.ends = ends
+        durations = ends - starts
+        self.max_duration = float(np.quantile(durations, long_quantile)) if len(durations) else 0.0
+        is_long = durations > self.max_duration
+        self._short_rows = np.flatnonzero(~is_long)
+        self._short_starts = starts[self._short_rows]
+        self._long_rows = np.flatnonzero(is_long)
+
+    def overlapping(self, x0, x1):
+        """
+        Gibt die Zeilennummern aller Balken zurück, die ``[x0, x1]`` berühren (aufsteigend).
+        """
+        lo = np.searchsorted(self._short_starts, x0 - self.max_duration, side="left")
+        hi = np.searchsorted(self._short_starts, x1, side="right")
+        rows = self._short_rows[lo:hi]
+        rows = rows[self.ends[rows] >= x0]
+        if len(self._long_rows):
+            long_rows = self._long_rows[
+                (self.starts[self._long_rows] <= x1) & (self.ends[self._long_rows] >= x0)
+            ]
+            rows = np.union1d(rows, long_rows)
+        return rows
 
 class GanttPage(QWidget):
     """
     Seite für die Anzeige eines Gantt-Charts aller Aufgaben mit Start- und Enddatum.
+
+    Gezeichnet werden nur die Zeilen im sichtbaren Ausschnitt: Mausrad
+    scrollt durch die Aufgaben, Strg+Mausrad zoomt den Zeitraum,
+    Umschalt+Mausrad verschiebt ihn. Angezeigt werden jeweils die Aufgaben,
+    die den gewählten Zeitraum berühren.
+
+    Einzelne Änderungen aus dem Store (``tasks_changed``) werden gezielt
+    eingearbeitet; nur ``tasks_reset`` baut alles neu auf.
     """
     def __init__(self):
         """
         Initialisiert die Gantt-Chart-Seite und zeigt das Diagramm an.
+
+        Figure, Canvas und Balken-Collection werden einmal angelegt und bei
+        jeder Aktualisierung nur mit neuen Daten gefüllt.
         """
         super().__init__()
         self.layout = QVBoxLayout(self)
+        header = QHBoxLayout()
         title = QLabel("Gantt-Chart (Projektübersicht)")
         title.setStyleSheet("font-size: 24px; font-weight: bold; margin: 20px;")
-        self.layout.addWidget(title)
-        self.canvas = None
+        header.addWidget(title, 1)
+        self.reset_btn = QPushButton("Gesamter Zeitraum")
+        self.reset_btn.clicked.connect(self.reset_view)
+        header.addWidget(self.reset_btn)
+        self.layout.addLayout(header)
+
+        self.empty_label = QLabel("Keine Aufgaben mit Start- und Enddatum vorhanden.")
+        self.layout.addWidget(self.empty_label)
+
+        self.figure = Figure(figsize=(9, 3))
+        self.canvas = FigureCanvas(self.figure)
+        self.ax = self.figure.add_subplot()
+        # Die Balken werden separat gezeichnet (Blitting), damit Änderungen an
+        # einzelnen Aufgaben nicht Achsen und Beschriftungen neu rendern.
+        self.bars = PolyCollection([], facecolors="#3b82f6", edgecolors="#222", alpha=0.85, animated=True)
+        self.ax.add_collection(self.bars)
+        self._background = None
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+        self.canvas.mpl_connect("resize_event", self._on_resize)
+        self.canvas.mpl_connect("scroll_event", self._on_scroll)
+        self.ax.set_xlabel("Datum", fontsize=12)
+        self.ax.set_title("Gantt-Chart (Aufgaben mit Start-/Enddatum)", fontsize=15, fontweight="bold")
+        self.ax.grid(axis='x', linestyle='--', alpha=0.5)
+        # Datumsformatierung und bessere Lesbarkeit
+        self.ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+        self.ax.xaxis.set_major_formatter(mdates.DateFormatter('%d.%m.%Y'))
+        self.ax.tick_params(axis="x", labelrotation=30, rotation_mode="xtick")
+        # Es werden nur so viele Zeilen gezeichnet, wie lesbar übereinander
+        # passen; der Formatter holt den Titel zur Zeilennummer aus self._titles.
+        self.ax.yaxis.set_major_locator(MultipleLocator(1))
+        self.ax.yaxis.set_major_formatter(FuncFormatter(self._row_label))
+        self.ax.tick_params(axis="y", labelsize=12)
+
+        chart_layout = QHBoxLayout()
+        chart_layout.addWidget(self.canvas, 1)
+        self.scrollbar = QScrollBar(Qt.Orientation.Vertical)
+        self.scrollbar.valueChanged.connect(self._update_viewport)
+        chart_layout.addWidget(self.scrollbar)
+        self.layout.addLayout(chart_layout, 1)
+
+        self._tasks = None  # {id: gantt_fields(...)} aller angezeigten Aufgaben
+        self._ids = np.empty(0, dtype=np.int64)
+        self._all_titles = np.empty(0, dtype=object)
+        self._statuses = np.empty(0, dtype=object)
+        self._starts = self._ends = np.empty(0)
+        self._index = None
+        self._window = None
+        self._titles = []
+        self._job = None
+        store = get_task_store()
+        store.tasks_changed.connect(self.update_tasks)
+        store.tasks_reset.connect(self.plot_gantt)
         self.plot_gantt()
 
-    def plot_gantt(self):
+    @perf.timed("GanttPage.plot_gantt")
+    def plot_gantt(self, *_):
         """
-        Erstellt und zeigt das Gantt-Chart für alle Aufgaben mit Start- und Enddatum.
+        Aktualisiert das Gantt-Chart für alle Aufgaben mit Start- und Enddatum.
+
+        Ändern sich die relevanten Aufgaben nicht, wird nichts neu gezeichnet.
+        Große Datenmengen werden in einem Hintergrund-Job aufbereitet; bis zum
+        Ergebnis bleibt das bisherige Diagramm stehen.
         """
-        tasks = [
-            (t[1], t[4], t[5])  # (title, start_date, end_date)
-            for t in get_tasks()
-            if t[4] and t[5] and len(t[1]) <= 20
-        ]
-        # Sortiere nach Startdatum
-        tasks.sort(key=lambda x: x[1])
+        rows = [t for t in get_task_store().tasks() if gantt_fields(t) is not None]
+        tasks = {t[0]: gantt_fields(t) for t in rows}
+        if tasks == self._tasks:
+            return
+        self._tasks = tasks
+        if self._job is not None:
+            self._job.cancel()
+            self._job = None
+        if len(rows) < ASYNC_PREPARE_ROWS:
+            self._show_data(prepare_gantt_data(rows))
+            return
+        job = self._job = start_job(prepare_gantt_data, rows)
+
+        def on_finished(data):
+            # Nur das Ergebnis des zuletzt gestarteten Jobs anzeigen
+            if self._job is job:
+                self._show_data(data)
+        job.signals.finished.connect(on_finished)
 
-        if self.canvas:
-            self.layout.removeWidget(self.canvas)
-            self.canvas.setParent(None)
+    @perf.timed("GanttPage.update_tasks")
+    def update_tasks(self, task_ids):
+        """
+        Arbeitet geänderte Aufgaben gezielt ein, ohne alle Aufgaben neu aufzubereiten.
 
-        if not tasks:
-            label = QLabel("Keine Aufgaben mit Start- und Enddatum vorhanden.")
-            self.layout.addWidget(label)
+        Ändern sich nur Titel oder Status, werden die betroffenen Zeilen
+        überschrieben und die sichtbaren Balken neu eingefärbt. Neue,
+        gelöschte oder verschobene Balken werden in die sortierten Arrays
+        eingefügt bzw. daraus entfernt; nur dann wird der Intervall-Index
+        (vektorisiert) neu aufgebaut.
+        """
+        if self._tasks is None or self._job is not None:
+            # Noch kein Stand bzw. Aufbereitung im Hintergrund läuft: komplett neu
+            self.plot_gantt()
             return
+        current = get_task_store().get_many(task_ids)
+        removed, added = [], []
+        for task_id in task_ids:
+            old = self._tasks.get(task_id)
+            new = gantt_fields(current.get(task_id))
+            if new == old:
+                continue
+            if old is not None and new is not None and old[2:] == new[2:]:
+                # Gleicher Zeitraum: Zeile bleibt, nur Titel/Status ändern sich
+                row = np.flatnonzero(self._ids == task_id)
+                self._all_titles[row] = new[0]
+                self._statuses[row] = new[1]
+            else:
+                if old is not None:
+                    removed.append(task_id)
+                if new is not None:
+                    added.append(current[task_id])
+            if new is None:
+                del self._tasks[task_id]
+            else:
+                self._tasks[task_id] = new
+        if not removed and not added:
+            self._update_viewport()
+            return
+        keep = ~np.isin(self._ids, removed)
+        data = [self._ids[keep], self._all_titles[keep], self._statuses[keep], self._starts[keep], self._ends[keep]]
+        new_ids, new_titles, new_statuses, new_starts, new_ends = prepare_gantt_data(added)
+        positions = np.searchsorted(data[3], new_starts, side="right")
+        for i, values in enumerate((new_ids, new_titles, new_statuses, new_starts, new_ends)):
+            data[i] = np.insert(data[i], positions, values)
+        self._show_data(tuple(data))
 
-        fig, ax = plt.subplots(figsize=(9, max(3, len(tasks) * 0.5)))
-        yticks = []
-        ylabels = []
-        for i, (title, start, end) in enumerate(tasks):
-            start_dt = pd.to_datetime(start)
-            end_dt = pd.to_datetime(end)
-            ax.barh(i, (end_dt - start_dt).days, left=start_dt,
-                    height=0.5, color="#3b82f6", edgecolor="#222", alpha=0.85)
-            yticks.append(i)
-            ylabels.append(title)
-        ax.set_yticks(yticks)
-        ax.set_yticklabels(ylabels, fontsize=12)
-        ax.set_xlabel("Datum", fontsize=12)
-        ax.set_title("Gantt-Chart (Aufgaben mit Start-/Enddatum)", fontsize=15, fontweight="bold")
-        ax.grid(axis='x', linestyle='--', alpha=0.5)
-        fig.tight_layout(pad=2.0)
+    def _show_data(self, data):
+        """
+        Übernimmt das Ergebnis von ``prepare_gantt_data`` und zeichnet neu.
+        """
+        self._job = None
+        self._ids, self._all_titles, self._statuses, self._starts, self._ends = data
+        self._index = GanttIntervalIndex(self._starts, self._ends)
 
-        # Datumsformatierung und bessere Lesbarkeit
-        ax.xaxis.set_major_locator(mdates.AutoDateLocator())
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%d.%m.%Y'))
-        fig.autofmt_xdate(rotation=30)
+        has_rows = bool(len(self._ids))
+        self.empty_label.setVisible(not has_rows)
+        self.canvas.setVisible(has_rows)
+        self.scrollbar.setVisible(has_rows)
+        if has_rows:
+            self._update_viewport()
+
+    def full_range(self):
+        """
+        Gibt den Zeitraum aller Balken (mit einem Tag Rand) zurück.
+        """
+        return (float(self._starts.min()) - 1, float(self._ends.max()) + 1)
+
+    def visible_range(self):
+        """
+        Gibt den aktuell angezeigten Zeitraum als Matplotlib-Datumszahlen zurück.
+        """
+        return self._window or self.full_range()
+
+    def rows_per_page(self):
+        """
+        Anzahl Zeilen, die bei der aktuellen Canvas-Höhe lesbar Platz haben.
+        """
+        height = self.ax.get_window_extent().height
+        return max(1, int(height // ROW_HEIGHT_PX))
+
+    def reset_view(self):
+        """
+        Zeigt wieder den gesamten Zeitraum ab der ersten Zeile.
+        """
+        self._window = None
+        self.scrollbar.setValue(0)
+        self._update_viewport()
+
+    def set_window(self, x0, x1):
+        """
+        Zeigt nur den Zeitraum ``[x0, x1]`` (Matplotlib-Datumszahlen).
+        """
+        self._window = (x0, x1)
+        self._update_viewport()
+
+    @perf.timed("GanttPage.update_viewport")
+    def _update_viewport(self, *_):
+        """
+        Zeichnet die Balken im sichtbaren Ausschnitt (Zeilen und Zeitraum).
+        """
+        if self._index is None or not len(self._ids):
+            return
+        x0, x1 = self.visible_range()
+        rows = self._index.overlapping(x0, x1)
+        per_page = self.rows_per_page()
+        self.scrollbar.blockSignals(True)
+        self.scrollbar.setRange(0, max(0, len(rows) - per_page))
+        self.scrollbar.setPageStep(per_page)
+        self.scrollbar.blockSignals(False)
+        first = self.scrollbar.value()
+        visible = rows[first:first + per_page]
+        titles = [self._all_titles[i] for i in visible]
+        self.bars.set_verts(bar_vertices(self._starts[visible], self._ends[visible]))
+        self.bars.set_facecolor([BAR_COLORS.get(status, DEFAULT_BAR_COLOR) for status in self._statuses[visible]])
+        ylim = (per_page - 0.5, -0.5)
+        if (self._background is not None and titles == self._titles
+                and (x0, x1) == self.ax.get_xlim() and ylim == self.ax.get_ylim()):
+            # Achsen unverändert: nur die Balken über den gespeicherten Hintergrund legen
+            self.canvas.restore_region(self._background)
+            self.ax.draw_artist(self.bars)
+            self.canvas.blit(self.ax.bbox)
+            return
+        self._titles = titles
+        self.ax.set_ylim(*ylim)
+        self.ax.set_xlim(x0, x1)
+        self.canvas.draw_idle()
+
+    def _on_scroll(self, event):
+        """
+        Mausrad: Zeilen scrollen, mit Strg zoomen, mit Umschalt den Zeitraum verschieben.
+        """
+        if not len(self._ids):
+            return
+        x0, x1 = self.visible_range()
+        if event.key == "control" and event.xdata is not None:
+            factor = ZOOM_STEP ** -event.step
+            self.set_window(event.xdata - (event.xdata - x0) * factor, event.xdata + (x1 - event.xdata) * factor)
+        elif event.key == "shift":
+            shift = (x1 - x0) * 0.1 * -event.step
+            self.set_window(x0 + shift, x1 + shift)
+        else:
+            self.scrollbar.setValue(self.scrollbar.value() - int(event.step * 3))
 
-        self.canvas = FigureCanvas(fig)
-        self.layout.addWidget(self.canvas)
+    def _on_resize(self, _event):
+        """
+        Passt Ränder und Zeilenzahl an die neue Canvasgröße an.
+        """
+        self.figure.tight_layout(pad=2.0)
+        self._update_viewport()
+
+    def _on_draw(self, _event):
+        """
+        Merkt sich nach jedem vollständigen Zeichnen den Hintergrund und legt die Balken darüber.
+        """
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self.bars)
+
+    def _row_label(self, value, _pos):
+        """
+        Tick-Beschriftung der Y-Achse: Titel der Aufgabe in Zeile ``value``.
+        """
+        row = int(round(value))
+        return self._titles[row] if 0 <= row < len(self._titles) else ""
@@ -1,9 +1,15 @@
-from PyQt6.QtWidgets import QDialog, QFormLayout, QLineEdit, QDialogButtonBox, QMessageBox, QPushButton
+from PyQt6.QtWidgets import QDialog, QFormLayout, QLineEdit, QDialogButtonBox, QMessageBox, QPushButton, QLabel
 from .register_dialog import RegisterDialog
+from logic.auth import login
+from logic.jobs import start_job
 
 class LoginDialog(QDialog):
     """
     Dialogfenster für den Login eines Benutzers.
+
+    Die Zugangsdaten werden bei "OK" in einem Hintergrund-Job geprüft (die
+    Schlüsselableitung dauert absichtlich spürbar); der Dialog schließt sich
+    erst nach erfolgreicher Anmeldung, ``token`` enthält dann die Sitzung.
     """
     def __init__(self, parent=None):
         """
@@ -17,10 +23,14 @@ class LoginDialog(QDialog):
         self.password.setEchoMode(QLineEdit.EchoMode.Password)
         layout.addRow("Benutzername:", self.username)
         layout.addRow("Passwort:", self.password)
-        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
-        buttons.accepted.connect(self.accept)
-        buttons.rejected.connect(self.reject)
-        layout.addWidget(buttons)
+        self.status_label = QLabel("")
+        layout.addRow(self.status_label)
+        self.buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        self.buttons.accepted.connect(self.start_login)
+        self.buttons.rejected.connect(self.reject)
+        layout.addWidget(self.buttons)
+        self.token = None
+        self.job = None
 
         self.register_btn = QPushButton("Registrieren")
         self.register_btn.clicked.connect(self.open_register)
@@ -35,15 +45,67 @@ class LoginDialog(QDialog):
         """
         return self.username.text(), self.password.text()
 
+    def start_login(self):
+        """
+        Startet die Prüfung der Zugangsdaten im Hintergrund; die Eingaben bleiben so lange gesperrt.
+        """
+        username, password = self.get_credentials()
+        if not username or not password:
+            self.status_label.setText("Bitte Benutzername und Passwort eingeben.")
+            return
+        self._set_busy(True)
+        self.status_label.setText("Anmeldung wird geprüft …")
+        self.job = start_job(login, username, password)
+        self.job.signals.finished.connect(self._on_login_finished)
+        self.job.signals.failed.connect(self._on_login_failed)
+
+    def _on_login_finished(self, token):
+        self.job = None
+        if token:
+            self.token = token
+            self.accept()
+            return
+        self._set_busy(False)
+        self.status_label.setText("Benutzername oder Passwort falsch.")
+        self.password.clear()
+        self.password.setFocus()
+
+    def _on_login_failed(self, exc):
+        self.job = None
+        self._set_busy(False)
+        self.status_label.setText(f"Anmeldung fehlgeschlagen: {exc}")
+
+    def _set_busy(self, busy):
+        for widget in (self.username, self.password, self.buttons, self.register_btn):
+            widget.setEnabled(not busy)
+
     def open_register(self):
         """
-        Öffnet den Registrierungsdialog und legt ggf. einen neuen Benutzer an.
+        Öffnet den Registrierungsdialog und legt ggf. einen neuen Benutzer im Hintergrund an.
+
+        Das Hashen des Passworts dauert wie beim Login absichtlich spürbar;
+        die Eingaben bleiben so lange gesperrt.
         """
         from logic.tasks_db import add_user
         dlg = RegisterDialog(self)
         if dlg.exec() == QDialog.DialogCode.Accepted:
             username, password = dlg.get_credentials()
-            if add_user(username, password):
-                QMessageBox.information(self, "Erfolg", "Benutzer wurde angelegt!")
-            else:
-                QMessageBox.warning(self, "Fehler", "Benutzername existiert bereits!")
\ No newline at end of file
+            self._set_busy(True)
+            self.status_label.setText("Benutzer wird angelegt …")
+            self.job = start_job(add_user, username, password)
+            self.job.signals.finished.connect(self._on_register_finished)
+            self.job.signals.failed.connect(self._on_register_failed)
+
+    def _on_register_finished(self, created):
+        self.job = None
+        self._set_busy(False)
+        self.status_label.setText("")
+        if created:
+            QMessageBox.information(self, "Erfolg", "Benutzer wurde angelegt!")
+        else:
+            QMessageBox.warning(self, "Fehler", "Benutzername existiert bereits!")
+
+    def _on_register_failed(self, exc):
+        self.job = None
+        self._set_busy(False)
+        self.status_label.setText(f"Registrierung fehlgeschlagen: {exc}")
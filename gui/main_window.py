@@ -1,28 +1,40 @@
 from PyQt6.QtWidgets import (
-    QWidget, QMainWindow, QPushButton, QHBoxLayout, QVBoxLayout,
+    QApplication, QWidget, QMainWindow, QPushButton, QHBoxLayout, QVBoxLayout,
     QStackedWidget, QSizePolicy
 )
 from PyQt6.QtGui import QIcon
-from PyQt6.QtCore import QSize
+from PyQt6.QtCore import Qt, QSize, QTimer
+from logic import perf
+from logic.task_store import get_task_store
 
-from gui.dashboard import DashboardPage
-from gui.tasks import TasksPage
-from gui.gantt import GanttPage
-from gui.reflection import ReflectionPage
-from gui.settings import SettingsPage, load_theme
+# Reihenfolge der Navigation; die Seiten werden erst beim ersten Aufruf gebaut.
+# "perf" (Debug-Seite) gibt es nur bei eingeschalteter Messung (PROJECTOS_PERF=1).
+PAGES = ("dashboard", "tasks", "gantt", "reflection", "settings", "perf")
+# Abstand, in dem Änderungen anderer Prozesse (z.B. logic.cli) übernommen werden
+SYNC_INTERVAL_MS = 5000
 
 class MainWindow(QMainWindow):
     """
     Hauptfenster der Anwendung mit Navigation und Seiten-Stack.
     """
-    def __init__(self):
+    def __init__(self, username="", session_token=None):
         """
-        Initialisiert das Hauptfenster mit Navigation und allen Seiten.
+        Initialisiert das Hauptfenster mit Navigation und der Dashboard-Seite.
+
+        Die übrigen Seiten (und damit z.B. matplotlib/pandas für das Gantt-Chart)
+        werden erst beim ersten Öffnen erzeugt bzw. importiert.
+
+        Args:
+            username (str): Angemeldeter Benutzer (für das Profil-Icon im Dashboard).
+            session_token (str, optional): Sitzung aus ``logic.auth.login`` (wird beim Abmelden beendet).
         """
         super().__init__()
+        # Nach dem Abmelden verschwindet das Fenster samt Seiten und Store-Verbindungen
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        self.username = username
+        self.session_token = session_token
         self.sidebar_buttons = []
-        self.settings_page = SettingsPage()
-        self.settings_page.theme_changed.connect(self.apply_theme)
+        self.pages = {}
 
         central_widget = QWidget(self)
         self.setCentralWidget(central_widget)
@@ -37,6 +49,8 @@ class MainWindow(QMainWindow):
             ("📝 Reflexion", self.show_reflection),
             ("⚙️ Einstellungen", self.show_settings),
         ]
+        if perf.enabled():
+            button_infos.append(("⏱ Leistung", self.show_perf))
         for text, slot in button_infos:
             btn = QPushButton(text)
             btn.setCheckable(True)
@@ -47,53 +61,106 @@ class MainWindow(QMainWindow):
         main_layout.addLayout(nav_layout)
 
         self.stack = QStackedWidget()
-        self.dashboard_page = DashboardPage()
-        self.tasks_page = TasksPage()
-        self.gantt_page = GanttPage()
-        self.reflection_page = ReflectionPage()
-        self.stack.addWidget(self.dashboard_page)
-        self.stack.addWidget(self.tasks_page)
-        self.stack.addWidget(self.gantt_page)
-        self.stack.addWidget(self.reflection_page)
-        self.stack.addWidget(self.settings_page)
         main_layout.addWidget(self.stack)
 
+        # Eine kleine Abfrage auf das Änderungsprotokoll, solange sich nichts ändert
+        self.sync_timer = QTimer(self)
+        self.sync_timer.setInterval(SYNC_INTERVAL_MS)
+        self.sync_timer.timeout.connect(get_task_store().sync)
+        self.sync_timer.start()
+
         self.show_dashboard()
 
+    def closeEvent(self, event):
+        """
+        Beendet den Abgleich mit dem Änderungsprotokoll und schreibt ungespeicherte
+        Reflexionen, bevor das Fenster (samt Seiten) geschlossen und gelöscht wird.
+        """
+        self.sync_timer.stop()
+        reflection = self.pages.get("reflection")
+        if reflection is not None:
+            # aboutToQuit käme zu spät: das Fenster ist dann schon gelöscht
+            reflection.autosave.flush_now()
+        super().closeEvent(event)
+
+    def _create_page(self, name):
+        """
+        Baut die Seite ``name``; die Module werden erst hier importiert.
+        """
+        if name == "dashboard":
+            from gui.dashboard import DashboardPage
+            return DashboardPage(self.username)
+        if name == "tasks":
+            from gui.tasks import TasksPage
+            return TasksPage()
+        if name == "gantt":
+            from gui.gantt import GanttPage
+            return GanttPage()
+        if name == "reflection":
+            from gui.reflection import ReflectionPage
+            return ReflectionPage()
+        if name == "settings":
+            from gui.settings import SettingsPage
+            page = SettingsPage()
+            page.theme_changed.connect(self.apply_theme)
+            return page
+        if name == "perf":
+            from gui.perf_page import PerfPage
+            return PerfPage()
+        raise ValueError(f"Unbekannte Seite: {name}")
+
+    def page(self, name):
+        """
+        Gibt die Seite ``name`` zurück und legt sie beim ersten Zugriff an.
+        """
+        page = self.pages.get(name)
+        if page is None:
+            page = self.pages[name] = self._create_page(name)
+            self.stack.addWidget(page)
+        return page
+
+    def _show_page(self, name):
+        """
+        Zeigt die Seite ``name`` an und markiert den Navigationsbutton.
+        """
+        self.stack.setCurrentWidget(self.page(name))
+        self._set_active_button(PAGES.index(name))
+
     def show_dashboard(self):
         """
         Zeigt die Dashboard-Seite an.
         """
-        self.stack.setCurrentIndex(0)
-        self._set_active_button(0)
+        self._show_page("dashboard")
 
     def show_tasks(self):
         """
         Zeigt die Aufgaben-Seite an.
         """
-        self.stack.setCurrentIndex(1)
-        self._set_active_button(1)
+        self._show_page("tasks")
 
     def show_gantt(self):
         """
         Zeigt die Gantt-Chart-Seite an.
         """
-        self.stack.setCurrentIndex(2)
-        self._set_active_button(2)
+        self._show_page("gantt")
 
     def show_reflection(self):
         """
         Zeigt die Reflexions-Seite an.
         """
-        self.stack.setCurrentIndex(3)
-        self._set_active_button(3)
+        self._show_page("reflection")
 
     def show_settings(self):
         """
         Zeigt die Einstellungen-Seite an.
         """
-        self.stack.setCurrentIndex(4)
-        self._set_active_button(4)
+        self._show_page("settings")
+
+    def show_perf(self):
+        """
+        Zeigt die Debug-Seite mit den Messwerten an.
+        """
+        self._show_page("perf")
 
     def _set_active_button(self, idx):
         """
@@ -126,3 +193,23 @@ class MainWindow(QMainWindow):
             """)
         for btn in self.sidebar_buttons:
             btn.setStyleSheet("")
+
+def show_main_window(username, session_token=None):
+    """
+    Erzeugt und zeigt das Hauptfenster.
+
+    Die Referenz hält die Anwendung (``QApplication.instance().main_window``);
+    ein neues Fenster nach dem Abmelden ersetzt also das alte, statt es am
+    Leben zu halten.
+
+    Args:
+        username (str): Angemeldeter Benutzer.
+        session_token (str, optional): Sitzung aus ``logic.auth.login``.
+
+    Returns:
+        MainWindow: Das neue Hauptfenster.
+    """
+    window = MainWindow(username, session_token)
+    QApplication.instance().main_window = window
+    window.show()
+    return window
@@ -0,0 +1,107 @@
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QCheckBox, QTableWidget, QTableWidgetItem,
+    QHeaderView, QFileDialog, QMessageBox
+)
+from PyQt6.QtCore import Qt, QTimer
+from logic import perf
+
+# Aktualisierungsintervall der Tabelle, solange die Seite sichtbar ist
+REFRESH_INTERVAL_MS = 1000
+COLUMNS = ("Messpunkt", "Aufrufe", "Ø ms", "p50 ms", "p95 ms", "Max ms", "SQL/Aufruf")
+
+class PerfPage(QWidget):
+    """
+    Debug-Seite mit den Messwerten aus ``logic.perf`` (Laufzeiten und SQL-Anweisungen).
+
+    Nur im Hauptfenster, wenn die Anwendung mit ``PROJECTOS_PERF=1`` gestartet
+    wurde. Die Tabelle wird nur aktualisiert, solange die Seite sichtbar ist.
+    """
+    def __init__(self):
+        super().__init__()
+        layout = QVBoxLayout(self)
+        title = QLabel("Leistung")
+        title.setStyleSheet("font-size: 22px; font-weight: bold; margin-bottom: 10px;")
+        layout.addWidget(title)
+
+        controls = QHBoxLayout()
+        self.enabled_check = QCheckBox("Messung aktiv")
+        self.enabled_check.setChecked(perf.enabled())
+        self.enabled_check.toggled.connect(self.set_enabled)
+        controls.addWidget(self.enabled_check)
+        reset_btn = QPushButton("Zurücksetzen")
+        reset_btn.clicked.connect(self.reset)
+        controls.addWidget(reset_btn)
+        dump_btn = QPushButton("Als JSON speichern")
+        dump_btn.clicked.connect(self.save_json)
+        controls.addWidget(dump_btn)
+        controls.addStretch()
+        layout.addLayout(controls)
+
+        self.summary_label = QLabel()
+        layout.addWidget(self.summary_label)
+
+        self.table = QTableWidget(0, len(COLUMNS))
+        self.table.setHorizontalHeaderLabels(COLUMNS)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.table)
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(REFRESH_INTERVAL_MS)
+        self.timer.timeout.connect(self.refresh)
+        self.refresh()
+
+    def showEvent(self, event):
+        self.refresh()
+        self.timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        """
+        Überträgt den aktuellen ``perf.snapshot()`` in die Tabelle (langsamste p95 zuerst).
+        """
+        data = perf.snapshot()
+        timings = sorted(data["timings"].items(), key=lambda item: item[1]["p95_ms"], reverse=True)
+        self.summary_label.setText(f"SQL-Anweisungen gesamt: {data['statements']}")
+        self.table.setRowCount(len(timings))
+        for row, (name, stats) in enumerate(timings):
+            values = (
+                name, stats["calls"], stats["mean_ms"], stats["p50_ms"], stats["p95_ms"], stats["max_ms"],
+                stats["statements"] / stats["calls"] if stats["calls"] else 0,
+            )
+            for col, value in enumerate(values):
+                text = value if isinstance(value, str) else (str(value) if isinstance(value, int) else f"{value:.2f}")
+                item = QTableWidgetItem(text)
+                if col:
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                self.table.setItem(row, col, item)
+
+    def set_enabled(self, checked):
+        """
+        Schaltet die Messung ein oder aus.
+        """
+        if checked:
+            perf.enable()
+        else:
+            perf.disable()
+
+    def reset(self):
+        """
+        Verwirft alle Messwerte.
+        """
+        perf.reset()
+        self.refresh()
+
+    def save_json(self):
+        """
+        Speichert die Messwerte als JSON-Datei.
+        """
+        filepath, _ = QFileDialog.getSaveFileName(self, "Messwerte speichern", "perf.json", "JSON-Dateien (*.json)")
+        if filepath:
+            perf.dump_json(filepath)
+            QMessageBox.information(self, "Leistung", f"Messwerte gespeichert: {filepath}")
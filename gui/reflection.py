@@ -1,58 +1,161 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QTextEdit, QPushButton, QMessageBox, QDateEdit, QHBoxLayout
-from PyQt6.QtCore import QDate
-import sqlite3
+from PyQt6.QtWidgets import (
+    QApplication, QWidget, QVBoxLayout, QLabel, QTextEdit, QPushButton, QDateEdit, QHBoxLayout,
+    QLineEdit, QComboBox, QListWidget, QListWidgetItem
+)
+from PyQt6.QtCore import Qt, QDate, QTime, QTimer, QObject, pyqtSignal
+# Die Datenbankfunktionen liegen in logic.reflection_db und werden hier für
+# bestehende Importe weiter angeboten.
+from logic.reflection_db import (
+    DB_PATH, init_reflection_db, save_reflection, save_reflections, load_reflection, get_reflections,
+    search_reflections
+)
+from logic.jobs import start_job
 
-DB_PATH = "reflection.db"
+# Wartezeit nach dem letzten Tastendruck, bevor gesucht wird
+SEARCH_DEBOUNCE_MS = 200
+# Wartezeit nach dem letzten Tastendruck, bevor automatisch gespeichert wird
+AUTOSAVE_DEBOUNCE_MS = 800
 
-def init_reflection_db():
+class ReflectionAutosave(QObject):
     """
-    Initialisiert die Datenbank für Reflexionen, falls sie noch nicht existiert.
-    """
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("""
-        CREATE TABLE IF NOT EXISTS reflections (
-            date TEXT PRIMARY KEY,
-            text TEXT
-        )
-    """)
-    conn.commit()
-    conn.close()
-
-def save_reflection(date, text):
-    """
-    Speichert oder aktualisiert eine Reflexion für ein bestimmtes Datum.
+    Sammelt Änderungen an Reflexionen und schreibt sie im Hintergrund.
 
-    Args:
-        date (str): Das Datum im Format 'YYYY-MM-DD'.
-        text (str): Der Reflexionstext.
+    ``mark_dirty()`` merkt sich pro Datum nur den neuesten Text und startet
+    den Debounce-Timer neu; erst nach einer Tipp-Pause wird geschrieben, und
+    zwar nur Einträge, die sich gegenüber dem zuletzt gespeicherten Stand
+    geändert haben. Es läuft höchstens ein Schreib-Job gleichzeitig, damit
+    ältere Stände nie neuere überschreiben. ``flush_now()`` schreibt synchron
+    (beim Beenden der Anwendung).
     """
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("REPLACE INTO reflections (date, text) VALUES (?, ?)", (date, text))
-    conn.commit()
-    conn.close()
+    saved = pyqtSignal(list)   # Daten der geschriebenen Einträge
+    failed = pyqtSignal(str)   # Fehlermeldung; die Einträge bleiben ungespeichert
+    state_changed = pyqtSignal()
+
+    def __init__(self, parent=None, debounce_ms=AUTOSAVE_DEBOUNCE_MS):
+        super().__init__(parent)
+        self._pending = {}    # Datum -> noch nicht geschriebener Text
+        self._writing = {}    # Datum -> Text, den der laufende Job schreibt
+        self._saved = {}      # Datum -> zuletzt gespeicherter/geladener Text
+        self._job = None
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(debounce_ms)
+        self.timer.timeout.connect(self.flush)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush_now)
+
+    def is_dirty(self):
+        """
+        True, solange Änderungen nicht in der Datenbank angekommen sind.
+        """
+        return bool(self._pending or self._writing)
+
+    def is_writing(self):
+        return self._job is not None
+
+    def remember(self, date, text):
+        """
+        Merkt sich den geladenen Stand eines Tages (Grundlage für den Vergleich).
+        """
+        self._saved[date] = text
+
+    def text_for(self, date):
+        """
+        Gibt den neuesten, evtl. noch nicht gespeicherten Text eines Tages zurück oder None.
+        """
+        if date in self._pending:
+            return self._pending[date]
+        return self._writing.get(date)
+
+    def mark_dirty(self, date, text):
+        """
+        Vermerkt eine Änderung und (re)startet den Debounce-Timer.
+        """
+        latest = self._writing.get(date, self._saved.get(date, ""))
+        if text == latest:
+            # Zurück auf den gespeicherten Stand: nichts zu schreiben
+            self._pending.pop(date, None)
+        else:
+            self._pending[date] = text
+        if self._pending:
+            self.timer.start()
+        else:
+            self.timer.stop()
+        self.state_changed.emit()
+
+    def flush(self):
+        """
+        Schreibt alle geänderten Einträge in einem Hintergrund-Job.
+        """
+        self.timer.stop()
+        if not self._pending or self._job is not None:
+            # Ein laufender Job stößt nach seinem Ende den nächsten an
+            return
+        self._writing, self._pending = self._pending, {}
+        job = self._job = start_job(save_reflections, list(self._writing.items()))
+        job.signals.finished.connect(lambda _: self._on_written(job))
+        job.signals.failed.connect(lambda exc: self._on_failed(job, exc))
+        self.state_changed.emit()
+
+    def flush_now(self):
+        """
+        Schreibt alle Änderungen sofort im aufrufenden Thread (z.B. beim Beenden).
+        """
+        self.timer.stop()
+        if self._job is not None:
+            self._job.wait()
+        entries = dict(self._writing)
+        entries.update(self._pending)
+        if entries:
+            save_reflections(list(entries.items()))
+            self._saved.update(entries)
+        self._pending, self._writing, self._job = {}, {}, None
+        self.state_changed.emit()
 
-def load_reflection(date):
+    def _on_written(self, job):
+        if job is not self._job:
+            return  # bereits durch flush_now() erledigt
+        dates = list(self._writing)
+        self._saved.update(self._writing)
+        self._writing, self._job = {}, None
+        self.saved.emit(dates)
+        self.state_changed.emit()
+        if self._pending:
+            self.flush()
+
+    def _on_failed(self, job, exc):
+        if job is not self._job:
+            return
+        # Neuere Änderungen haben Vorrang vor den fehlgeschlagenen
+        for date, text in self._writing.items():
+            self._pending.setdefault(date, text)
+        self._writing, self._job = {}, None
+        self.failed.emit(str(exc))
+        self.state_changed.emit()
+
+def timeline_range(date, period):
     """
-    Lädt die Reflexion für ein bestimmtes Datum.
+    Gibt den Zeitraum (Woche ab Montag bzw. Kalendermonat) um ``date`` zurück.
 
     Args:
-        date (str): Das Datum im Format 'YYYY-MM-DD'.
+        date (QDate): Gewähltes Datum.
+        period (str): "Woche" oder "Monat".
 
     Returns:
-        str: Der gespeicherte Reflexionstext oder ein leerer String.
+        tuple: (start, end) als 'YYYY-MM-DD'.
     """
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("SELECT text FROM reflections WHERE date=?", (date,))
-    row = c.fetchone()
-    conn.close()
-    return row[0] if row else ""
+    if period == "Woche":
+        start = date.addDays(1 - date.dayOfWeek())
+        end = start.addDays(6)
+    else:
+        start = QDate(date.year(), date.month(), 1)
+        end = start.addDays(date.daysInMonth() - 1)
+    return start.toString("yyyy-MM-dd"), end.toString("yyyy-MM-dd")
 
 class ReflectionPage(QWidget):
     """
-    Seite für das Reflexionstagebuch mit Datumsauswahl und Notizfeld.
+    Seite für das Reflexionstagebuch mit Datumsauswahl, Notizfeld, Zeitleiste und Suche.
     """
     def __init__(self):
         """
@@ -75,29 +178,155 @@ class ReflectionPage(QWidget):
         date_layout.addWidget(self.date_edit)
         layout.addLayout(date_layout)
 
+        content = QHBoxLayout()
+        editor = QVBoxLayout()
         self.text_edit = QTextEdit()
         self.text_edit.setPlaceholderText("Deine Notiz für das gewählte Datum ...")
-        layout.addWidget(self.text_edit)
+        self.text_edit.textChanged.connect(self._on_text_changed)
+        editor.addWidget(self.text_edit)
 
-        save_btn = QPushButton("Speichern")
+        # Gespeichert wird automatisch; der Knopf schreibt nur sofort statt nach der Tipp-Pause
+        save_row = QHBoxLayout()
+        self.status_label = QLabel("")
+        self.status_label.setStyleSheet("color: gray;")
+        save_row.addWidget(self.status_label, 1)
+        save_btn = QPushButton("Jetzt speichern")
         save_btn.clicked.connect(self.save_note)
-        layout.addWidget(save_btn)
+        save_row.addWidget(save_btn)
+        editor.addLayout(save_row)
+        content.addLayout(editor, 2)
+
+        self.autosave = ReflectionAutosave(self)
+        self.autosave.saved.connect(self._on_saved)
+        self.autosave.failed.connect(self._on_save_failed)
+        self.autosave.state_changed.connect(self._update_status)
 
+        # Zeitleiste: alle Einträge der Woche/des Monats bzw. die Suchtreffer
+        side = QVBoxLayout()
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Reflexionen durchsuchen ...")
+        self.search_input.setClearButtonEnabled(True)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.refresh_timeline)
+        self.search_input.textChanged.connect(self.search_timer.start)
+        side.addWidget(self.search_input)
+        self.period_combo = QComboBox()
+        self.period_combo.addItems(["Woche", "Monat"])
+        self.period_combo.setCurrentText("Monat")
+        self.period_combo.currentTextChanged.connect(self.refresh_timeline)
+        side.addWidget(self.period_combo)
+        self.timeline = QListWidget()
+        self.timeline.setWordWrap(True)
+        self.timeline.itemClicked.connect(self._open_entry)
+        side.addWidget(self.timeline)
+        content.addLayout(side, 1)
+        layout.addLayout(content)
+
+        self._timeline_range = None
+        self._date = None
+        self._loading = False
+        self._saved_at = None
+        self._save_error = None
         self.load_note()
 
+    def current_date(self):
+        """
+        Gibt das gewählte Datum als 'YYYY-MM-DD' zurück.
+        """
+        return self.date_edit.date().toString("yyyy-MM-dd")
+
     def load_note(self):
         """
         Lädt die Notiz für das aktuell gewählte Datum und zeigt sie an.
+
+        Änderungen am bisherigen Datum werden vorher in den Hintergrund-Job
+        gegeben; noch nicht geschriebene Texte kommen aus dem Autosave statt
+        aus der Datenbank.
         """
-        date = self.date_edit.date().toString("yyyy-MM-dd")
-        note = load_reflection(date)
-        self.text_edit.setText(note if note else "")
+        self.autosave.flush()
+        self._date = self.current_date()
+        note = self.autosave.text_for(self._date)
+        if note is None:
+            note = load_reflection(self._date)
+            self.autosave.remember(self._date, note)
+        self._loading = True
+        try:
+            self.text_edit.setPlainText(note)
+        finally:
+            self._loading = False
+        # Nur neu laden, wenn das Datum den Zeitraum der Zeitleiste verlässt
+        if timeline_range(self.date_edit.date(), self.period_combo.currentText()) != self._timeline_range:
+            self.refresh_timeline()
 
     def save_note(self):
         """
-        Speichert die aktuelle Notiz für das gewählte Datum.
+        Speichert ausstehende Änderungen sofort (im Hintergrund, ohne auf die Tipp-Pause zu warten).
+        """
+        self.autosave.flush()
+
+    def _on_text_changed(self):
+        if not self._loading:
+            self.autosave.mark_dirty(self._date, self.text_edit.toPlainText())
+
+    def _on_saved(self, dates):
+        """
+        Aktualisiert die Zeitleiste, falls ein gespeicherter Tag darin vorkommt.
+        """
+        if self.search_input.text().strip():
+            self.refresh_timeline()
+        elif self._timeline_range and any(self._timeline_range[0] <= d <= self._timeline_range[1] for d in dates):
+            self.refresh_timeline()
+        self._save_error = None
+        self._saved_at = QTime.currentTime().toString("HH:mm:ss")
+
+    def _on_save_failed(self, message):
+        self._save_error = message
+
+    def _update_status(self):
+        """
+        Zeigt den Speicherzustand an, ohne den Nutzer mit einem Dialog zu unterbrechen.
+        """
+        if self.autosave.is_writing():
+            text = "Speichert …"
+        elif self._save_error:
+            text = f"Speichern fehlgeschlagen: {self._save_error}"
+        elif self.autosave.is_dirty():
+            text = "Ungespeicherte Änderungen"
+        elif self._saved_at:
+            text = f"Gespeichert {self._saved_at}"
+        else:
+            text = ""
+        self.status_label.setText(text)
+
+    def refresh_timeline(self, *_):
+        """
+        Füllt die Zeitleiste mit einer Abfrage: Suchtreffer oder alle Einträge des Zeitraums.
+        """
+        self.search_timer.stop()
+        self.timeline.clear()
+        query = self.search_input.text().strip()
+        if query:
+            self._timeline_range = None
+            entries = [(date, snippet) for date, _, snippet in search_reflections(query)]
+        else:
+            self._timeline_range = timeline_range(self.date_edit.date(), self.period_combo.currentText())
+            entries = get_reflections(*self._timeline_range)
+        for date, text in entries:
+            preview = " ".join(text.split())
+            if len(preview) > 80:
+                preview = preview[:79] + "…"
+            item = QListWidgetItem(f"{date}\n{preview}")
+            item.setData(Qt.ItemDataRole.UserRole, date)
+            self.timeline.addItem(item)
+        if not entries:
+            self.timeline.addItem("Keine Treffer." if query else "Keine Einträge in diesem Zeitraum.")
+
+    def _open_entry(self, item):
+        """
+        Springt zum Datum des angeklickten Eintrags.
         """
-        date = self.date_edit.date().toString("yyyy-MM-dd")
-        text = self.text_edit.toPlainText()
-        save_reflection(date, text)
-        QMessageBox.information(self, "Gespeichert", "Deine Notiz wurde gespeichert!")
+        date = item.data(Qt.ItemDataRole.UserRole)
+        if date:
+            self.date_edit.setDate(QDate.fromString(date, "yyyy-MM-dd"))
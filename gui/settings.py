@@ -1,8 +1,12 @@
 import json
 import os
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QFileDialog, QMessageBox, QComboBox
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QLabel, QPushButton, QFileDialog, QMessageBox, QComboBox, QProgressDialog
+)
+from PyQt6.QtCore import Qt, pyqtSignal
 from logic.tasks_db import export_tasks_to_csv, import_tasks_from_csv, export_tasks_to_pdf
+from logic.task_store import get_task_store
+from logic.jobs import start_job
 
 SETTINGS_PATH = "settings.json"
 
@@ -95,40 +99,94 @@ class SettingsPage(QWidget):
         layout.addWidget(QLabel("Sprache:"))
         layout.addWidget(self.language_combo)
 
+    def _start_job(self, title, label, func, *args, on_finished, on_progress=None, maximum=0, cancelled_text=None):
+        """
+        Startet ``func`` im Hintergrund und zeigt solange einen Fortschrittsdialog.
+
+        "Abbrechen" bricht den Job beim nächsten Fortschritts-Callback ab; die
+        Oberfläche bleibt währenddessen bedienbar.
+
+        Args:
+            title (str): Fenstertitel des Dialogs und der Meldungen.
+            label (str): Anfangstext im Dialog.
+            func (callable): Synchrone Funktion mit ``progress``-Parameter.
+            on_finished (callable): Erhält das Ergebnis von ``func``.
+            on_progress (callable, optional): Erhält Dialog und Fortschrittswerte.
+            maximum (int): Maximum der Fortschrittsanzeige (0 = unbestimmt).
+            cancelled_text (str, optional): Meldung nach einem Abbruch.
+
+        Returns:
+            Job: Der gestartete Job.
+        """
+        dlg = QProgressDialog(label, "Abbrechen", 0, maximum, self)
+        dlg.setWindowTitle(title)
+        dlg.setWindowModality(Qt.WindowModality.WindowModal)
+        dlg.setMinimumDuration(300)
+        dlg.setAutoClose(False)
+        dlg.setAutoReset(False)
+        job = start_job(func, *args, report_progress=True)
+        dlg.canceled.connect(job.cancel)
+        if on_progress is not None:
+            job.signals.progress.connect(lambda values: on_progress(dlg, *values))
+        job.signals.finished.connect(on_finished)
+        job.signals.cancelled.connect(
+            lambda: QMessageBox.information(self, title, cancelled_text or f"{title} abgebrochen.")
+        )
+        job.signals.failed.connect(lambda exc: QMessageBox.critical(self, title, f"Fehler: {exc}"))
+        job.signals.done.connect(dlg.close)
+        self.job = job
+        return job
+
     def export_csv(self):
         """
-        Exportiert Aufgaben als CSV-Datei.
+        Exportiert Aufgaben als CSV-Datei (im Hintergrund).
         """
-        path, _ = QFileDialog.getSaveFileName(self, "CSV speichern", "tasks_export.csv", "CSV-Dateien (*.csv)")
+        path, _ = QFileDialog.getSaveFileName(
+            self, "CSV speichern", "tasks_export.csv", "CSV-Dateien (*.csv);;Komprimierte CSV-Dateien (*.csv.gz)"
+        )
         if path:
-            export_tasks_to_csv(path)
-            QMessageBox.information(self, "Export", "Aufgaben wurden exportiert!")
+            self._start_job(
+                "Export", "Aufgaben werden exportiert ...", export_tasks_to_csv, path,
+                on_progress=lambda dlg, rows: dlg.setLabelText(f"{rows} Aufgaben geschrieben ..."),
+                on_finished=lambda count: QMessageBox.information(
+                    self, "Export", f"{count} Aufgaben wurden exportiert!"
+                ),
+            )
 
     def import_csv(self):
         """
-        Importiert Aufgaben aus einer CSV-Datei.
+        Importiert Aufgaben aus einer CSV-Datei im Hintergrund mit Fortschrittsanzeige.
         """
         path, _ = QFileDialog.getOpenFileName(self, "CSV auswählen", "", "CSV-Dateien (*.csv)")
         if path:
-            import_tasks_from_csv(path)
-            QMessageBox.information(self, "Import", "Aufgaben wurden importiert!")
-            main_window = self.window()
-            if hasattr(main_window, "stack"):
-                tasks_page = main_window.stack.widget(1)
-                if hasattr(tasks_page, "refresh"):
-                    tasks_page.refresh()
-                gantt_page = main_window.stack.widget(2)
-                if hasattr(gantt_page, "plot_gantt"):
-                    gantt_page.plot_gantt()
+            def on_progress(dlg, rows, bytes_read, bytes_total):
+                dlg.setValue(int(bytes_read * 100 / bytes_total) if bytes_total else 100)
+                dlg.setLabelText(f"{rows} Aufgaben gelesen ...")
+
+            def on_finished(count):
+                # Nur die neuen Zeilen übernehmen; Kanban, Gantt & Co. hören auf den Store
+                get_task_store().sync()
+                QMessageBox.information(self, "Import", f"{count} Aufgaben wurden importiert!")
+
+            self._start_job(
+                "Import", "Aufgaben werden importiert ...", import_tasks_from_csv, path,
+                on_progress=on_progress, on_finished=on_finished, maximum=100,
+                cancelled_text="Import abgebrochen, es wurden keine Aufgaben übernommen.",
+            )
 
     def export_pdf(self):
         """
-        Exportiert Aufgaben als PDF-Datei.
+        Exportiert Aufgaben als PDF-Datei (im Hintergrund).
         """
         path, _ = QFileDialog.getSaveFileName(self, "PDF speichern", "tasks_export.pdf", "PDF-Dateien (*.pdf)")
         if path:
-            export_tasks_to_pdf(path)
-            QMessageBox.information(self, "Export", "Aufgaben wurden als PDF exportiert!")
+            self._start_job(
+                "PDF-Export", "PDF wird erstellt ...", export_tasks_to_pdf, path,
+                on_progress=lambda dlg, rows, pages: dlg.setLabelText(f"{rows} Aufgaben, {pages} Seiten ..."),
+                on_finished=lambda stats: QMessageBox.information(
+                    self, "Export", f"{stats['rows']} Aufgaben wurden als PDF exportiert ({stats['pages']} Seiten)!"
+                ),
+            )
 
     def change_theme(self, theme):
         """
@@ -142,7 +200,7 @@ class SettingsPage(QWidget):
                 QPushButton { background: #e0e0e0; color: #222; border: none; padding: 8px; border-radius: 6px; }
                 QPushButton:hover { background: #bdbdbd; }
                 QLineEdit { background: #fff; color: #222; border-radius: 5px; padding: 5px; }
-                QListWidget { background: #fff; color: #222; border-radius: 8px; }
+                QListView { background: #fff; color: #222; border-radius: 8px; }
             """)
         elif theme == "Blau":
             mw.setStyleSheet("""
@@ -151,7 +209,7 @@ class SettingsPage(QWidget):
                 QPushButton { background: #007bff; color: #fff; border: none; padding: 8px; border-radius: 6px; }
                 QPushButton:hover { background: #0056b3; }
                 QLineEdit { background: #003366; color: #fff; border-radius: 5px; padding: 5px; }
-                QListWidget { background: #003366; color: #fff; border-radius: 8px; }
+                QListView { background: #003366; color: #fff; border-radius: 8px; }
             """)
         else:
             mw.setStyleSheet("""
@@ -160,7 +218,7 @@ class SettingsPage(QWidget):
                 QPushButton { background: #23272e; color: #fff; border: none; padding: 8px; border-radius: 6px; }
                 QPushButton:hover { background: #3b3f4a; }
                 QLineEdit { background: #2c313c; color: #fff; border-radius: 5px; padding: 5px; }
-                QListWidget { background: #2c313c; color: #fff; border-radius: 8px; }
+                QListView { background: #2c313c; color: #fff; border-radius: 8px; }
             """)
         save_theme(theme)
 
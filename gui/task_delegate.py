@@ -0,0 +1,239 @@
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyle
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPixmap, QPen
+from PyQt6.QtCore import Qt, QDate, QRect, QRectF, QSize
+from gui.task_model import TASK_ROLE
+
+# Farben der Karten auf dem dunklen Board
+CARD_COLOR = QColor("#353b48")
+CARD_SELECTED_COLOR = QColor("#3f4756")
+SELECTION_COLOR = QColor("#3b82f6")
+TITLE_COLOR = QColor("#ffffff")
+DETAIL_COLOR = QColor("#a0a8b8")
+STATUS_COLORS = {
+    "To Do": QColor("#64748b"),
+    "In Progress": QColor("#f59e0b"),
+    "Done": QColor("#22c55e"),
+}
+# Fälligkeits-Badge: (Hintergrund, Text)
+BADGE_COLORS = {
+    "overdue": (QColor("#dc2626"), QColor("#ffffff")),
+    "soon": (QColor("#f59e0b"), QColor("#1f2937")),
+    "later": (QColor("#475569"), QColor("#e2e8f0")),
+    "done": (QColor("#166534"), QColor("#dcfce7")),
+}
+# Ab so vielen Tagen bis zur Fälligkeit ist eine Aufgabe nicht mehr "bald" fällig
+SOON_DAYS = 2
+
+MARGIN = 4      # Abstand zwischen den Karten
+PADDING = 10    # Innenabstand der Karte
+SPACING = 3     # Abstand zwischen den Zeilen
+RADIUS = 8
+ACCENT_WIDTH = 4
+BADGE_PADDING = 6
+# Obergrenze der Caches; bei Überlauf wird einfach geleert
+ELIDE_CACHE_SIZE = 4096
+PIXMAP_CACHE_SIZE = 64
+
+def due_badge(task, today):
+    """
+    Bestimmt Text und Art des Fälligkeits-Badges einer Aufgabe.
+
+    Args:
+        task (tuple): Aufgaben-Tupel.
+        today (str): Heutiges Datum als 'YYYY-MM-DD'.
+
+    Returns:
+        tuple: (text, art) mit art aus ``BADGE_COLORS`` oder None ohne Fälligkeit.
+    """
+    due_date = task[3]
+    if not due_date:
+        return None
+    if task[2] == "Done":
+        return "erledigt", "done"
+    if due_date < today:
+        return "überfällig", "overdue"
+    if due_date == today:
+        return "heute fällig", "soon"
+    days = QDate.fromString(today, "yyyy-MM-dd").daysTo(QDate.fromString(due_date, "yyyy-MM-dd"))
+    if 0 < days <= SOON_DAYS:
+        return f"in {days} T. fällig", "soon"
+    return f"fällig {due_date}", "later"
+
+def date_line(task):
+    """
+    Gibt die Datumszeile einer Karte zurück (Zeitraum bzw. nur Start oder Ende).
+    """
+    _, _, _, _, start_date, end_date, _ = task
+    if start_date and end_date:
+        return f"{start_date} → {end_date}"
+    if start_date:
+        return f"ab {start_date}"
+    if end_date:
+        return f"bis {end_date}"
+    return "Kein Zeitraum"
+
+class TaskCardDelegate(QStyledItemDelegate):
+    """
+    Zeichnet Aufgaben als Karten (Titel, Zeitraum, Fälligkeits-Badge, Beschreibungsanfang).
+
+    Statt eines Widgets oder Stylesheets pro Aufgabe wird jede sichtbare Zeile
+    direkt mit QPainter gemalt. Schriften und Metriken werden einmal
+    angelegt; gekürzte Texte, Kartenhintergründe und Badges landen in
+    Caches, sodass beim Scrollen pro Karte nur ein paar ``drawPixmap`` und
+    ``drawText`` anfallen. Alle Karten sind gleich hoch (``setUniformItemSizes``).
+    """
+    def __init__(self, parent=None, font=None):
+        """
+        Args:
+            parent (QObject, optional): Besitzer, meist die Listenansicht.
+            font (QFont, optional): Grundschrift; Standard: Schrift des Parents.
+        """
+        super().__init__(parent)
+        base = QFont(font if font is not None else (parent.font() if parent is not None else QFont()))
+        self.title_font = QFont(base)
+        self.title_font.setBold(True)
+        self.title_font.setPointSizeF(base.pointSizeF() + 1)
+        self.detail_font = QFont(base)
+        self.detail_font.setPointSizeF(max(base.pointSizeF() - 1, 7))
+        self.badge_font = QFont(self.detail_font)
+        self.badge_font.setBold(True)
+        self.title_metrics = QFontMetrics(self.title_font)
+        self.detail_metrics = QFontMetrics(self.detail_font)
+        self.badge_metrics = QFontMetrics(self.badge_font)
+        self.card_height = (
+            2 * PADDING + self.title_metrics.height() + 2 * (SPACING + self.detail_metrics.height())
+        )
+        self._elided = {}
+        self._pixmaps = {}
+        self._today_day = None
+        self._today = ""
+
+    def today(self):
+        """
+        Heutiges Datum als 'YYYY-MM-DD' (nach Mitternacht automatisch neu).
+        """
+        date = QDate.currentDate()
+        if date.toJulianDay() != self._today_day:
+            self._today_day = date.toJulianDay()
+            self._today = date.toString("yyyy-MM-dd")
+        return self._today
+
+    def sizeHint(self, option, index):
+        # Breite 0: die Karte nimmt die Breite der Spalte an, statt sie zu verbreitern
+        return QSize(0, self.card_height + 2 * MARGIN)
+
+    def elide(self, text, metrics, width):
+        """
+        Kürzt ``text`` auf ``width`` Pixel (mit Cache, da ``elidedText`` teuer ist).
+        """
+        key = (text, id(metrics), width)
+        result = self._elided.get(key)
+        if result is None:
+            if len(self._elided) >= ELIDE_CACHE_SIZE:
+                self._elided.clear()
+            result = self._elided[key] = metrics.elidedText(text, Qt.TextElideMode.ElideRight, width)
+        return result
+
+    def _cached_pixmap(self, key, size, dpr, draw):
+        """
+        Gibt eine gecachte Pixmap zurück; ``draw(painter, rect)`` malt sie beim ersten Mal.
+        """
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            if len(self._pixmaps) >= PIXMAP_CACHE_SIZE:
+                self._pixmaps.clear()
+            pixmap = QPixmap(int(size.width() * dpr), int(size.height() * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            draw(painter, QRectF(0, 0, size.width(), size.height()))
+            painter.end()
+            self._pixmaps[key] = pixmap
+        return pixmap
+
+    def card_pixmap(self, size, status, selected, dpr):
+        """
+        Kartenhintergrund mit Statusleiste und ggf. Auswahlrahmen.
+        """
+        def draw(painter, rect):
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(CARD_SELECTED_COLOR if selected else CARD_COLOR)
+            painter.drawRoundedRect(rect.adjusted(0.5, 0.5, -0.5, -0.5), RADIUS, RADIUS)
+            painter.setBrush(STATUS_COLORS.get(status, DETAIL_COLOR))
+            painter.setClipRect(QRectF(0, 0, ACCENT_WIDTH, rect.height()))
+            painter.drawRoundedRect(rect.adjusted(0.5, 0.5, -0.5, -0.5), RADIUS, RADIUS)
+            painter.setClipping(False)
+            if selected:
+                painter.setBrush(Qt.BrushStyle.NoBrush)
+                painter.setPen(QPen(SELECTION_COLOR, 2))
+                painter.drawRoundedRect(rect.adjusted(1, 1, -1, -1), RADIUS, RADIUS)
+        return self._cached_pixmap(("card", size.width(), size.height(), status, selected, dpr), size, dpr, draw)
+
+    def badge_pixmap(self, text, kind, dpr):
+        """
+        Abgerundetes Fälligkeits-Badge.
+        """
+        size = QSize(self.badge_metrics.horizontalAdvance(text) + 2 * BADGE_PADDING, self.badge_metrics.height() + 2)
+        background, foreground = BADGE_COLORS[kind]
+
+        def draw(painter, rect):
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(background)
+            painter.drawRoundedRect(rect, rect.height() / 2, rect.height() / 2)
+            painter.setFont(self.badge_font)
+            painter.setPen(foreground)
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+        return self._cached_pixmap(("badge", text, kind, dpr), size, dpr, draw)
+
+    def paint(self, painter, option, index):
+        task = index.data(TASK_ROLE)
+        if task is None:
+            return
+        painter.save()
+        dpr = painter.device().devicePixelRatioF()
+        card = option.rect.adjusted(MARGIN, MARGIN, -MARGIN, -MARGIN)
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        painter.drawPixmap(card.topLeft(), self.card_pixmap(card.size(), task[2], selected, dpr))
+
+        left = card.left() + ACCENT_WIDTH + PADDING
+        right = card.right() - PADDING
+        y = card.top() + PADDING
+
+        badge = due_badge(task, self.today())
+        title_right = right
+        if badge is not None:
+            pixmap = self.badge_pixmap(*badge, dpr)
+            badge_width = round(pixmap.width() / dpr)
+            badge_y = y + (self.title_metrics.height() - round(pixmap.height() / dpr)) // 2
+            painter.drawPixmap(right - badge_width + 1, badge_y, pixmap)
+            title_right = right - badge_width - PADDING
+
+        painter.setFont(self.title_font)
+        painter.setPen(TITLE_COLOR)
+        width = max(title_right - left, 0)
+        painter.drawText(
+            QRect(left, y, width, self.title_metrics.height()),
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            self.elide(task[1], self.title_metrics, width),
+        )
+        y += self.title_metrics.height() + SPACING
+
+        painter.setFont(self.detail_font)
+        painter.setPen(DETAIL_COLOR)
+        width = max(right - left, 0)
+        line_height = self.detail_metrics.height()
+        painter.drawText(
+            QRect(left, y, width, line_height), Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            self.elide(date_line(task), self.detail_metrics, width),
+        )
+        description = task[6]
+        if description:
+            y += line_height + SPACING
+            # Nur der Anfang: Zeilenumbrüche und lange Texte nicht komplett verarbeiten
+            snippet = " ".join(description[:300].split())
+            painter.drawText(
+                QRect(left, y, width, line_height), Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                self.elide(snippet, self.detail_metrics, width),
+            )
+        painter.restore()
@@ -0,0 +1,235 @@
+from bisect import bisect_left
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QMimeData
+from logic.task_store import task_sort_key
+from logic.tasks_db import TASK_PAGE_SIZE, task_page_key
+
+TASK_ID_ROLE = Qt.ItemDataRole.UserRole
+TASK_ROLE = Qt.ItemDataRole.UserRole + 1
+TASK_MIME_TYPE = "application/x-projectos-task-ids"
+
+def format_task_text(task):
+    """
+    Gibt den Anzeigetext einer Aufgabe zurück (Titel plus Zeitraum bzw. Fälligkeit).
+    """
+    _, title, _, due_date, start_date, end_date, _ = task
+    text = f"{title}"
+    if start_date and end_date:
+        text += f" ({start_date} → {end_date})"
+    elif due_date:
+        text += f" (fällig: {due_date})"
+    return text
+
+def encode_task_ids(task_ids):
+    """
+    Verpackt Aufgaben-IDs als MIME-Daten für Drag & Drop.
+    """
+    mime = QMimeData()
+    mime.setData(TASK_MIME_TYPE, ",".join(str(i) for i in task_ids).encode("ascii"))
+    return mime
+
+def decode_task_ids(mime):
+    """
+    Liest die Aufgaben-IDs aus MIME-Daten (leere Liste bei fremden Daten).
+    """
+    if not mime.hasFormat(TASK_MIME_TYPE):
+        return []
+    raw = bytes(mime.data(TASK_MIME_TYPE)).decode("ascii")
+    return [int(i) for i in raw.split(",") if i]
+
+class TaskListModel(QAbstractListModel):
+    """
+    Listenmodell für die Aufgaben einer Kanban-Spalte.
+
+    Die Zeilen bleiben nach Fälligkeit sortiert. Einzelne Änderungen lösen
+    gezielte Signale aus (``rowsInserted``, ``rowsRemoved``, ``rowsMoved``,
+    ``dataChanged``) statt die ganze Spalte neu aufzubauen.
+
+    Mit ``set_source()`` lädt das Modell seitenweise: zunächst nur eine
+    Seite, weitere holt die Ansicht beim Scrollen über ``fetchMore()``.
+    Solange nicht alles geladen ist, übernehmen Einzeländerungen nur
+    Aufgaben bis zur zuletzt geladenen Zeile; spätere kommen mit ihrer Seite.
+    """
+    def __init__(self, status, parent=None):
+        """
+        Args:
+            status (str): Status der Spalte ("To Do", "In Progress", "Done").
+        """
+        super().__init__(parent)
+        self.status = status
+        self._tasks = []
+        self._keys = []
+        self._by_id = {}
+        self._fetch_page = None
+        self._page_size = TASK_PAGE_SIZE
+        self._more = False
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._tasks)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        # Indizes können nach einem Reset veraltet sein (z.B. nach einem Kontextmenü)
+        if not index.isValid() or not 0 <= index.row() < len(self._tasks):
+            return None
+        task = self._tasks[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return format_task_text(task)
+        if role == TASK_ID_ROLE:
+            return task[0]
+        if role == TASK_ROLE:
+            # Farben, Badges usw. zeichnet TaskCardDelegate aus dem Tupel
+            return task
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.ItemIsDropEnabled
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsDragEnabled
+
+    def supportedDragActions(self):
+        return Qt.DropAction.MoveAction
+
+    def supportedDropActions(self):
+        return Qt.DropAction.MoveAction
+
+    def mimeTypes(self):
+        return [TASK_MIME_TYPE]
+
+    def mimeData(self, indexes):
+        return encode_task_ids(
+            self._tasks[i.row()][0] for i in indexes if i.isValid() and 0 <= i.row() < len(self._tasks)
+        )
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        # Nach einem Drag entfernt Qt die Quellzeilen; das erledigt hier bereits
+        # TasksPage über remove_task(), daher nichts tun.
+        return False
+
+    def task(self, task_id):
+        """
+        Gibt die Aufgabe mit ``task_id`` zurück oder None, falls nicht in dieser Spalte.
+        """
+        return self._by_id.get(task_id)
+
+    def row_of(self, task_id):
+        """
+        Gibt die Zeile der Aufgabe zurück (binäre Suche) oder -1.
+        """
+        task = self._by_id.get(task_id)
+        if task is None:
+            return -1
+        return bisect_left(self._keys, task_sort_key(task))
+
+    def set_tasks(self, tasks):
+        """
+        Ersetzt alle Zeilen (für Filterwechsel); ``tasks`` ist bereits sortiert und vollständig.
+        """
+        self.beginResetModel()
+        self._fetch_page = None
+        self._more = False
+        self._tasks = list(tasks)
+        self._keys = [task_sort_key(t) for t in self._tasks]
+        self._by_id = {t[0]: t for t in self._tasks}
+        self.endResetModel()
+
+    def set_source(self, fetch_page, page_size=TASK_PAGE_SIZE):
+        """
+        Ersetzt alle Zeilen durch die erste Seite von ``fetch_page``.
+
+        Args:
+            fetch_page (callable): ``fetch_page(after, limit)`` liefert bis zu ``limit``
+                Aufgaben nach dem Keyset-Schlüssel ``after`` (None: von vorn),
+                z.B. ``logic.tasks_db.query_task_page``.
+            page_size (int): Zeilen pro Seite.
+        """
+        self._page_size = page_size
+        self.set_tasks(fetch_page(None, page_size))
+        self._fetch_page = fetch_page
+        self._more = len(self._tasks) >= page_size
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._more
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or not self._more:
+            return
+        after = task_page_key(self._tasks[-1]) if self._tasks else None
+        tasks = self._fetch_page(after, self._page_size)
+        self._more = len(tasks) >= self._page_size
+        if not tasks:
+            return
+        row = len(self._tasks)
+        self.beginInsertRows(QModelIndex(), row, row + len(tasks) - 1)
+        self._tasks.extend(tasks)
+        self._keys.extend(task_sort_key(t) for t in tasks)
+        self._by_id.update((t[0], t) for t in tasks)
+        self.endInsertRows()
+
+    def _beyond_loaded(self, key):
+        """
+        True, falls eine Zeile mit ``key`` erst mit einer späteren Seite geladen würde.
+        """
+        return self._more and (not self._keys or key > self._keys[-1])
+
+    def insert_task(self, task):
+        """
+        Fügt eine Aufgabe an der sortierten Position ein (nicht hinter der zuletzt geladenen Seite).
+        """
+        key = task_sort_key(task)
+        if self._beyond_loaded(key):
+            return
+        row = bisect_left(self._keys, key)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._tasks.insert(row, task)
+        self._keys.insert(row, key)
+        self._by_id[task[0]] = task
+        self.endInsertRows()
+
+    def remove_task(self, task_id):
+        """
+        Entfernt eine Aufgabe.
+
+        Returns:
+            bool: True, falls die Aufgabe in dieser Spalte war.
+        """
+        row = self.row_of(task_id)
+        if row < 0:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._tasks[row]
+        del self._keys[row]
+        del self._by_id[task_id]
+        self.endRemoveRows()
+        return True
+
+    def update_task(self, task):
+        """
+        Aktualisiert eine vorhandene Aufgabe oder fügt sie ein.
+
+        Bleibt die Sortierposition gleich, wird nur ``dataChanged`` gesendet,
+        sonst wird die Zeile mit ``beginMoveRows`` verschoben.
+        """
+        old = self.row_of(task[0])
+        if old < 0:
+            self.insert_task(task)
+            return
+        key = task_sort_key(task)
+        if self._beyond_loaded(key):
+            # Rutscht hinter die geladenen Zeilen und kommt mit einer späteren Seite wieder
+            self.remove_task(task[0])
+            return
+        # Position in der Liste vor dem Entfernen der alten Zeile (= Qt-Zielindex)
+        dest = bisect_left(self._keys, key)
+        new = dest - 1 if dest > old else dest
+        self._by_id[task[0]] = task
+        if new == old:
+            self._tasks[old] = task
+            self._keys[old] = key
+            index = self.index(old)
+            self.dataChanged.emit(index, index)
+            return
+        self.beginMoveRows(QModelIndex(), old, old, QModelIndex(), dest)
+        del self._tasks[old]
+        del self._keys[old]
+        self._tasks.insert(new, task)
+        self._keys.insert(new, key)
+        self.endMoveRows()
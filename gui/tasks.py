@@ -1,8 +1,17 @@
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QListWidget, QListWidgetItem, QLineEdit, QDateEdit, QDialog, QDialogButtonBox, QFormLayout, QComboBox, QTextEdit
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QListView, QAbstractItemView, QLineEdit, QDateEdit, QDialog, QDialogButtonBox, QFormLayout, QComboBox, QTextEdit
 )
-from PyQt6.QtCore import Qt, QDate
-from logic.tasks_db import get_tasks, add_task, update_task_status, delete_task, edit_task
+from PyQt6.QtCore import Qt, QDate, QTimer
+from logic import perf
+from logic.tasks_db import query_task_page, search_tasks
+from logic.task_store import get_task_store, task_sort_key
+from gui.task_model import TaskListModel, TASK_ID_ROLE, TASK_ROLE, decode_task_ids
+from gui.task_delegate import TaskCardDelegate
+
+# Wartezeit nach dem letzten Tastendruck, bevor gesucht wird
+SEARCH_DEBOUNCE_MS = 200
+# Maximale Anzahl Suchtreffer auf dem Board
+SEARCH_LIMIT = 200
 
 class DateDialog(QDialog):
     """
@@ -112,6 +121,19 @@ class TasksPage(QWidget):
         input_layout.addWidget(add_btn)
         layout.addLayout(input_layout)
 
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Suchen (Titel, Beschreibung) ...")
+        self.search_input.setClearButtonEnabled(True)
+        self.search_input.setStyleSheet("background: #2c313c; color: #fff; border-radius: 5px; padding: 5px;")
+        # Erst suchen, wenn kurz nicht getippt wurde, statt bei jedem Zeichen
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.refresh)
+        self.search_input.textChanged.connect(self.search_timer.start)
+        layout.addWidget(self.search_input)
+        self._search_ids = None
+
         self.filter_combo = QComboBox()
         self.filter_combo.addItems(["Alle", "To Do", "In Progress", "Done"])
         self.filter_combo.currentTextChanged.connect(self.refresh)
@@ -136,71 +158,107 @@ class TasksPage(QWidget):
 
         board_layout = QHBoxLayout()
         self.lists = {}
+        self.models = {}
         for status in ["To Do", "In Progress", "Done"]:
             col = QVBoxLayout()
             label = QLabel(status)
             label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             label.setStyleSheet("font-size: 20px; font-weight: bold; color: #3b82f6; margin-bottom: 8px;")
             col.addWidget(label)
-            lw = KanbanListWidget(status, self)
-            lw.setStyleSheet("""
-                QListWidget { background: #2c313c; border-radius: 8px; }
-                QListWidget::item { padding: 8px; margin: 4px; border-radius: 4px; }
-                QListWidget::item:selected { background: #3b82f6; }
-            """)
+            model = TaskListModel(status, self)
+            lw = KanbanListView(status, model, self)
+            # Nur die Spalte selbst per Stylesheet; die Karten malt TaskCardDelegate
+            lw.setStyleSheet("QListView { background: #2c313c; border-radius: 8px; }")
             col.addWidget(lw)
             self.lists[status] = lw
+            self.models[status] = model
             board_layout.addLayout(col)
         layout.addLayout(board_layout)
-        self.refresh()
 
-        self.task_descriptions = {}
-        for t in get_tasks():
-            if len(t) == 7:
-                task_id = t[0]
-                description = t[6]
-                self.task_descriptions[task_id] = description if description else ""
+        self.store = get_task_store()
+        self.store.tasks_changed.connect(self._on_tasks_changed)
+        self.store.tasks_reset.connect(self.refresh)
+        self.refresh()
 
-    def refresh(self):
+    @perf.timed("TasksPage.refresh")
+    def refresh(self, *_):
         """
-        Aktualisiert die Aufgabenlisten und Filter.
+        Lädt alle Spalten mit den aktuellen Filtern neu (z.B. nach Filterwechsel oder Import).
+
+        Ist ein Suchbegriff eingegeben, zeigen die Spalten nur die Treffer der
+        Volltextsuche, die zusätzlich zu Status- und Datumsfilter passen.
         """
-        self.task_descriptions = {}
-        for t in get_tasks():
-            if len(t) == 7:
-                task_id = t[0]
-                description = t[6]
-                self.task_descriptions[task_id] = description if description else ""
+        self.search_timer.stop()
+        query = self.search_input.text().strip()
+        if query:
+            self._show_search_results(search_tasks(query, SEARCH_LIMIT))
+            return
+        self._search_ids = None
         status_filter = self.filter_combo.currentText()
-        start_range = self.start_filter.date().toString("yyyy-MM-dd")
-        end_range = self.end_filter.date().toString("yyyy-MM-dd")
-        for lw in self.lists.values():
-            lw.clear()
-        tasks_by_status = {"To Do": [], "In Progress": [], "Done": []}
-        for task in get_tasks():
-            task_id, title, status, due_date, start_date, end_date, description = task
-            if start_date:
-                if not (start_range <= start_date <= end_range):
-                    continue
+        start_range, end_range = self._date_range()
+        for status, model in self.models.items():
             if status_filter != "Alle" and status != status_filter:
+                model.set_tasks([])
                 continue
-            tasks_by_status[status].append((task_id, title, due_date, start_date, end_date))
-        for status, lw in self.lists.items():
-            sorted_tasks = sorted(
-                tasks_by_status[status],
-                key=lambda t: (t[2] is None, t[2] if t[2] else "")
+            # Filter und Sortierung nach Fälligkeit erledigt SQLite; weitere
+            # Seiten lädt die Spalte erst beim Scrollen nach
+            model.set_source(
+                lambda after, limit, status=status: query_task_page(status, start_range, end_range, after, limit)
             )
-            for task_id, title, due_date, start_date, end_date in sorted_tasks:
-                text = f"{title}"
-                if start_date and end_date:
-                    text += f" ({start_date} → {end_date})"
-                elif due_date:
-                    text += f" (fällig: {due_date})"
-                item = QListWidgetItem(text)
-                item.setData(Qt.ItemDataRole.UserRole, task_id)
-                item.setForeground(Qt.GlobalColor.white)
-                item.setBackground(Qt.GlobalColor.black)
-                lw.addItem(item)
+
+    def _show_search_results(self, results):
+        """
+        Verteilt Suchtreffer auf die Spalten (dort wieder nach Fälligkeit sortiert).
+        """
+        self._search_ids = {t[0] for t in results}
+        visible = [t for t in results if self._is_visible(t)]
+        for status, model in self.models.items():
+            model.set_tasks(sorted((t for t in visible if t[2] == status), key=task_sort_key))
+
+    def _date_range(self):
+        """
+        Gibt den eingestellten Startdatums-Filter als (von, bis) zurück.
+        """
+        return (
+            self.start_filter.date().toString("yyyy-MM-dd"),
+            self.end_filter.date().toString("yyyy-MM-dd"),
+        )
+
+    def _is_visible(self, task):
+        """
+        Prüft eine einzelne Aufgabe gegen die aktuellen Filter (wie ``query_tasks``) und die Suche.
+        """
+        if self._search_ids is not None and task[0] not in self._search_ids:
+            return False
+        status_filter = self.filter_combo.currentText()
+        if status_filter != "Alle" and task[2] != status_filter:
+            return False
+        start_date = task[4]
+        if start_date:
+            start_range, end_range = self._date_range()
+            return start_range <= start_date <= end_range
+        return True
+
+    def find_task(self, task_id):
+        """
+        Gibt eine Aufgabe aus dem gemeinsamen Store zurück (ohne den ganzen Bestand zu laden).
+        """
+        return self.store.get_many([task_id]).get(task_id)
+
+    @perf.timed("TasksPage.apply_changes")
+    def _on_tasks_changed(self, task_ids):
+        """
+        Übernimmt geänderte Aufgaben gezielt in die Spalten.
+        """
+        # Die Spalten laden seitenweise: nur die geänderten Aufgaben nachschlagen
+        tasks = self.store.get_many(task_ids)
+        for task_id in task_ids:
+            task = tasks.get(task_id)
+            for status, model in self.models.items():
+                if task is None or status != task[2] or not self._is_visible(task):
+                    model.remove_task(task_id)
+            if task is not None and task[2] in self.models and self._is_visible(task):
+                self.models[task[2]].update_task(task)
 
     def add_task(self):
         """
@@ -208,29 +266,37 @@ class TasksPage(QWidget):
         """
         title = self.input.text().strip()
         if title:
-            add_task(title)
+            self.store.add_task(title)
             self.input.clear()
-            self.refresh()
         else:
             dlg = TaskDialog(self)
             if dlg.exec():
                 title, start_date, end_date = dlg.get_data()
-                add_task(title, start_date=start_date, end_date=end_date)
-                self.refresh()
+                self.store.add_task(title, start_date=start_date, end_date=end_date)
 
     def move_task(self, task_id, new_status):
         """
         Verschiebt eine Aufgabe in einen anderen Status.
         """
-        update_task_status(task_id, new_status)
-        self.refresh()
+        self.store.move_task(task_id, new_status)
+
+    def move_tasks(self, task_ids, new_status):
+        """
+        Verschiebt mehrere Aufgaben in einer Transaktion (z.B. eine Mehrfachauswahl per Drag & Drop).
+        """
+        self.store.move_tasks(task_ids, new_status)
 
     def delete_task(self, task_id):
         """
         Löscht eine Aufgabe.
         """
-        delete_task(task_id)
-        self.refresh()
+        self.store.delete_task(task_id)
+
+    def delete_tasks(self, task_ids):
+        """
+        Löscht mehrere Aufgaben in einer Transaktion.
+        """
+        self.store.delete_tasks(task_ids)
 
     def edit_task(self, task_id, old_title, old_start=None, old_end=None):
         """
@@ -239,43 +305,46 @@ class TasksPage(QWidget):
         dlg = TaskDialog(self, title=old_title, start_date=old_start, end_date=old_end)
         if dlg.exec():
             new_title, new_start, new_end = dlg.get_data()
-            edit_task(task_id, new_title, new_start_date=new_start, new_end_date=new_end)
-            self.refresh()
+            self.store.edit_task(task_id, new_title, new_start, new_end)
 
     def show_description(self, task_id, old_description=None):
         """
         Zeigt und bearbeitet die Beschreibung einer Aufgabe.
         """
-        desc = self.task_descriptions.get(task_id, "")
-        dlg = DescriptionDialog(description=desc, parent=self)
+        task = self.find_task(task_id)
+        if task is None:
+            return
+        _, title, _, _, start_date, end_date, description = task
+        dlg = DescriptionDialog(description=description or "", parent=self)
         if dlg.exec():
-            new_description = dlg.get_description()
-            self.task_descriptions[task_id] = new_description
-            for t in get_tasks():
-                if t[0] == task_id:
-                    if len(t) == 7:
-                        _, title, _, _, start_date, end_date, _ = t
-                    else:
-                        _, title, _, _, start_date, end_date = t
-                    break
-            edit_task(task_id, title, start_date, end_date, new_description)
-            self.refresh()
-
-class KanbanListWidget(QListWidget):
+            self.store.edit_task(task_id, title, start_date, end_date, dlg.get_description())
+
+class KanbanListView(QListView):
     """
     Kanban-Board-Spalte für Aufgaben eines Status.
     """
-    def __init__(self, status, parent):
+    def __init__(self, status, model, parent):
         super().__init__()
         self.status = status
         self.parent = parent
+        self.setModel(model)
+        # Alle Karten sind gleich hoch: Qt muss beim Scrollen keine Zeilen vermessen
+        self.setUniformItemSizes(True)
+        self.setItemDelegate(TaskCardDelegate(self))
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        # Mehrfachauswahl mit Strg/Umschalt; Drag & Drop und Kontextmenü wirken auf alle
+        self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.setAcceptDrops(True)
         self.setDragEnabled(True)
-        self.setDragDropMode(QListWidget.DragDropMode.DragDrop)
+        self.setDragDropMode(QAbstractItemView.DragDropMode.DragDrop)
         self.setDefaultDropAction(Qt.DropAction.MoveAction)
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self.open_menu)
 
+    @perf.timed("KanbanListView.paint")
+    def paintEvent(self, event):
+        super().paintEvent(event)
+
     def dragEnterEvent(self, event):
         event.accept()
 
@@ -283,57 +352,70 @@ class KanbanListWidget(QListWidget):
         event.accept()
 
     def dropEvent(self, event):
-        item = self.currentItem()
-        if item is None and self.count() > 0:
-            item = self.item(self.count() - 1)
-        if item:
-            task_id = item.data(Qt.ItemDataRole.UserRole)
-            self.parent.move_task(task_id, self.status)
-        super().dropEvent(event)
+        # Über den Store prüfen (eine Abfrage für alle): die Karten können in
+        # ihrer Spalte noch ungeladen sein
+        dropped = decode_task_ids(event.mimeData())
+        tasks = self.parent.store.get_many(dropped)
+        task_ids = [task_id for task_id in dropped if task_id in tasks and tasks[task_id][2] != self.status]
+        # Alle gezogenen Karten in einer Transaktion, die Spalten aktualisieren sich einmal
+        self.parent.move_tasks(task_ids, self.status)
+        event.accept()
+
+    def selected_task_ids(self):
+        """
+        Gibt die IDs der ausgewählten Aufgaben in Anzeigereihenfolge zurück.
+        """
+        rows = sorted(index.row() for index in self.selectionModel().selectedIndexes())
+        return [self.model().index(row).data(TASK_ID_ROLE) for row in rows]
+
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key.Key_Delete and self.selectionModel().hasSelection():
+            self.parent.delete_tasks(self.selected_task_ids())
+            return
+        super().keyPressEvent(event)
 
     def open_menu(self, pos):
         """
-        Öffnet das Kontextmenü für eine Aufgabe.
+        Öffnet das Kontextmenü für eine Aufgabe bzw. die ausgewählten Aufgaben.
         """
-        item = self.itemAt(pos)
-        if item:
+        index = self.indexAt(pos)
+        if index.isValid():
             from PyQt6.QtWidgets import QMenu
+            # Rechtsklick außerhalb der Auswahl wählt nur diese Karte aus
+            if not self.selectionModel().isSelected(index):
+                self.setCurrentIndex(index)
+            task_ids = self.selected_task_ids()
+            # Nur die ID merken: während menu.exec() kann ein Abgleich das Modell zurücksetzen
+            task_id = index.data(TASK_ID_ROLE)
             menu = QMenu()
             edit_action = menu.addAction("Bearbeiten")
             desc_action = menu.addAction("Beschreibung anzeigen/bearbeiten")
-            delete_action = menu.addAction("Löschen")
+            move_menu = menu.addMenu("Verschieben nach")
+            move_actions = {
+                move_menu.addAction(status): status for status in self.parent.models if status != self.status
+            }
+            delete_action = menu.addAction("Löschen" if len(task_ids) == 1 else f"{len(task_ids)} Aufgaben löschen")
             action = menu.exec(self.mapToGlobal(pos))
-            task_id = item.data(Qt.ItemDataRole.UserRole)
-            for t in get_tasks():
-                if t[0] == task_id:
-                    if len(t) == 7:
-                        _, title, _, _, start_date, end_date, description = t
-                    else:
-                        _, title, _, _, start_date, end_date = t
-                        description = ""
-                    break
-            if action == edit_action:
-                self.parent.edit_task(task_id, title, start_date, end_date)
-            elif action == desc_action:
-                self.parent.show_description(task_id, description)
+            if action in (edit_action, desc_action):
+                task = self.parent.find_task(task_id)
+                if task is None:
+                    return
+                _, title, _, _, start_date, end_date, description = task
+                if action == edit_action:
+                    self.parent.edit_task(task_id, title, start_date, end_date)
+                else:
+                    self.parent.show_description(task_id, description)
+            elif action in move_actions:
+                self.parent.move_tasks(task_ids, move_actions[action])
             elif action == delete_action:
-                self.parent.delete_task(task_id)
+                self.parent.delete_tasks(task_ids)
 
     def mouseDoubleClickEvent(self, event):
         """
         Öffnet den Beschreibungsdialog per Doppelklick.
         """
-        item = self.itemAt(event.pos())
-        if item:
-            task_id = item.data(Qt.ItemDataRole.UserRole)
-            for t in get_tasks():
-                if t[0] == task_id:
-                    if len(t) == 7:
-                        _, title, _, _, start_date, end_date, description = t
-                    else:
-                        _, title, _, _, start_date, end_date = t
-                        description = ""
-                    break
-            self.parent.show_description(task_id, description)
+        index = self.indexAt(event.pos())
+        if index.isValid():
+            task = index.data(TASK_ROLE)
+            self.parent.show_description(task[0], task[6])
         super().mouseDoubleClickEvent(event)
-
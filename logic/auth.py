@@ -0,0 +1,223 @@
+"""
+Passwort-Hashing und Anmelde-Sitzungen.
+
+Passwörter werden mit zufälligem Salt über eine absichtlich teure
+Schlüsselableitung gespeichert (scrypt, ohne OpenSSL-Unterstützung
+PBKDF2-SHA256). Verfahren und Kosten stehen im gespeicherten Wert, sodass
+sich die Parameter später erhöhen lassen: ``needs_rehash()`` erkennt alte
+Werte, ``logic.tasks_db.check_user`` ersetzt sie beim nächsten Login.
+
+Erfolgreiche Anmeldungen merkt sich ``SessionCache`` im Prozess, damit ein
+erneuter Login (z.B. nach "Abmelden" im Dashboard) weder Datenbank noch
+Schlüsselableitung braucht.
+"""
+import base64
+import hashlib
+import hmac
+import secrets
+import threading
+import time
+
+# Kosten der Schlüsselableitung; höhere Werte machen Brute-Force teurer,
+# aber auch jeden Login langsamer (scrypt N=2**15: ca. 100 ms, 32 MB)
+SCRYPT_N = 2 ** 15
+SCRYPT_R = 8
+SCRYPT_P = 1
+PBKDF2_ITERATIONS = 600000
+SALT_BYTES = 16
+HASH_BYTES = 32
+
+# Gültigkeit einer Sitzung bzw. einer gemerkten Anmeldung in Sekunden
+SESSION_TTL = 12 * 60 * 60
+
+def _b64(data):
+    return base64.b64encode(data).decode("ascii")
+
+def _scrypt(password, salt, n, r, p):
+    # maxmem knapp über dem Bedarf von 128 * r * n Bytes, sonst lehnt OpenSSL große N ab
+    return hashlib.scrypt(
+        password.encode("utf-8"), salt=salt, n=n, r=r, p=p, dklen=HASH_BYTES, maxmem=129 * r * n + 1024 * 1024
+    )
+
+def _pbkdf2(password, salt, iterations):
+    return hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations, dklen=HASH_BYTES)
+
+def hash_password(password):
+    """
+    Berechnet einen gesalzenen Passwort-Hash zum Speichern.
+
+    Args:
+        password (str): Klartext-Passwort.
+
+    Returns:
+        str: ``scrypt$N$r$p$salt$hash`` bzw. ``pbkdf2_sha256$iterationen$salt$hash`` (Base64).
+    """
+    salt = secrets.token_bytes(SALT_BYTES)
+    if hasattr(hashlib, "scrypt"):
+        digest = _scrypt(password, salt, SCRYPT_N, SCRYPT_R, SCRYPT_P)
+        return f"scrypt${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}${_b64(salt)}${_b64(digest)}"
+    digest = _pbkdf2(password, salt, PBKDF2_ITERATIONS)
+    return f"pbkdf2_sha256${PBKDF2_ITERATIONS}${_b64(salt)}${_b64(digest)}"
+
+def verify_password(password, stored):
+    """
+    Prüft ein Passwort gegen einen Wert aus ``hash_password()`` (in konstanter Zeit).
+
+    Returns:
+        bool: True, falls das Passwort passt. Unbekannte oder beschädigte
+        Werte ergeben False.
+    """
+    try:
+        scheme, *params = stored.split("$")
+        if scheme == "scrypt":
+            n, r, p, salt, expected = params
+            digest = _scrypt(password, base64.b64decode(salt), int(n), int(r), int(p))
+        elif scheme == "pbkdf2_sha256":
+            iterations, salt, expected = params
+            digest = _pbkdf2(password, base64.b64decode(salt), int(iterations))
+        else:
+            return False
+        return hmac.compare_digest(digest, base64.b64decode(expected))
+    except (ValueError, TypeError):
+        return False
+
+def needs_rehash(stored):
+    """
+    True, falls ``stored`` mit einem anderen Verfahren oder geringeren Kosten erzeugt wurde.
+    """
+    scheme, *params = stored.split("$")
+    if hasattr(hashlib, "scrypt"):
+        return scheme != "scrypt" or params[:3] != [str(SCRYPT_N), str(SCRYPT_R), str(SCRYPT_P)]
+    return scheme != "pbkdf2_sha256" or params[:1] != [str(PBKDF2_ITERATIONS)]
+
+class SessionCache:
+    """
+    Sitzungen und zuletzt erfolgreich geprüfte Zugangsdaten im Speicher.
+
+    Statt des Passworts wird nur ein HMAC mit einem zufälligen, nie
+    gespeicherten Prozess-Schlüssel abgelegt. Fehlgeschlagene Anmeldungen
+    werden nicht gemerkt. Alle Methoden sind threadsicher (Logins laufen
+    im Hintergrund-Job).
+    """
+    def __init__(self, ttl=SESSION_TTL, clock=time.monotonic):
+        """
+        Args:
+            ttl (float): Gültigkeit in Sekunden.
+            clock (callable): Zeitquelle (für Tests austauschbar).
+        """
+        self.ttl = ttl
+        self._clock = clock
+        self._key = secrets.token_bytes(32)
+        self._lock = threading.Lock()
+        self._verified = {}  # Benutzername -> (HMAC, Ablaufzeit)
+        self._sessions = {}  # Token -> (Benutzername, Ablaufzeit)
+
+    def _digest(self, username, password):
+        return hmac.new(self._key, f"{username}\0{password}".encode("utf-8"), hashlib.sha256).digest()
+
+    def remember(self, username, password):
+        """
+        Merkt sich erfolgreich geprüfte Zugangsdaten.
+        """
+        with self._lock:
+            self._verified[username] = (self._digest(username, password), self._clock() + self.ttl)
+
+    def check(self, username, password):
+        """
+        True, falls genau diese Zugangsdaten kürzlich erfolgreich geprüft wurden.
+        """
+        with self._lock:
+            entry = self._verified.get(username)
+            if entry is None:
+                return False
+            digest, expires = entry
+            if self._clock() >= expires:
+                del self._verified[username]
+                return False
+        return hmac.compare_digest(digest, self._digest(username, password))
+
+    def forget(self, username):
+        """
+        Verwirft gemerkte Zugangsdaten und Sitzungen eines Benutzers (z.B. nach Passwortänderung).
+        """
+        with self._lock:
+            self._verified.pop(username, None)
+            self._sessions = {t: s for t, s in self._sessions.items() if s[0] != username}
+
+    def open(self, username):
+        """
+        Legt eine Sitzung an.
+
+        Returns:
+            str: Zufälliges Sitzungs-Token.
+        """
+        token = secrets.token_urlsafe(32)
+        with self._lock:
+            self._sessions[token] = (username, self._clock() + self.ttl)
+        return token
+
+    def user(self, token):
+        """
+        Gibt den Benutzer einer gültigen Sitzung zurück oder None.
+        """
+        with self._lock:
+            session = self._sessions.get(token)
+            if session is None:
+                return None
+            if self._clock() >= session[1]:
+                del self._sessions[token]
+                return None
+            return session[0]
+
+    def close(self, token):
+        """
+        Beendet eine Sitzung (gemerkte Zugangsdaten bleiben für einen schnellen Re-Login).
+        """
+        with self._lock:
+            self._sessions.pop(token, None)
+
+    def clear(self):
+        with self._lock:
+            self._verified.clear()
+            self._sessions.clear()
+
+_sessions = SessionCache()
+
+def login(username, password):
+    """
+    Meldet einen Benutzer an; dauert wegen der Schlüsselableitung absichtlich
+    ca. 100 ms und sollte daher im Hintergrund laufen (siehe ``LoginDialog``).
+
+    Args:
+        username (str): Benutzername.
+        password (str): Passwort.
+
+    Returns:
+        str: Sitzungs-Token oder None, falls die Zugangsdaten falsch sind.
+    """
+    if not _sessions.check(username, password):
+        from logic.tasks_db import check_user
+        if not check_user(username, password):
+            return None
+        _sessions.remember(username, password)
+    return _sessions.open(username)
+
+def logout(token):
+    """
+    Beendet die Sitzung ``token``.
+    """
+    _sessions.close(token)
+
+def change_password(username, password):
+    """
+    Setzt ein neues Passwort und beendet alle Sitzungen des Benutzers.
+    """
+    from logic.tasks_db import set_password
+    set_password(username, password)
+    _sessions.forget(username)
+
+def session_user(token):
+    """
+    Gibt den Benutzer einer gültigen Sitzung zurück oder None.
+    """
+    return _sessions.user(token)
@@ -0,0 +1,200 @@
+"""
+Kommandozeile für Skripte und Cronjobs, ganz ohne Qt.
+
+Aufruf (aus dem Projektordner):
+    python -m logic.cli import aufgaben.csv            # oder "-" für stdin
+    python -m logic.cli export -o export.csv.gz --status Done
+    python -m logic.cli export --format jsonl          # JSON-Lines auf stdout
+    python -m logic.cli stats
+    python -m logic.cli move --status Done 3 7 12      # oder IDs/JSON-Lines von stdin: "-"
+    python -m logic.cli changes --since 1200           # Änderungen seit Revision 1200
+
+Jeder Befehl schreibt eine Zusammenfassung als JSON-Zeile auf stdout, bzw.
+auf stderr, wenn stdout bereits die exportierten Daten enthält. Importiert
+wird nur ``logic.tasks_db``, damit ein Aufruf in Millisekunden startet.
+"""
+import argparse
+import csv
+import json
+import sqlite3
+import sys
+import time
+from logic import tasks_db
+
+TASK_FIELDS = ("id", "title", "status", "due_date", "start_date", "end_date", "description")
+
+def emit(record, stream=None):
+    """
+    Schreibt ``record`` als eine JSON-Zeile.
+    """
+    stream = stream or sys.stdout
+    stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+    stream.flush()
+
+def read_task_ids(values, stdin=None):
+    """
+    Liefert Aufgaben-IDs aus den Argumenten; ``-`` liest zeilenweise von stdin.
+
+    Eine Zeile ist entweder eine Zahl oder ein JSON-Objekt mit ``id`` (z.B. aus
+    ``export --format jsonl``), damit sich Befehle direkt verketten lassen.
+
+    Yields:
+        int: Aufgaben-ID.
+    """
+    for value in values:
+        if value != "-":
+            yield int(value)
+            continue
+        for line in stdin or sys.stdin:
+            line = line.strip()
+            if not line:
+                continue
+            yield json.loads(line)["id"] if line.startswith("{") else int(line)
+
+def cmd_import(args):
+    """
+    Importiert eine CSV-Datei bzw. CSV von stdin.
+    """
+    start = time.perf_counter()
+    source = sys.stdin.buffer if args.file == "-" else args.file
+
+    def progress(rows, bytes_read, bytes_total):
+        emit({"event": "progress", "rows": rows, "bytes_read": bytes_read, "bytes_total": bytes_total},
+             sys.stderr)
+    count = tasks_db.import_tasks_from_csv(
+        source, progress=progress if args.progress else None, chunk_size=args.chunk_size
+    )
+    emit({"command": "import", "rows": count, "seconds": round(time.perf_counter() - start, 3)})
+
+def cmd_export(args):
+    """
+    Exportiert gefilterte Aufgaben blockweise als CSV oder JSON-Lines.
+    """
+    start = time.perf_counter()
+    filters = {"status": args.status, "start_from": args.start_from, "start_to": args.start_to}
+    to_stdout = args.output == "-"
+    if args.format == "csv" and not to_stdout:
+        count = tasks_db.export_tasks_to_csv(args.output, **filters)
+    else:
+        out = sys.stdout if to_stdout else open(args.output, "w", newline="", encoding="utf-8")
+        count = 0
+        try:
+            writer = None
+            if args.format == "csv":
+                writer = csv.writer(out)
+                writer.writerow(tasks_db.CSV_HEADER)
+            for batch in tasks_db.iter_task_batches(**filters):
+                if writer is not None:
+                    writer.writerows(batch)
+                else:
+                    out.writelines(
+                        json.dumps(dict(zip(TASK_FIELDS, task)), ensure_ascii=False) + "\n" for task in batch
+                    )
+                count += len(batch)
+        finally:
+            if to_stdout:
+                out.flush()
+            else:
+                out.close()
+    emit(
+        {"command": "export", "format": args.format, "rows": count,
+         "seconds": round(time.perf_counter() - start, 3)},
+        sys.stderr if to_stdout else sys.stdout,
+    )
+
+def cmd_stats(args):
+    """
+    Gibt Anzahl pro Status und die nächste Fälligkeit aus.
+    """
+    stats = tasks_db.get_task_stats()
+    next_due = stats["next_due"]
+    emit({
+        "command": "stats",
+        "total": stats["total"],
+        "by_status": stats["by_status"],
+        "next_due": dict(zip(("id", "title", "due_date"), next_due)) if next_due else None,
+    })
+
+def cmd_move(args):
+    """
+    Setzt den Status der angegebenen Aufgaben in einer Transaktion.
+    """
+    task_ids = list(read_task_ids(args.ids))
+    moved = tasks_db.move_tasks(task_ids, args.status)
+    requested = len(task_ids)
+    emit({"command": "move", "status": args.status, "requested": requested, "moved": moved})
+
+def cmd_changes(args):
+    """
+    Gibt die seit einer Revision geänderten Aufgaben als JSON-Lines aus.
+
+    Geänderte Aufgaben erscheinen mit ``"op": "upsert"`` und allen Feldern,
+    gelöschte nur mit ``"op": "delete"`` und ``id``. Die Zusammenfassung auf
+    stderr enthält die neue Revision für den nächsten Aufruf; bei
+    ``"complete": false`` ist ein kompletter Export nötig.
+    """
+    delta = tasks_db.get_changes_since(args.since)
+    for task in delta["changed"]:
+        emit({"op": "upsert", **dict(zip(TASK_FIELDS, task))})
+    for task_id in delta["deleted"]:
+        emit({"op": "delete", "id": task_id})
+    emit(
+        {"command": "changes", "since": args.since, "rev": delta["rev"], "complete": delta["complete"],
+         "changed": len(delta["changed"]), "deleted": len(delta["deleted"])},
+        sys.stderr,
+    )
+
+def build_parser():
+    """
+    Baut den Argument-Parser mit den Unterbefehlen import, export, stats, move und changes.
+    """
+    parser = argparse.ArgumentParser(prog="python -m logic.cli", description="ProjectOS-Aufgaben ohne Oberfläche.")
+    parser.add_argument("--db", default=tasks_db.DB_PATH, help="Pfad zur Datenbank (Standard: %(default)s)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("import", help="Aufgaben aus CSV importieren (eine Transaktion)")
+    p.add_argument("file", help="CSV-Datei oder - für stdin")
+    p.add_argument("--chunk-size", type=int, default=tasks_db.CSV_IMPORT_CHUNK_SIZE)
+    p.add_argument("--progress", action="store_true", help="Fortschritt als JSON-Lines auf stderr")
+    p.set_defaults(func=cmd_import)
+
+    p = sub.add_parser("export", help="Aufgaben als CSV oder JSON-Lines exportieren")
+    p.add_argument("-o", "--output", default="-", help="Zieldatei (.gz komprimiert) oder - für stdout")
+    p.add_argument("--format", choices=("csv", "jsonl"), default="csv")
+    p.add_argument("--status")
+    p.add_argument("--from", dest="start_from", help="Frühestes Startdatum (YYYY-MM-DD)")
+    p.add_argument("--to", dest="start_to", help="Spätestes Startdatum (YYYY-MM-DD)")
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser("stats", help="Anzahl pro Status und nächste Fälligkeit")
+    p.set_defaults(func=cmd_stats)
+
+    p = sub.add_parser("move", help="Status von Aufgaben ändern (eine Transaktion)")
+    p.add_argument("--status", required=True, choices=("To Do", "In Progress", "Done"))
+    p.add_argument("ids", nargs="+", help="Aufgaben-IDs oder - für stdin")
+    p.set_defaults(func=cmd_move)
+
+    p = sub.add_parser("changes", help="Geänderte Aufgaben seit einer Revision (inkrementeller Abgleich)")
+    p.add_argument("--since", type=int, default=0, help="Zuletzt gesehene Revision (Standard: %(default)s)")
+    p.set_defaults(func=cmd_changes)
+    return parser
+
+def main(argv=None):
+    """
+    Einstiegspunkt der Kommandozeile.
+
+    Returns:
+        int: Exit-Code (0 = Erfolg, 1 = Fehler).
+    """
+    args = build_parser().parse_args(argv)
+    tasks_db.DB_PATH = args.db
+    try:
+        tasks_db.init_db()
+        args.func(args)
+    except (OSError, ValueError, KeyError, csv.Error, sqlite3.Error) as exc:
+        emit({"command": args.command, "error": str(exc)}, sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+import atexit
+import threading
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+class JobCancelled(Exception):
+    """
+    Wird im Hintergrund-Thread ausgelöst, sobald ein abgebrochener Job Fortschritt meldet.
+    """
+
+class JobSignals(QObject):
+    """
+    Signale eines Jobs. Das Objekt lebt im GUI-Thread, daher kommen die
+    Signale dort als Queued Connection an und dürfen Widgets anfassen.
+    """
+    progress = pyqtSignal(tuple)   # Werte, die die Funktion an ``progress(...)`` übergibt
+    finished = pyqtSignal(object)  # Rückgabewert der Funktion
+    failed = pyqtSignal(object)    # Exception der Funktion
+    cancelled = pyqtSignal()
+    done = pyqtSignal()            # immer zuletzt, egal wie der Job endete
+
+class Job(QRunnable):
+    """
+    Führt eine der synchronen Funktionen (Abfrage, Import, Export, ...) in
+    einem Thread des ``QThreadPool`` aus.
+
+    Mit ``report_progress=True`` bekommt die Funktion ``progress=job.report``
+    übergeben. ``cancel()`` setzt nur ein Flag; der nächste ``report()``-Aufruf
+    löst dann ``JobCancelled`` aus, sodass z.B. die Import-Transaktion
+    zurückgerollt wird. Noch nicht gestartete Jobs laufen gar nicht erst an.
+    """
+    def __init__(self, func, *args, report_progress=False, **kwargs):
+        """
+        Args:
+            func (callable): Auszuführende Funktion.
+            *args, **kwargs: Argumente für ``func``.
+            report_progress (bool): ``progress=self.report`` an ``func`` übergeben.
+        """
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        if report_progress:
+            self.kwargs["progress"] = self.report
+        self.signals = JobSignals()
+        self._cancel = threading.Event()
+        self._done = threading.Event()
+        self._started = False
+        self._start_lock = threading.Lock()
+        self.pool = None
+        # Das Python-Objekt muss bis zum Ende von run() leben, nicht Qt
+        self.setAutoDelete(False)
+
+    def cancel(self):
+        """
+        Fordert den Abbruch an (wirkt beim nächsten Fortschritts-Callback).
+        """
+        self._cancel.set()
+
+    def start(self):
+        """
+        Übergibt den Job an den Thread-Pool (nur beim ersten Aufruf).
+        """
+        with self._start_lock:
+            if self._started:
+                return
+            self._started = True
+        (self.pool or QThreadPool.globalInstance()).start(self)
+
+    def is_cancelled(self):
+        return self._cancel.is_set()
+
+    def is_done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        """
+        Wartet, bis der Job beendet ist (für Skripte und Tests).
+
+        Ein noch nicht gestarteter Job (siehe ``start_job``) wird dafür sofort
+        gestartet, ohne auf die Event-Loop zu warten.
+
+        Returns:
+            bool: True, falls der Job innerhalb von ``timeout`` Sekunden fertig wurde.
+        """
+        self.start()
+        return self._done.wait(timeout)
+
+    def report(self, *values):
+        """
+        Fortschritts-Callback für ``func``; meldet ``values`` über ``signals.progress``.
+
+        Raises:
+            JobCancelled: Der Job wurde abgebrochen.
+        """
+        if self._cancel.is_set():
+            raise JobCancelled()
+        self.signals.progress.emit(values)
+
+    def run(self):
+        try:
+            if self._cancel.is_set():
+                raise JobCancelled()
+            result = self.func(*self.args, **self.kwargs)
+        except JobCancelled:
+            self.signals.cancelled.emit()
+        except Exception as exc:
+            self.signals.failed.emit(exc)
+        else:
+            self.signals.finished.emit(result)
+        finally:
+            self._done.set()
+            self.signals.done.emit()
+
+# Laufende Jobs, damit sie (und ihre Signale) nicht vorzeitig eingesammelt werden
+_running = set()
+
+def cancel_all_jobs(timeout=None):
+    """
+    Bricht alle laufenden Jobs ab und wartet auf ihr Ende (z.B. beim Beenden).
+
+    Returns:
+        bool: True, falls alle Jobs innerhalb von ``timeout`` Sekunden beendet wurden.
+    """
+    jobs = list(_running)
+    for job in jobs:
+        job.cancel()
+    return all(job.wait(timeout) for job in jobs)
+
+atexit.register(cancel_all_jobs)
+
+def start_job(func, *args, report_progress=False, pool=None, **kwargs):
+    """
+    Startet ``func(*args, **kwargs)`` im Hintergrund.
+
+    Die synchronen Funktionen in ``logic.tasks_db`` bleiben für Skripte und
+    Tests direkt aufrufbar; die Oberfläche startet sie über diese Funktion.
+    Der Job läuft los, sobald die Event-Loop wieder an der Reihe ist (oder
+    bei ``job.wait()``), die Signale können also gefahrlos danach verbunden
+    werden.
+
+    Args:
+        func (callable): Auszuführende Funktion.
+        report_progress (bool): ``progress``-Callback an ``func`` übergeben.
+        pool (QThreadPool, optional): Standard: ``QThreadPool.globalInstance()``.
+
+    Returns:
+        Job: Der gestartete Job; Ergebnis über ``job.signals``.
+    """
+    job = Job(func, *args, report_progress=report_progress, **kwargs)
+    job.pool = pool
+    _running.add(job)
+    # Erst freigeben, wenn die Signale im GUI-Thread zugestellt sind
+    job.signals.done.connect(lambda: _running.discard(job))
+    # Erst im nächsten Durchlauf der Event-Loop starten: Aufrufer verbinden ihre
+    # Slots direkt nach start_job(), und Signale eines sehr schnellen Jobs
+    # (z.B. Login aus dem Sitzungs-Cache) gingen sonst verloren.
+    QTimer.singleShot(0, job.start)
+    return job
@@ -0,0 +1,176 @@
+import time
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.utils import simpleSplit
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen import canvas
+
+PAGE_MARGIN = 36
+TITLE_FONT = ("Helvetica-Bold", 14)
+HEADER_FONT = ("Helvetica-Bold", 9)
+BODY_FONT = ("Helvetica", 8)
+LEADING = 10
+CELL_PADDING = 3
+# Sehr lange Beschreibungen werden nach so vielen Zeilen gekürzt
+MAX_CELL_LINES = 12
+
+# (Spaltenkopf, Anteil an der nutzbaren Seitenbreite)
+TASK_PDF_COLUMNS = (
+    ("ID", 0.06),
+    ("Titel", 0.22),
+    ("Status", 0.10),
+    ("Fällig", 0.10),
+    ("Start", 0.10),
+    ("Ende", 0.10),
+    ("Beschreibung", 0.32),
+)
+
+def wrap_text(text, width, font=BODY_FONT, max_lines=MAX_CELL_LINES):
+    """
+    Bricht ``text`` auf die Spaltenbreite um.
+
+    Wörter, die allein zu breit sind, werden zeichenweise getrennt. Mehr als
+    ``max_lines`` Zeilen werden abgeschnitten und mit "…" markiert.
+
+    Returns:
+        list: Die Zeilen des Zelltexts.
+    """
+    name, size = font
+    text = str(text)
+    # Schneller Weg für die meisten Zellen (IDs, Status, Daten, kurze Titel)
+    if "\n" not in text and stringWidth(text, name, size) <= width:
+        return [text]
+    lines = []
+    for paragraph in text.splitlines() or [""]:
+        for line in simpleSplit(paragraph, name, size, width) or [""]:
+            while stringWidth(line, name, size) > width and len(line) > 1:
+                cut = len(line) - 1
+                while cut > 1 and stringWidth(line[:cut], name, size) > width:
+                    cut -= 1
+                lines.append(line[:cut])
+                line = line[cut:]
+            lines.append(line)
+            if len(lines) > max_lines:
+                return lines[:max_lines - 1] + [lines[max_lines - 1][:-1] + "…"]
+    return lines
+
+class TablePdfWriter:
+    """
+    Schreibt Tabellenzeilen fortlaufend in ein PDF.
+
+    Zeilen werden direkt auf die aktuelle Seite gezeichnet; ist sie voll,
+    beginnt eine neue Seite mit wiederholter Kopfzeile. Es wird also nie die
+    ganze Tabelle im Speicher gehalten.
+    """
+    def __init__(self, filepath, columns, title="", pagesize=A4):
+        """
+        Args:
+            filepath (str): Zieldatei.
+            columns (sequence): (Spaltenkopf, Breitenanteil)-Paare.
+            title (str): Überschrift auf der ersten Seite.
+            pagesize (tuple): Seitengröße in Punkten.
+        """
+        self.canvas = canvas.Canvas(filepath, pagesize=pagesize)
+        self.width, self.height = pagesize
+        usable = self.width - 2 * PAGE_MARGIN
+        self.columns = [(name, usable * share) for name, share in columns]
+        self.title = title
+        self.pages = 0
+        self.rows = 0
+        self._start_page()
+
+    def _start_page(self):
+        """
+        Beginnt eine neue Seite und zeichnet Titel (nur Seite 1) und Kopfzeile.
+        """
+        self.pages += 1
+        self.y = self.height - PAGE_MARGIN
+        if self.pages == 1 and self.title:
+            self.canvas.setFont(*TITLE_FONT)
+            self.canvas.drawString(PAGE_MARGIN, self.y - TITLE_FONT[1], self.title)
+            self.y -= TITLE_FONT[1] + 12
+        self.table_top = self.y
+        header = [wrap_text(name, width - 2 * CELL_PADDING, HEADER_FONT) for name, width in self.columns]
+        height = max(len(lines) for lines in header) * LEADING + 2 * CELL_PADDING
+        self.canvas.setFillGray(0.88)
+        self.canvas.rect(PAGE_MARGIN, self.y - height, self.width - 2 * PAGE_MARGIN, height, stroke=0, fill=1)
+        self.canvas.setFillGray(0)
+        self._draw_cells(header, height, HEADER_FONT)
+
+    def _draw_cells(self, cells, height, font):
+        """
+        Zeichnet eine Zeile aus umgebrochenen Zellen und die Linie darunter.
+        """
+        # Ein Textobjekt pro Zeile ist deutlich billiger als drawString pro Zelle
+        text = self.canvas.beginText()
+        text.setFont(*font, leading=LEADING)
+        x = PAGE_MARGIN
+        for (_, width), lines in zip(self.columns, cells):
+            text.setTextOrigin(x + CELL_PADDING, self.y - CELL_PADDING - font[1])
+            text.textLines(lines)
+            x += width
+        self.canvas.drawText(text)
+        self.y -= height
+        self.canvas.line(PAGE_MARGIN, self.y, self.width - PAGE_MARGIN, self.y)
+
+    def _finish_page(self):
+        """
+        Zeichnet Spaltenlinien und Seitenzahl und schließt die Seite ab.
+        """
+        x = PAGE_MARGIN
+        self.canvas.line(x, self.table_top, x, self.y)
+        for _, width in self.columns:
+            x += width
+            self.canvas.line(x, self.table_top, x, self.y)
+        self.canvas.setFont(*BODY_FONT)
+        self.canvas.drawRightString(self.width - PAGE_MARGIN, PAGE_MARGIN / 2, f"Seite {self.pages}")
+        self.canvas.showPage()
+
+    def add_row(self, values):
+        """
+        Fügt eine Tabellenzeile hinzu und bricht bei Bedarf die Seite um.
+        """
+        cells = [
+            wrap_text("" if value is None else value, width - 2 * CELL_PADDING)
+            for (_, width), value in zip(self.columns, values)
+        ]
+        height = max(len(lines) for lines in cells) * LEADING + 2 * CELL_PADDING
+        if self.y - height < PAGE_MARGIN:
+            self._finish_page()
+            self._start_page()
+        self._draw_cells(cells, height, BODY_FONT)
+        self.rows += 1
+
+    def close(self):
+        """
+        Schließt die letzte Seite ab und schreibt die Datei.
+        """
+        self._finish_page()
+        self.canvas.save()
+
+def write_tasks_pdf(filepath, batches, progress=None):
+    """
+    Schreibt Aufgaben-Blöcke (z.B. aus ``iter_task_batches``) als PDF-Tabelle.
+
+    Args:
+        filepath (str): Zieldatei.
+        batches (iterable): Listen von Aufgaben-Tupeln.
+        progress (callable, optional): ``progress(rows, pages)`` nach jedem Block.
+
+    Returns:
+        dict: rows, pages, seconds und pages_per_second.
+    """
+    start = time.perf_counter()
+    writer = TablePdfWriter(filepath, TASK_PDF_COLUMNS, title="Aufgabenliste")
+    for batch in batches:
+        for task in batch:
+            writer.add_row(task)
+        if progress is not None:
+            progress(writer.rows, writer.pages)
+    writer.close()
+    seconds = time.perf_counter() - start
+    return {
+        "rows": writer.rows,
+        "pages": writer.pages,
+        "seconds": seconds,
+        "pages_per_second": writer.pages / seconds if seconds else 0.0,
+    }
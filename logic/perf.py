@@ -0,0 +1,359 @@
+"""
+Laufzeitmessung für heiße Pfade (Datenbankfunktionen, Seitenaufbau).
+
+Standardmäßig ausgeschaltet; ``PROJECTOS_PERF=1`` in der Umgebung oder
+``enable()`` schaltet sie ein. Dann landen die Laufzeiten aller mit
+``timed()`` bzw. ``instrument()`` versehenen Funktionen in rollierenden
+Histogrammen, und über ``sqlite3.Connection.set_trace_callback`` wird jede
+ausgeführte SQL-Anweisung gezählt. Ausgeschaltet kostet ein gemessener
+Aufruf nur einen zusätzlichen Funktionsaufruf und einen Flag-Test; der
+Trace-Callback ist dann gar nicht installiert.
+
+Mit ``PROJECTOS_PERF_DUMP=datei.json`` werden die Messwerte beim Beenden
+gespeichert; die Debug-Seite (``gui.perf_page``) zeigt sie live an.
+"""
+import atexit
+import functools
+import inspect
+import json
+import os
+import sqlite3
+import threading
+import time
+from bisect import bisect_right
+from collections import deque
+from contextlib import contextmanager
+
+ENV_ENABLE = "PROJECTOS_PERF"
+ENV_DUMP = "PROJECTOS_PERF_DUMP"
+
+# Anzahl der letzten Messungen pro Name, aus denen Quantile und Histogramm berechnet werden
+WINDOW_SIZE = 1000
+# Obergrenzen der Histogramm-Klassen in ms; alles darüber landet in der letzten Klasse
+BUCKET_BOUNDS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000)
+
+_enabled = os.environ.get(ENV_ENABLE, "") not in ("", "0")
+_lock = threading.Lock()
+_stats = {}
+_statements = 0
+_captures = []
+_listeners = []
+_local = threading.local()
+# Anweisungen, die Trigger auslösen können (Anfang des SQL-Texts)
+_TRIGGERING = ("INSERT", "UPDATE", "DELETE", "REPLAC")
+
+class LatencyStats:
+    """
+    Rollierende Laufzeitstatistik eines Messpunkts.
+
+    Aufrufe, Gesamtzeit und SQL-Anweisungen zählen seit dem letzten
+    ``reset()``; Quantile, Maximum und Histogramm beziehen sich auf die
+    letzten ``WINDOW_SIZE`` Messungen.
+    """
+    def __init__(self, window=WINDOW_SIZE):
+        self.calls = 0
+        self.total_ms = 0.0
+        self.statements = 0
+        self._window = deque(maxlen=window)
+
+    def add(self, ms, statements=0):
+        self.calls += 1
+        self.total_ms += ms
+        self.statements += statements
+        self._window.append(ms)
+
+    def snapshot(self):
+        """
+        Gibt die Kennzahlen als JSON-taugliches Dict zurück.
+        """
+        recent = sorted(self._window)
+        buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        for ms in recent:
+            buckets[bisect_right(BUCKET_BOUNDS_MS, ms)] += 1
+
+        def quantile(q):
+            return recent[min(int(q * len(recent)), len(recent) - 1)] if recent else 0.0
+
+        return {
+            "calls": self.calls,
+            "total_ms": self.total_ms,
+            "mean_ms": self.total_ms / self.calls if self.calls else 0.0,
+            "p50_ms": quantile(0.5),
+            "p95_ms": quantile(0.95),
+            "p99_ms": quantile(0.99),
+            "max_ms": recent[-1] if recent else 0.0,
+            "statements": self.statements,
+            "histogram": dict(zip([f"<={b}" for b in BUCKET_BOUNDS_MS] + [f">{BUCKET_BOUNDS_MS[-1]}"], buckets)),
+        }
+
+def enabled():
+    """
+    True, falls gerade gemessen wird.
+    """
+    return _enabled
+
+def _notify():
+    for callback in list(_listeners):
+        callback(tracing())
+
+def on_tracing_changed(callback):
+    """
+    Registriert ``callback(active)``, der Trace-Callbacks auf offenen Verbindungen an- oder abmeldet.
+
+    Returns:
+        bool: Ob SQL-Anweisungen aktuell gezählt werden sollen.
+    """
+    _listeners.append(callback)
+    return tracing()
+
+def tracing():
+    """
+    True, falls SQL-Anweisungen gezählt werden (Messung an oder ``capture_statements()`` aktiv).
+    """
+    return _enabled or bool(_captures)
+
+def enable():
+    """
+    Schaltet die Messung ein.
+    """
+    global _enabled
+    if not _enabled:
+        _enabled = True
+        _notify()
+
+def disable():
+    """
+    Schaltet die Messung aus (gesammelte Werte bleiben erhalten).
+    """
+    global _enabled
+    if _enabled:
+        _enabled = False
+        _notify()
+
+def reset():
+    """
+    Verwirft alle gesammelten Messwerte.
+    """
+    global _statements
+    with _lock:
+        _stats.clear()
+        _statements = 0
+
+def statement_started():
+    """
+    Markiert den Beginn einer neuen Ausführung in diesem Thread (siehe ``TracingConnection``).
+    """
+    _local.fresh = True
+
+def _each_started(seq_of_parameters):
+    # executemany holt die Parameter Zeile für Zeile: jede Zeile ist eine eigene Ausführung
+    for parameters in seq_of_parameters:
+        statement_started()
+        yield parameters
+
+class TracingCursor(sqlite3.Cursor):
+    """
+    Cursor, der jede Ausführung mit ``statement_started()`` ankündigt.
+    """
+    def execute(self, sql, parameters=()):
+        statement_started()
+        return super().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        if tracing():
+            seq_of_parameters = _each_started(seq_of_parameters)
+        return super().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script):
+        statement_started()
+        return super().executescript(sql_script)
+
+class TracingConnection(sqlite3.Connection):
+    """
+    Verbindung (``sqlite3.connect(..., factory=TracingConnection)``), deren
+    Ausführungen ``trace_statement`` von Trigger-Echos unterscheiden kann.
+
+    Zwei gleiche Schreibzugriffe nacheinander sind so zwei Anweisungen, die
+    Meldungen der ausgelösten Trigger dagegen nicht.
+    """
+    def cursor(self, factory=TracingCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script):
+        return self.cursor().executescript(sql_script)
+
+def trace_statement(sql):
+    """
+    Trace-Callback für ``sqlite3.Connection.set_trace_callback``.
+
+    Gezählt werden nur die Anweisungen der Anwendung: interne Abfragen von
+    FTS5 ("-- ..." bzw. mit Schema ``'main'.``) fallen weg, ebenso die
+    Wiederholungen, mit denen SQLite jede ausgelöste Trigger-Ausführung
+    unter dem Text der auslösenden Anweisung meldet. Ein Echo ist nur eine
+    Wiederholung innerhalb derselben Ausführung (``statement_started()``);
+    auf Verbindungen ohne ``TracingConnection`` genügt gleicher Text.
+    """
+    global _statements
+    if sql.startswith("--") or "'main'." in sql:
+        return
+    fresh = getattr(_local, "fresh", False)
+    _local.fresh = False
+    if not fresh and sql == getattr(_local, "last", None) and sql[:6].upper() in _TRIGGERING:
+        return
+    _local.last = sql
+    _local.statements = getattr(_local, "statements", 0) + 1
+    with _lock:
+        _statements += 1
+        for capture in _captures:
+            capture.append(sql)
+
+def record(name, ms, statements=0):
+    """
+    Trägt eine Messung unter ``name`` ein.
+    """
+    with _lock:
+        stats = _stats.get(name)
+        if stats is None:
+            stats = _stats[name] = LatencyStats()
+        stats.add(ms, statements)
+
+@contextmanager
+def measure(name):
+    """
+    Misst Laufzeit und SQL-Anweisungen (dieses Threads) eines Blocks, falls die Messung an ist.
+    """
+    if not _enabled:
+        yield
+        return
+    statements = getattr(_local, "statements", 0)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, (time.perf_counter() - start) * 1000, getattr(_local, "statements", 0) - statements)
+
+def _timed_iteration(name, gen, ms, statements):
+    """
+    Reicht die Werte von ``gen`` durch und trägt die Messung erst nach dem Iterieren ein.
+
+    Gezählt wird nur die Zeit im Generator selbst (plus ``ms``/``statements``
+    für dessen Erzeugung), nicht die Verarbeitung beim Aufrufer zwischen
+    zwei Werten. Bricht der Aufrufer vorzeitig ab, zählt das Bisherige.
+    """
+    try:
+        while True:
+            before = getattr(_local, "statements", 0)
+            start = time.perf_counter()
+            try:
+                value = next(gen)
+            except StopIteration:
+                return
+            finally:
+                ms += (time.perf_counter() - start) * 1000
+                statements += getattr(_local, "statements", 0) - before
+            yield value
+    finally:
+        gen.close()
+        record(name, ms, statements)
+
+def timed(name):
+    """
+    Dekorator: misst jeden Aufruf der Funktion unter ``name``.
+
+    Liefert die Funktion einen Generator (z.B. ``tasks_db.iter_task_batches``),
+    wird stattdessen das komplette Durchlaufen gemessen, da die eigentliche
+    Arbeit erst dabei passiert.
+    """
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            statements = getattr(_local, "statements", 0)
+            start = time.perf_counter()
+            result = None
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                ms = (time.perf_counter() - start) * 1000
+                statements = getattr(_local, "statements", 0) - statements
+                if not inspect.isgenerator(result):
+                    record(name, ms, statements)
+            if inspect.isgenerator(result):
+                return _timed_iteration(name, result, ms, statements)
+            return result
+        return wrapper
+    return decorate
+
+def instrument(namespace, prefix, skip=()):
+    """
+    Versieht alle öffentlichen Funktionen eines Moduls mit ``timed("<prefix>.<name>")``.
+
+    Funktionen, die einen Generator liefern, werden über das komplette
+    Durchlaufen gemessen (siehe ``timed``).
+
+    Args:
+        namespace (dict): ``globals()`` des Moduls.
+        prefix (str): Präfix der Messpunkte, z.B. "tasks_db".
+        skip (iterable): Funktionsnamen, die nicht gemessen werden (billige Hilfsfunktionen).
+    """
+    for name, func in list(namespace.items()):
+        if (
+            name.startswith("_") or name in skip or not inspect.isfunction(func)
+            or func.__module__ != namespace["__name__"]
+        ):
+            continue
+        namespace[name] = timed(f"{prefix}.{name}")(func)
+
+@contextmanager
+def capture_statements():
+    """
+    Sammelt die SQL-Anweisungen aller Threads, die während des Blocks ausgeführt werden.
+
+    Funktioniert unabhängig von ``enable()`` (z.B. für Tests mit Anweisungs-Budget).
+
+    Yields:
+        list: Wird während des Blocks mit den SQL-Texten gefüllt.
+    """
+    statements = []
+    with _lock:
+        _captures.append(statements)
+        first = len(_captures) == 1
+    if first and not _enabled:
+        _notify()
+    try:
+        yield statements
+    finally:
+        with _lock:
+            _captures.remove(statements)
+            last = not _captures
+        if last and not _enabled:
+            _notify()
+
+def snapshot():
+    """
+    Gibt alle Messwerte als Dict zurück.
+
+    Returns:
+        dict: ``{"enabled", "statements", "timings": {name: {...}}}``, Namen sortiert.
+    """
+    with _lock:
+        timings = {name: _stats[name].snapshot() for name in sorted(_stats)}
+        statements = _statements
+    return {"enabled": _enabled, "statements": statements, "timings": timings}
+
+def dump_json(path):
+    """
+    Schreibt ``snapshot()`` als JSON-Datei.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(snapshot(), f, indent=2)
+
+if os.environ.get(ENV_DUMP):
+    atexit.register(lambda: dump_json(os.environ[ENV_DUMP]))
@@ -0,0 +1,238 @@
+import atexit
+import threading
+from logic import perf
+from logic.tasks_db import SQLiteRepository, fts_query
+
+DB_PATH = "reflection.db"
+
+def _migrate_reflections_table(conn):
+    """
+    Migration 1: Tabelle ``reflections`` (ein Eintrag pro Tag).
+
+    Der Primärschlüssel auf ``date`` dient zugleich als Index für Zeitraum-Abfragen.
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS reflections (
+            date TEXT PRIMARY KEY,
+            text TEXT
+        )
+    """)
+
+def _create_reflection_search(conn, key):
+    """
+    Legt den FTS5-Index über ``reflections.text`` samt Triggern an und füllt ihn.
+
+    Args:
+        conn (sqlite3.Connection): Verbindung innerhalb der Migration.
+        key (str): Spalte von ``reflections``, die als rowid im Index dient.
+    """
+    conn.execute(f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS reflections_fts USING fts5(
+            text, content='reflections', content_rowid='{key}',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS reflections_fts_insert AFTER INSERT ON reflections BEGIN
+            INSERT INTO reflections_fts (rowid, text) VALUES (new.{key}, new.text);
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS reflections_fts_delete AFTER DELETE ON reflections BEGIN
+            INSERT INTO reflections_fts (reflections_fts, rowid, text) VALUES ('delete', old.{key}, old.text);
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS reflections_fts_update AFTER UPDATE OF text ON reflections BEGIN
+            INSERT INTO reflections_fts (reflections_fts, rowid, text) VALUES ('delete', old.{key}, old.text);
+            INSERT INTO reflections_fts (rowid, text) VALUES (new.{key}, new.text);
+        END
+    """)
+    conn.execute("INSERT INTO reflections_fts (reflections_fts) VALUES ('rebuild')")
+
+def _migrate_reflection_search(conn):
+    """
+    Migration 2: FTS5-Volltextindex über die Reflexionstexte, per Trigger synchron gehalten.
+    """
+    _create_reflection_search(conn, "rowid")
+
+def _migrate_reflection_ids(conn):
+    """
+    Migration 3: explizite ``id INTEGER PRIMARY KEY`` als Schlüssel des Suchindex.
+
+    Die implizite rowid einer Tabelle ohne INTEGER PRIMARY KEY darf VACUUM
+    neu vergeben, der Index zeigte dann auf fremde Einträge. Die Tabelle wird
+    deshalb mit ``id`` neu aufgebaut (``date`` bleibt eindeutig), Index und
+    Trigger werden auf ``id`` neu angelegt.
+    """
+    for trigger in ("insert", "delete", "update"):
+        conn.execute(f"DROP TRIGGER IF EXISTS reflections_fts_{trigger}")
+    conn.execute("DROP TABLE IF EXISTS reflections_fts")
+    conn.execute("""
+        CREATE TABLE reflections_new (
+            id INTEGER PRIMARY KEY,
+            date TEXT NOT NULL UNIQUE,
+            text TEXT
+        )
+    """)
+    conn.execute("INSERT INTO reflections_new (date, text) SELECT date, text FROM reflections ORDER BY date")
+    conn.execute("DROP TABLE reflections")
+    conn.execute("ALTER TABLE reflections_new RENAME TO reflections")
+    _create_reflection_search(conn, "id")
+
+# Nummerierte Migrationen wie in ``logic.tasks_db``: nur hinten anhängen.
+REFLECTION_MIGRATIONS = [
+    _migrate_reflections_table,
+    _migrate_reflection_search,
+    _migrate_reflection_ids,
+]
+
+# Upsert statt REPLACE: REPLACE löscht die Zeile, ohne die Delete-Trigger
+# des Suchindex auszulösen, und vergibt eine neue id.
+UPSERT_REFLECTION_SQL = (
+    "INSERT INTO reflections (date, text) VALUES (?, ?) "
+    "ON CONFLICT (date) DO UPDATE SET text = excluded.text"
+)
+
+class ReflectionRepository(SQLiteRepository):
+    """
+    Zugriffsschicht auf das Reflexionstagebuch (eine langlebige Verbindung pro Thread).
+    """
+    migrations = REFLECTION_MIGRATIONS
+
+    def save_reflection(self, date, text):
+        """
+        Speichert oder aktualisiert den Eintrag eines Tages.
+        """
+        self.save_reflections([(date, text)])
+
+    def save_reflections(self, entries):
+        """
+        Speichert mehrere Einträge in einer Transaktion.
+        """
+        with self.transaction() as conn:
+            conn.executemany(UPSERT_REFLECTION_SQL, entries)
+
+    def load_reflection(self, date):
+        """
+        Gibt den Text eines Tages zurück oder "".
+        """
+        row = self.connection().execute("SELECT text FROM reflections WHERE date=?", (date,)).fetchone()
+        return row[0] if row and row[0] else ""
+
+    def get_reflections(self, start, end):
+        """
+        Gibt alle nicht leeren Einträge von ``start`` bis ``end`` (einschließlich) nach Datum zurück.
+        """
+        return self.connection().execute(
+            "SELECT date, text FROM reflections WHERE date BETWEEN ? AND ? AND text != '' ORDER BY date",
+            (start, end),
+        ).fetchall()
+
+    def search_reflections(self, query, limit=50):
+        """
+        Volltextsuche über alle Einträge, nach Relevanz (BM25) sortiert.
+        """
+        match = fts_query(query)
+        if not match:
+            return []
+        return self.connection().execute(
+            "SELECT r.date, r.text, snippet(reflections_fts, 0, '»', '«', '…', 12) "
+            "FROM reflections_fts JOIN reflections r ON r.id = reflections_fts.rowid "
+            "WHERE reflections_fts MATCH ? ORDER BY bm25(reflections_fts), r.date DESC LIMIT ?",
+            (match, limit),
+        ).fetchall()
+
+_repository = None
+_repository_lock = threading.Lock()
+
+def get_reflection_repository():
+    """
+    Gibt das gemeinsame Repository für ``DB_PATH`` zurück (neu, falls sich der Pfad geändert hat).
+    """
+    global _repository
+    with _repository_lock:
+        if _repository is None or _repository.db_path != DB_PATH:
+            if _repository is not None:
+                _repository.close()
+            _repository = ReflectionRepository(DB_PATH)
+        return _repository
+
+def close_reflection_db():
+    """
+    Schließt die Verbindungen zur Reflexions-Datenbank.
+    """
+    global _repository
+    with _repository_lock:
+        repo, _repository = _repository, None
+    if repo is not None:
+        repo.close()
+
+atexit.register(close_reflection_db)
+
+def init_reflection_db():
+    """
+    Initialisiert die Datenbank für Reflexionen und führt ausstehende Migrationen aus.
+    """
+    close_reflection_db()
+    get_reflection_repository().migrate()
+
+def save_reflection(date, text):
+    """
+    Speichert oder aktualisiert eine Reflexion für ein bestimmtes Datum.
+
+    Args:
+        date (str): Das Datum im Format 'YYYY-MM-DD'.
+        text (str): Der Reflexionstext.
+    """
+    get_reflection_repository().save_reflection(date, text)
+
+def save_reflections(entries):
+    """
+    Speichert mehrere Reflexionen in einer Transaktion (z.B. aus dem Autosave).
+
+    Args:
+        entries (iterable): (date, text)-Paare.
+    """
+    get_reflection_repository().save_reflections(entries)
+
+def load_reflection(date):
+    """
+    Lädt die Reflexion für ein bestimmtes Datum.
+
+    Args:
+        date (str): Das Datum im Format 'YYYY-MM-DD'.
+
+    Returns:
+        str: Der gespeicherte Reflexionstext oder ein leerer String.
+    """
+    return get_reflection_repository().load_reflection(date)
+
+def get_reflections(start, end):
+    """
+    Lädt alle Einträge eines Zeitraums (z.B. Woche oder Monat) mit einer Abfrage.
+
+    Args:
+        start (str): Erstes Datum ('YYYY-MM-DD').
+        end (str): Letztes Datum ('YYYY-MM-DD'), einschließlich.
+
+    Returns:
+        list: [(date, text), ...] nach Datum sortiert, leere Einträge ausgenommen.
+    """
+    return get_reflection_repository().get_reflections(start, end)
+
+def search_reflections(query, limit=50):
+    """
+    Durchsucht alle Reflexionen (FTS5, Wörter als Präfix, alle müssen vorkommen).
+
+    Args:
+        query (str): Suchtext.
+        limit (int): Maximale Anzahl Treffer.
+
+    Returns:
+        list: [(date, text, snippet), ...], beste Treffer zuerst; im Ausschnitt
+        sind Fundstellen mit »…« markiert.
+    """
+    return get_reflection_repository().search_reflections(query, limit)
+
+perf.instrument(globals(), "reflection_db", skip=("get_reflection_repository",))
@@ -0,0 +1,247 @@
+from PyQt6.QtCore import QObject, pyqtSignal
+from logic import tasks_db
+
+# Ab so vielen geänderten Aufgaben meldet sync() einen Reset statt einzelner IDs:
+# ein kompletter Neuaufbau der Seiten ist dann billiger als Einzel-Updates.
+SYNC_RESET_THRESHOLD = 1000
+
+def task_sort_key(task):
+    """
+    Sortierschlüssel wie in ``query_tasks(order_by="due_date")``: Fälligkeit, ohne Datum ans Ende.
+    """
+    return (task[3] is None, task[3] or "", task[0])
+
+class TaskStore(QObject):
+    """
+    Gemeinsamer Zwischenspeicher aller Aufgaben für die Oberfläche.
+
+    Die Tabelle wird beim ersten Zugriff einmal gelesen und danach nur noch
+    durch Schreibzugriffe über den Store aktualisiert. Lookups per ID sind
+    O(1), die Status-Listen werden erst bei Bedarf (neu) sortiert. Seiten
+    hören auf ``tasks_changed`` bzw. ``tasks_reset`` statt selbst neu zu laden.
+    Änderungen anderer Schreiber (Import, Kommandozeile) holt ``sync()``
+    über das Änderungsprotokoll der Datenbank nach.
+    """
+    tasks_changed = pyqtSignal(list)  # IDs neuer, geänderter oder gelöschter Aufgaben
+    tasks_reset = pyqtSignal()        # Bestand komplett neu geladen (z.B. nach Import)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._repo = None
+        self._by_id = {}
+        self._views = {}
+        # Zuletzt abgeglichene Revision des Änderungsprotokolls; schon beim Anlegen
+        # festhalten, damit sync() Änderungen bis zum ersten Abgleich nicht verpasst
+        self._rev = tasks_db.get_revision()
+
+    def _is_loaded(self):
+        # Ein neues Repository (anderer DB_PATH, init_db) macht den Cache ungültig
+        return self._repo is not None and self._repo is tasks_db.get_repository()
+
+    def _ensure_loaded(self):
+        if not self._is_loaded():
+            self._repo = tasks_db.get_repository()
+            # Revision und Bestand aus derselben Lesetransaktion
+            with self._repo.transaction():
+                self._rev = tasks_db.get_revision()
+                self._by_id = {t[0]: t for t in tasks_db.get_tasks()}
+            self._views = {}
+
+    def reload(self):
+        """
+        Liest alle Aufgaben neu ein und meldet ``tasks_reset`` (nach Änderungen außerhalb des Stores).
+        """
+        self._repo = None
+        self._ensure_loaded()
+        self.tasks_reset.emit()
+
+    def sync(self):
+        """
+        Übernimmt Änderungen seit dem letzten Abgleich, ohne die Tabelle neu zu lesen.
+
+        Solange noch nichts geladen ist, wird nur bei einer neuen Revision
+        seit dem letzten Abgleich (bzw. seit dem Anlegen des Stores)
+        ``tasks_reset`` gemeldet (z.B. für die Kennzahlen im Dashboard). Ist
+        das Protokoll bereits aufgeräumt, wird komplett neu geladen. Ohne
+        neue Revision bleibt es bei einer einzigen kleinen Abfrage.
+
+        Returns:
+            list: IDs der Aufgaben, die sich im Cache geändert haben.
+        """
+        if not self._is_loaded():
+            rev = tasks_db.get_revision()
+            if rev != self._rev:
+                self._rev = rev
+                self.tasks_reset.emit()
+            return []
+        if tasks_db.get_revision() == self._rev:
+            return []
+        delta = tasks_db.get_changes_since(self._rev)
+        if not delta["complete"]:
+            self.reload()
+            return list(self._by_id)
+        self._rev = delta["rev"]
+        changed_ids = []
+        for task in delta["changed"]:
+            # Eigene Schreibzugriffe stehen schon im Cache
+            if self._by_id.get(task[0]) != task:
+                self._put(task)
+                changed_ids.append(task[0])
+        for task_id in delta["deleted"]:
+            old = self._by_id.pop(task_id, None)
+            if old is not None:
+                self._views.pop(old[2], None)
+                changed_ids.append(task_id)
+        if len(changed_ids) > SYNC_RESET_THRESHOLD:
+            self.tasks_reset.emit()
+        elif changed_ids:
+            self.tasks_changed.emit(changed_ids)
+        return changed_ids
+
+    def get(self, task_id):
+        """
+        Gibt die Aufgabe mit ``task_id`` zurück oder None.
+        """
+        self._ensure_loaded()
+        return self._by_id.get(task_id)
+
+    def get_many(self, task_ids):
+        """
+        Gibt die Aufgaben zu ``task_ids`` als Dict {id: Aufgabe} zurück; gelöschte fehlen.
+
+        Anders als ``get()`` lädt das nicht die ganze Tabelle: ist der Cache
+        noch leer (z.B. nur die seitenweise geladene Aufgaben-Seite offen),
+        werden nur diese IDs abgefragt.
+        """
+        task_ids = list(task_ids)
+        if self._is_loaded():
+            return {task_id: self._by_id[task_id] for task_id in task_ids if task_id in self._by_id}
+        if not task_ids:
+            return {}
+        return {task[0]: task for task in tasks_db.get_tasks_by_ids(task_ids)}
+
+    def tasks(self):
+        """
+        Gibt alle Aufgaben zurück (ohne feste Reihenfolge).
+        """
+        self._ensure_loaded()
+        return list(self._by_id.values())
+
+    def by_status(self, status):
+        """
+        Gibt die Aufgaben eines Status nach Fälligkeit sortiert zurück.
+        """
+        self._ensure_loaded()
+        view = self._views.get(status)
+        if view is None:
+            view = sorted((t for t in self._by_id.values() if t[2] == status), key=task_sort_key)
+            self._views[status] = view
+        return view
+
+    def _put(self, task):
+        old = self._by_id.get(task[0])
+        if old is not None:
+            self._views.pop(old[2], None)
+        self._views.pop(task[2], None)
+        self._by_id[task[0]] = task
+
+    def _update(self, task_id, **changes):
+        """
+        Übernimmt einen Schreibzugriff in den Cache, ohne die Zeile neu zu lesen.
+        """
+        if not self._is_loaded():
+            return
+        old = self._by_id.get(task_id)
+        if old is None:
+            return
+        fields = dict(zip(("id", "title", "status", "due_date", "start_date", "end_date", "description"), old))
+        fields.update(changes)
+        self._put(tuple(fields.values()))
+
+    def add_task(self, title, status="To Do", due_date=None, start_date=None, end_date=None, description=None):
+        """
+        Legt eine Aufgabe an und meldet sie.
+
+        Returns:
+            int: ID der neuen Aufgabe.
+        """
+        task_id = tasks_db.add_task(title, status, due_date, start_date, end_date, description)
+        if self._is_loaded():
+            self._put((task_id, title, status, due_date, start_date, end_date, description))
+        self.tasks_changed.emit([task_id])
+        return task_id
+
+    def move_task(self, task_id, status):
+        """
+        Ändert den Status einer Aufgabe.
+        """
+        self.move_tasks([task_id], status)
+
+    def move_tasks(self, task_ids, status):
+        """
+        Ändert den Status mehrerer Aufgaben in einer Transaktion; meldet sie mit einem Signal.
+        """
+        task_ids = list(task_ids)
+        if not task_ids:
+            return
+        tasks_db.move_tasks(task_ids, status)
+        for task_id in task_ids:
+            self._update(task_id, status=status)
+        self.tasks_changed.emit(task_ids)
+
+    def edit_task(self, task_id, title, start_date=None, end_date=None, description=None):
+        """
+        Bearbeitet Titel, Zeitraum und optional die Beschreibung einer Aufgabe.
+        """
+        self.edit_tasks([(task_id, title, start_date, end_date, description)])
+
+    def edit_tasks(self, edits):
+        """
+        Bearbeitet mehrere Aufgaben in einer Transaktion; meldet sie mit einem Signal.
+
+        Args:
+            edits (iterable): Tupel (task_id, title, start_date, end_date, description);
+                description None lässt die Beschreibung unverändert.
+        """
+        edits = list(edits)
+        if not edits:
+            return
+        tasks_db.edit_tasks(edits)
+        for task_id, title, start_date, end_date, description in edits:
+            changes = {"title": title, "start_date": start_date, "end_date": end_date}
+            if description is not None:
+                changes["description"] = description
+            self._update(task_id, **changes)
+        self.tasks_changed.emit([edit[0] for edit in edits])
+
+    def delete_task(self, task_id):
+        """
+        Löscht eine Aufgabe.
+        """
+        self.delete_tasks([task_id])
+
+    def delete_tasks(self, task_ids):
+        """
+        Löscht mehrere Aufgaben in einer Transaktion; meldet sie mit einem Signal.
+        """
+        task_ids = list(task_ids)
+        if not task_ids:
+            return
+        tasks_db.delete_tasks(task_ids)
+        if self._is_loaded():
+            for task_id in task_ids:
+                old = self._by_id.pop(task_id, None)
+                if old is not None:
+                    self._views.pop(old[2], None)
+        self.tasks_changed.emit(task_ids)
+
+_store = None
+
+def get_task_store():
+    """
+    Gibt den gemeinsamen TaskStore der Anwendung zurück.
+    """
+    global _store
+    if _store is None:
+        _store = TaskStore()
+    return _store
@@ -1,54 +1,792 @@
 from logic.tasks_db import *
 import sqlite3
 import csv
-from reportlab.lib.pagesizes import A4
-from reportlab.pdfgen import canvas
+import gzip
+import hmac
+import io
+import itertools
+import os
+import re
+import secrets
+import atexit
+import threading
+import weakref
+from contextlib import contextmanager
+from logic import auth, perf
 
 DB_PATH = "tasks.db"
 
-def init_db():
+SELECT_TASKS_SQL = "SELECT id, title, status, due_date, start_date, end_date, description FROM tasks"
+# Laufzeit-PRAGMAs für jede neue Verbindung. WAL erlaubt Lesern (Gantt,
+# Dashboard) parallel zu einem Schreiber zu arbeiten.
+CONNECTION_PRAGMAS = (
+    ("journal_mode", "WAL"),
+    ("synchronous", "NORMAL"),
+    ("temp_store", "MEMORY"),
+    ("cache_size", -16000),        # negativ = KiB, also ca. 16 MB Page-Cache
+    ("mmap_size", 64 * 1024 * 1024),
+    ("foreign_keys", "ON"),
+)
+
+# Zeilen pro executemany-Block beim CSV-Import
+CSV_IMPORT_CHUNK_SIZE = 1000
+# Zeilen pro fetchmany beim Streamen (Exporte)
+FETCH_BATCH_SIZE = 1000
+
+# Zeilen pro Seite beim seitenweisen Laden der Kanban-Spalten
+TASK_PAGE_SIZE = 200
+# IDs pro Abfrage bei get_tasks_by_ids (unter dem Parameterlimit älterer SQLite-Versionen)
+ID_LOOKUP_CHUNK_SIZE = 500
+
+# Erlaubte Sortierungen für query_tasks(); Aufgaben ohne Datum kommen ans Ende.
+TASK_ORDERINGS = {
+    "due_date": "due_date IS NULL, due_date, id",
+    "start_date": "start_date IS NULL, start_date, id",
+    "title": "title, id",
+    "id": "id",
+}
+
+def _task_filter_sql(status=None, start_from=None, start_to=None):
     """
-    Initialisiert die Aufgaben-Datenbank und führt ggf. Migrationen durch.
+    Baut die WHERE-Klausel für gefilterte Aufgabenabfragen.
+
+    Aufgaben ohne Startdatum fallen nie aus dem Datumsfilter heraus.
+
+    Returns:
+        tuple: (sql, params) – ``sql`` ist leer, wenn nicht gefiltert wird.
     """
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    # Migration: Spalten hinzufügen, falls sie fehlen
-    c.execute("PRAGMA table_info(tasks)")
-    columns = [col[1] for col in c.fetchall()]
-    if "description" not in columns:
-        try:
-            c.execute("ALTER TABLE tasks ADD COLUMN description TEXT")
-        except sqlite3.OperationalError:
-            pass
-    # Tabelle anlegen (falls noch nicht vorhanden)
-    c.execute("""
+    clauses = []
+    params = []
+    if status is not None:
+        clauses.append("status = ?")
+        params.append(status)
+    if start_from is not None or start_to is not None:
+        if start_from is not None and start_to is not None:
+            date_sql = "start_date BETWEEN ? AND ?"
+            params += [start_from, start_to]
+        elif start_from is not None:
+            date_sql = "start_date >= ?"
+            params.append(start_from)
+        else:
+            date_sql = "start_date <= ?"
+            params.append(start_to)
+        clauses.append(f"(start_date IS NULL OR start_date = '' OR {date_sql})")
+    if not clauses:
+        return "", params
+    return " WHERE " + " AND ".join(clauses), params
+
+def _and_where(where, clause):
+    """
+    Hängt ``clause`` an eine (evtl. leere) WHERE-Klausel aus ``_task_filter_sql`` an.
+    """
+    return f"{where} AND {clause}" if where else f" WHERE {clause}"
+
+def _task_order_sql(order_by):
+    """
+    Gibt die ORDER-BY-Klausel für ``order_by`` zurück.
+    """
+    if order_by is None:
+        return ""
+    try:
+        return " ORDER BY " + TASK_ORDERINGS[order_by]
+    except KeyError:
+        raise ValueError(f"Unbekannte Sortierung: {order_by!r}") from None
+
+# Treffer im Titel zählen bei der Sortierung zehnmal so viel wie in der Beschreibung.
+# Gerankt werden höchstens SEARCH_RANK_CANDIDATES Treffer: bei Allerweltswörtern
+# (z.B. beim ersten Buchstaben der inkrementellen Suche) wäre BM25 über
+# zehntausende Zeilen sonst hunderte Millisekunden langsam.
+SEARCH_RANK_CANDIDATES = 2000
+SEARCH_TASKS_SQL = (
+    "SELECT t.id, t.title, t.status, t.due_date, t.start_date, t.end_date, t.description "
+    "FROM (SELECT rowid, bm25(tasks_fts, 10.0, 1.0) AS score FROM tasks_fts WHERE tasks_fts MATCH ? LIMIT ?) m "
+    "JOIN tasks t ON t.id = m.rowid ORDER BY m.score, t.id LIMIT ?"
+)
+
+def fts_query(text):
+    """
+    Wandelt eine Sucheingabe in eine FTS5-Abfrage um.
+
+    Jedes Wort wird als Präfix gesucht ("ent" findet "Entwurf"), alle Wörter
+    müssen vorkommen. Sonderzeichen der FTS5-Syntax werden nicht
+    durchgereicht, Eingaben wie ``"`` oder ``AND`` führen also nicht zu
+    Syntaxfehlern.
+
+    Returns:
+        str: FTS5-Ausdruck oder "" für eine leere Eingabe.
+    """
+    return " ".join(f'"{word}"*' for word in re.findall(r"\w+", text))
+
+INSERT_TASK_SQL = (
+    "INSERT INTO tasks (title, status, due_date, start_date, end_date, description) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+def _migrate_tasks_table(conn):
+    """
+    Migration 1: Tabelle ``tasks`` inkl. Spalte ``description``.
+
+    Ältere Datenbanken haben die Tabelle bereits, aber ohne Beschreibung.
+    """
+    conn.execute("""
         CREATE TABLE IF NOT EXISTS tasks (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             title TEXT NOT NULL,
             status TEXT NOT NULL,
             due_date TEXT,
             start_date TEXT,
-            end_date TEXT
+            end_date TEXT,
+            description TEXT
         )
     """)
-    conn.commit()
-    conn.close()
+    columns = [col[1] for col in conn.execute("PRAGMA table_info(tasks)")]
+    if "description" not in columns:
+        conn.execute("ALTER TABLE tasks ADD COLUMN description TEXT")
 
-def init_user_db():
+def _migrate_users_table(conn):
     """
-    Initialisiert die User-Datenbank (Tabelle users).
+    Migration 2: Tabelle ``users``.
     """
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("""
+    conn.execute("""
         CREATE TABLE IF NOT EXISTS users (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             username TEXT UNIQUE NOT NULL,
             password TEXT NOT NULL
         )
     """)
-    conn.commit()
-    conn.close()
+
+def _migrate_task_indexes(conn):
+    """
+    Migration 3: Indizes für die gefilterten Kanban-Abfragen.
+    """
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status_start ON tasks (status, start_date)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status_due ON tasks (status, due_date)")
+
+def _migrate_task_search(conn):
+    """
+    Migration 4: FTS5-Volltextindex über Titel und Beschreibung.
+
+    ``tasks_fts`` ist eine External-Content-Tabelle: sie speichert nur den
+    Index, die Texte bleiben in ``tasks``. Trigger halten den Index bei
+    INSERT, UPDATE und DELETE synchron; vorhandene Zeilen werden einmal
+    über ``rebuild`` indiziert.
+    """
+    conn.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+            title, description,
+            content='tasks', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+            INSERT INTO tasks_fts (rowid, title, description) VALUES (new.id, new.title, new.description);
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+            INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+            VALUES ('delete', old.id, old.title, old.description);
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN
+            INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+            VALUES ('delete', old.id, old.title, old.description);
+            INSERT INTO tasks_fts (rowid, title, description) VALUES (new.id, new.title, new.description);
+        END
+    """)
+    conn.execute("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')")
+
+def _migrate_task_changes(conn):
+    """
+    Migration 5: Änderungsprotokoll ``task_changes`` für inkrementelle Abgleiche.
+
+    Trigger schreiben bei jedem INSERT, DELETE und jedem UPDATE, das
+    tatsächlich einen Wert ändert, eine Zeile mit fortlaufender Revision
+    (``AUTOINCREMENT``: Revisionen werden auch nach dem Aufräumen nie
+    wiederverwendet). Gespeichert wird nur die ID; den aktuellen Stand liest
+    ``get_changes_since`` aus ``tasks``.
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS task_changes (
+            rev INTEGER PRIMARY KEY AUTOINCREMENT,
+            task_id INTEGER NOT NULL,
+            op TEXT NOT NULL
+        )
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS task_changes_insert AFTER INSERT ON tasks BEGIN
+            INSERT INTO task_changes (task_id, op) VALUES (new.id, 'insert');
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS task_changes_update AFTER UPDATE ON tasks
+        WHEN old.title IS NOT new.title OR old.status IS NOT new.status OR old.due_date IS NOT new.due_date
+            OR old.start_date IS NOT new.start_date OR old.end_date IS NOT new.end_date
+            OR old.description IS NOT new.description
+        BEGIN
+            INSERT INTO task_changes (task_id, op) VALUES (new.id, 'update');
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS task_changes_delete AFTER DELETE ON tasks BEGIN
+            INSERT INTO task_changes (task_id, op) VALUES (old.id, 'delete');
+        END
+    """)
+
+def _migrate_user_password_hashes(conn):
+    """
+    Migration 6: Spalte ``password_hash`` für gesalzene Passwort-Hashes.
+
+    Vorhandene Klartext-Passwörter bleiben vorerst in ``password`` stehen,
+    ohne das Passwort lässt sich kein Hash berechnen. ``check_user``
+    ersetzt sie beim nächsten erfolgreichen Login und leert ``password``.
+    """
+    columns = [col[1] for col in conn.execute("PRAGMA table_info(users)")]
+    if "password_hash" not in columns:
+        conn.execute("ALTER TABLE users ADD COLUMN password_hash TEXT")
+
+# Nummerierte Migrationen: Eintrag i hebt ``PRAGMA user_version`` auf i + 1.
+# Neue Migrationen nur hinten anhängen, bestehende nie ändern.
+MIGRATIONS = [
+    _migrate_tasks_table,
+    _migrate_users_table,
+    _migrate_task_indexes,
+    _migrate_task_search,
+    _migrate_task_changes,
+    _migrate_user_password_hashes,
+]
+SCHEMA_VERSION = len(MIGRATIONS)
+
+# So viele Einträge behält das Änderungsprotokoll beim Aufräumen in init_db();
+# wer weiter zurückliegt, bekommt von get_changes_since() ``complete=False``.
+TASK_CHANGES_RETAIN = 100000
+
+# Alle Repositories (auch die von logic.reflection_db), um beim Ein- und
+# Ausschalten der Messung den Trace-Callback offener Verbindungen zu setzen
+_all_repositories = weakref.WeakSet()
+
+def _set_statement_tracing(active):
+    for repo in list(_all_repositories):
+        repo.set_statement_tracing(active)
+
+perf.on_tracing_changed(_set_statement_tracing)
+
+class SQLiteRepository:
+    """
+    Gemeinsame Basis der Datenbank-Zugriffsschichten.
+
+    Hält pro Thread eine langlebige Verbindung offen, statt für jeden Aufruf
+    neu zu verbinden. Gleiche SQL-Strings werden über den Statement-Cache von
+    sqlite3 wiederverwendet, mehrere Schreibzugriffe lassen sich mit
+    ``transaction()`` zu einem Commit bündeln. Unterklassen setzen
+    ``migrations`` auf ihre Liste nummerierter Migrationen.
+    """
+    migrations = []
+
+    def __init__(self, db_path, cached_statements=256):
+        """
+        Args:
+            db_path (str): Pfad zur SQLite-Datei.
+            cached_statements (int): Größe des Prepared-Statement-Caches pro Verbindung.
+        """
+        self.db_path = db_path
+        self.cached_statements = cached_statements
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+        _all_repositories.add(self)
+
+    def connection(self):
+        """
+        Gibt die Verbindung des aktuellen Threads zurück und legt sie bei Bedarf an.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # isolation_level=None: Transaktionen steuern wir selbst über transaction();
+            # TracingConnection trennt für die Messung echte Wiederholungen von Trigger-Echos
+            conn = sqlite3.connect(
+                self.db_path,
+                isolation_level=None,
+                check_same_thread=False,
+                cached_statements=self.cached_statements,
+                factory=perf.TracingConnection,
+            )
+            for name, value in CONNECTION_PRAGMAS:
+                conn.execute(f"PRAGMA {name}={value}")
+            if perf.tracing():
+                conn.set_trace_callback(perf.trace_statement)
+            self._local.conn = conn
+            self._local.depth = 0
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def transaction(self, immediate=False):
+        """
+        Kontextmanager für eine Transaktion auf der Thread-Verbindung.
+
+        Verschachtelte Aufrufe werden als SAVEPOINT ausgeführt, sodass nur der
+        äußerste Block committet. Bei einer Exception wird zurückgerollt.
+
+        Args:
+            immediate (bool): Schreibsperre sofort holen (``BEGIN IMMEDIATE``).
+        """
+        conn = self.connection()
+        depth = self._local.depth
+        if depth == 0:
+            conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+        else:
+            conn.execute(f"SAVEPOINT sp_{depth}")
+        self._local.depth = depth + 1
+        try:
+            yield conn
+        except BaseException:
+            if depth == 0:
+                conn.execute("ROLLBACK")
+            else:
+                conn.execute(f"ROLLBACK TO sp_{depth}")
+                conn.execute(f"RELEASE sp_{depth}")
+            raise
+        else:
+            if depth == 0:
+                conn.execute("COMMIT")
+            else:
+                conn.execute(f"RELEASE sp_{depth}")
+        finally:
+            self._local.depth = depth
+
+    def schema_version(self):
+        """
+        Gibt die aktuelle Schema-Version (``PRAGMA user_version``) zurück.
+        """
+        return self.connection().execute("PRAGMA user_version").fetchone()[0]
+
+    def migrate(self):
+        """
+        Führt alle noch nicht angewendeten Migrationen aus.
+
+        Jede Migration läuft in einer eigenen Transaktion und setzt danach
+        ``user_version``; bereits migrierte Datenbanken werden nicht angefasst.
+
+        Returns:
+            int: Schema-Version nach der Migration.
+        """
+        target = len(self.migrations)
+        version = self.schema_version()
+        while version < target:
+            with self.transaction(immediate=True) as conn:
+                # Erneut lesen: ein anderer Prozess könnte schneller gewesen sein
+                version = conn.execute("PRAGMA user_version").fetchone()[0]
+                if version >= target:
+                    break
+                self.migrations[version](conn)
+                version += 1
+                conn.execute(f"PRAGMA user_version={version}")
+        return version
+
+    def set_statement_tracing(self, active):
+        """
+        Meldet ``logic.perf.trace_statement`` auf allen offenen Verbindungen an bzw. ab.
+        """
+        with self._lock:
+            for conn in self._connections:
+                conn.set_trace_callback(perf.trace_statement if active else None)
+
+    def close(self):
+        """
+        Schließt alle Verbindungen, die dieses Repository geöffnet hat.
+        """
+        with self._lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.ProgrammingError:
+                pass
+
+class TaskRepository(SQLiteRepository):
+    """
+    Zugriffsschicht auf die Aufgaben-Datenbank.
+    """
+    migrations = MIGRATIONS
+
+    def __init__(self, db_path="tasks.db", cached_statements=256):
+        super().__init__(db_path, cached_statements)
+
+    def get_tasks(self):
+        """
+        Gibt alle Aufgaben als Liste von Tupeln zurück.
+        """
+        return self.connection().execute(SELECT_TASKS_SQL).fetchall()
+
+    def get_task(self, task_id):
+        """
+        Gibt eine Aufgabe anhand ihrer ID zurück oder None.
+        """
+        return self.connection().execute(SELECT_TASKS_SQL + " WHERE id = ?", (task_id,)).fetchone()
+
+    def get_tasks_by_ids(self, task_ids):
+        """
+        Gibt die vorhandenen Aufgaben zu ``task_ids`` zurück (eine Abfrage je 500 IDs).
+        """
+        task_ids = list(task_ids)
+        tasks = []
+        for i in range(0, len(task_ids), ID_LOOKUP_CHUNK_SIZE):
+            chunk = task_ids[i:i + ID_LOOKUP_CHUNK_SIZE]
+            placeholders = ", ".join("?" * len(chunk))
+            tasks.extend(
+                self.connection().execute(SELECT_TASKS_SQL + f" WHERE id IN ({placeholders})", chunk).fetchall()
+            )
+        return tasks
+
+    def query_tasks(self, status=None, start_from=None, start_to=None, order_by="due_date", limit=None):
+        """
+        Gibt gefilterte und sortierte Aufgaben zurück; Filter und Sortierung laufen in SQLite.
+        """
+        where, params = _task_filter_sql(status, start_from, start_to)
+        sql = SELECT_TASKS_SQL + where + _task_order_sql(order_by)
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return self.connection().execute(sql, params).fetchall()
+
+    def query_task_page(self, status=None, start_from=None, start_to=None, after=None, limit=TASK_PAGE_SIZE):
+        """
+        Liest eine Seite gefilterter Aufgaben nach (due_date, id) per Keyset-Pagination.
+
+        Statt OFFSET setzt jede Seite hinter dem Schlüssel der letzten Zeile
+        fort, jede Seite kostet also gleich viel. Aufgaben mit Fälligkeit
+        kommen über den Index (status, due_date) in Reihenfolge, danach die
+        ohne Fälligkeit nach ID – wie ``query_tasks(order_by="due_date")``.
+        """
+        where, params = _task_filter_sql(status, start_from, start_to)
+        conn = self.connection()
+        rows = []
+        if after is None or after[0] is not None:
+            clause = "due_date IS NOT NULL"
+            page_params = list(params)
+            if after is not None:
+                clause += " AND (due_date, id) > (?, ?)"
+                page_params += after
+            rows = conn.execute(
+                SELECT_TASKS_SQL + _and_where(where, clause) + " ORDER BY due_date, id LIMIT ?",
+                page_params + [limit],
+            ).fetchall()
+            if len(rows) == limit:
+                return rows
+            after = (None, 0)
+        rows += conn.execute(
+            SELECT_TASKS_SQL + _and_where(where, "due_date IS NULL AND id > ?") + " ORDER BY id LIMIT ?",
+            params + [after[1], limit - len(rows)],
+        ).fetchall()
+        return rows
+
+    def get_task_stats(self):
+        """
+        Zählt Aufgaben pro Status und ermittelt die nächste Fälligkeit.
+
+        Eine GROUP-BY-Abfrage über den Index (status, due_date) liefert Anzahl
+        und früheste Fälligkeit je Status; die zugehörige Aufgabe wird danach
+        gezielt über denselben Index gelesen.
+        """
+        conn = self.connection()
+        rows = conn.execute(
+            "SELECT status, COUNT(*), MIN(NULLIF(due_date, '')) FROM tasks GROUP BY status"
+        ).fetchall()
+        by_status = {status: count for status, count, _ in rows}
+        next_due = None
+        due_dates = [due for _, _, due in rows if due is not None]
+        if due_dates:
+            earliest = min(due_dates)
+            statuses = [status for status, _, due in rows if due == earliest]
+            placeholders = ", ".join("?" * len(statuses))
+            next_due = conn.execute(
+                f"SELECT id, title, due_date FROM tasks WHERE status IN ({placeholders}) AND due_date = ? "
+                "ORDER BY id LIMIT 1",
+                (*statuses, earliest),
+            ).fetchone()
+        return {"total": sum(by_status.values()), "by_status": by_status, "next_due": next_due}
+
+    def search_tasks(self, query, limit=50):
+        """
+        Volltextsuche über Titel und Beschreibung, nach Relevanz (BM25) sortiert.
+        """
+        match = fts_query(query)
+        if not match:
+            return []
+        candidates = max(limit, SEARCH_RANK_CANDIDATES)
+        return self.connection().execute(SEARCH_TASKS_SQL, (match, candidates, limit)).fetchall()
+
+    def iter_task_batches(self, status=None, start_from=None, start_to=None, order_by="id",
+                          batch_size=FETCH_BATCH_SIZE):
+        """
+        Liefert gefilterte Aufgaben blockweise per ``fetchmany``.
+
+        Yields:
+            list: Bis zu ``batch_size`` Aufgaben-Tupel.
+        """
+        where, params = _task_filter_sql(status, start_from, start_to)
+        cur = self.connection().execute(SELECT_TASKS_SQL + where + _task_order_sql(order_by), params)
+        try:
+            while True:
+                batch = cur.fetchmany(batch_size)
+                if not batch:
+                    break
+                yield batch
+        finally:
+            cur.close()
+
+    def get_revision(self):
+        """
+        Gibt die Revision der letzten protokollierten Änderung zurück (0 = noch keine).
+        """
+        row = self.connection().execute(
+            "SELECT seq FROM sqlite_sequence WHERE name = 'task_changes'"
+        ).fetchone()
+        return row[0] if row else 0
+
+    def get_changes_since(self, rev):
+        """
+        Gibt alle seit Revision ``rev`` geänderten Aufgaben zusammengefasst zurück.
+
+        Mehrere Änderungen derselben Aufgabe ergeben einen Eintrag mit ihrem
+        aktuellen Stand. Revision und Änderungen stammen aus derselben
+        Lesetransaktion und passen damit zusammen.
+        """
+        with self.transaction() as conn:
+            current = self.get_revision()
+            oldest = conn.execute("SELECT MIN(rev) FROM task_changes").fetchone()[0]
+            # Alles bis ``floor`` wurde bereits aufgeräumt
+            floor = oldest - 1 if oldest is not None else current
+            if rev < floor:
+                return {"rev": current, "complete": False, "changed": [], "deleted": []}
+            rows = conn.execute(
+                "SELECT c.task_id, t.id, t.title, t.status, t.due_date, t.start_date, t.end_date, t.description "
+                "FROM (SELECT DISTINCT task_id FROM task_changes WHERE rev > ?) c "
+                "LEFT JOIN tasks t ON t.id = c.task_id ORDER BY c.task_id",
+                (rev,),
+            ).fetchall()
+        changed = [row[1:] for row in rows if row[1] is not None]
+        deleted = [row[0] for row in rows if row[1] is None]
+        return {"rev": current, "complete": True, "changed": changed, "deleted": deleted}
+
+    def prune_changes(self, keep=TASK_CHANGES_RETAIN):
+        """
+        Löscht alle bis auf die neuesten ``keep`` Einträge des Änderungsprotokolls.
+
+        Returns:
+            int: Anzahl gelöschter Einträge.
+        """
+        with self.transaction() as conn:
+            cur = conn.execute("DELETE FROM task_changes WHERE rev <= ?", (self.get_revision() - keep,))
+        return cur.rowcount
+
+    def add_task(self, title, status="To Do", due_date=None, start_date=None, end_date=None, description=None):
+        """
+        Fügt eine neue Aufgabe hinzu.
+
+        Returns:
+            int: ID der neuen Aufgabe.
+        """
+        with self.transaction() as conn:
+            cur = conn.execute(INSERT_TASK_SQL, (title, status, due_date, start_date, end_date, description))
+        return cur.lastrowid
+
+    def add_tasks(self, tasks):
+        """
+        Fügt viele Aufgaben in einer Transaktion hinzu.
+
+        Args:
+            tasks (iterable): Tupel (title, status, due_date, start_date, end_date, description).
+        """
+        with self.transaction() as conn:
+            conn.executemany(INSERT_TASK_SQL, tasks)
+
+    def update_task_status(self, task_id, status):
+        """
+        Aktualisiert den Status einer Aufgabe.
+
+        Returns:
+            int: Anzahl geänderter Zeilen (0, falls es die Aufgabe nicht gibt).
+        """
+        return self.move_tasks([task_id], status)
+
+    def move_tasks(self, task_ids, status):
+        """
+        Setzt den Status vieler Aufgaben mit einem ``executemany`` in einer Transaktion.
+
+        Returns:
+            int: Anzahl geänderter Zeilen.
+        """
+        with self.transaction() as conn:
+            cur = conn.executemany("UPDATE tasks SET status=? WHERE id=?", ((status, i) for i in task_ids))
+        return cur.rowcount
+
+    def delete_task(self, task_id):
+        """
+        Löscht eine Aufgabe anhand ihrer ID.
+        """
+        self.delete_tasks([task_id])
+
+    def delete_tasks(self, task_ids):
+        """
+        Löscht viele Aufgaben in einer Transaktion.
+
+        Returns:
+            int: Anzahl gelöschter Zeilen.
+        """
+        with self.transaction() as conn:
+            cur = conn.executemany("DELETE FROM tasks WHERE id=?", ((i,) for i in task_ids))
+        return cur.rowcount
+
+    def edit_task(self, task_id, new_title, new_start_date=None, new_end_date=None, new_description=None):
+        """
+        Bearbeitet eine Aufgabe (Titel, Start-/Enddatum, Beschreibung).
+        """
+        self.edit_tasks([(task_id, new_title, new_start_date, new_end_date, new_description)])
+
+    def edit_tasks(self, edits):
+        """
+        Bearbeitet viele Aufgaben in einer Transaktion.
+
+        Args:
+            edits (iterable): Tupel (task_id, title, start_date, end_date, description);
+                description None lässt die Beschreibung unverändert.
+
+        Returns:
+            int: Anzahl geänderter Zeilen.
+        """
+        with self.transaction() as conn:
+            cur = conn.executemany(
+                "UPDATE tasks SET title=?, start_date=?, end_date=?, description=COALESCE(?, description) "
+                "WHERE id=?",
+                ((title, start, end, description, task_id) for task_id, title, start, end, description in edits),
+            )
+        return cur.rowcount
+
+    def check_user(self, username, password):
+        """
+        Prüft, ob ein Benutzer mit den angegebenen Zugangsdaten existiert.
+
+        Gespeicherte Klartext-Passwörter und Hashes mit veralteten Kosten
+        werden nach erfolgreicher Prüfung durch einen neuen Hash ersetzt.
+        """
+        row = self.connection().execute(
+            "SELECT password, password_hash FROM users WHERE username=?", (username,)
+        ).fetchone()
+        if row is None:
+            # Gleiche Laufzeit wie bei falschem Passwort: verrät nicht, ob es den Namen gibt
+            auth.verify_password(password, _dummy_password_hash())
+            return False
+        plaintext, stored = row
+        if stored:
+            if not auth.verify_password(password, stored):
+                return False
+            if not auth.needs_rehash(stored):
+                return True
+        elif not hmac.compare_digest(plaintext.encode("utf-8"), password.encode("utf-8")):
+            return False
+        self.set_password(username, password)
+        return True
+
+    def set_password(self, username, password):
+        """
+        Speichert einen neuen Passwort-Hash und entfernt ein evtl. vorhandenes Klartext-Passwort.
+        """
+        with self.transaction() as conn:
+            conn.execute(
+                "UPDATE users SET password='', password_hash=? WHERE username=?",
+                (auth.hash_password(password), username),
+            )
+
+    def add_user(self, username, password):
+        """
+        Legt einen neuen Benutzer an (nur mit Passwort-Hash).
+
+        Returns:
+            bool: True bei Erfolg, False falls Benutzername existiert.
+        """
+        password_hash = auth.hash_password(password)
+        try:
+            with self.transaction() as conn:
+                conn.execute(
+                    "INSERT INTO users (username, password, password_hash) VALUES (?, '', ?)",
+                    (username, password_hash),
+                )
+        except sqlite3.IntegrityError:
+            return False
+        return True
+
+_dummy_hash = None
+
+def _dummy_password_hash():
+    """
+    Hash eines Zufallspassworts mit den aktuellen Kosten (für unbekannte Benutzernamen).
+    """
+    global _dummy_hash
+    if _dummy_hash is None or auth.needs_rehash(_dummy_hash):
+        _dummy_hash = auth.hash_password(secrets.token_urlsafe())
+    return _dummy_hash
+
+_repositories = {}
+_repositories_lock = threading.Lock()
+
+def get_repository(db_path=None):
+    """
+    Gibt das gemeinsame Repository für ``db_path`` (Standard: ``DB_PATH``) zurück.
+    """
+    path = db_path or DB_PATH
+    with _repositories_lock:
+        repo = _repositories.get(path)
+        if repo is None:
+            repo = _repositories[path] = TaskRepository(path)
+    return repo
+
+def close_db(db_path=None):
+    """
+    Schließt die Verbindungen zu ``db_path`` (Standard: ``DB_PATH``).
+
+    Der nächste Zugriff öffnet automatisch eine neue Verbindung.
+    """
+    with _repositories_lock:
+        repo = _repositories.pop(db_path or DB_PATH, None)
+    if repo is not None:
+        repo.close()
+
+def close_all_db():
+    """
+    Schließt alle offenen Datenbankverbindungen (z.B. beim Beenden).
+    """
+    with _repositories_lock:
+        repos = list(_repositories.values())
+        _repositories.clear()
+    for repo in repos:
+        repo.close()
+
+atexit.register(close_all_db)
+
+def init_db():
+    """
+    Initialisiert die Aufgaben-Datenbank und führt ausstehende Migrationen aus.
+    """
+    # Frisch verbinden, falls die Datei inzwischen ersetzt oder gelöscht wurde
+    close_db()
+    repo = get_repository()
+    repo.migrate()
+    repo.prune_changes()
+
+def init_user_db():
+    """
+    Initialisiert die User-Datenbank (Tabelle users).
+
+    Die Tabelle ist Teil der Migrationen; bereits migrierte Datenbanken
+    kosten hier nur ein ``PRAGMA user_version``.
+    """
+    get_repository().migrate()
 
 def get_tasks():
     """
@@ -56,132 +794,339 @@ def get_tasks():
     Returns:
         list: [(id, title, status, due_date, start_date, end_date, description), ...]
     """
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("SELECT id, title, status, due_date, start_date, end_date, description FROM tasks")
-    tasks = c.fetchall()
-    conn.close()
-    return tasks
+    return get_repository().get_tasks()
+
+def get_task(task_id):
+    """
+    Gibt eine einzelne Aufgabe zurück.
+    Returns:
+        tuple: (id, title, status, due_date, start_date, end_date, description) oder None.
+    """
+    return get_repository().get_task(task_id)
+
+def get_tasks_by_ids(task_ids):
+    """
+    Gibt mehrere Aufgaben anhand ihrer IDs zurück, ohne die ganze Tabelle zu lesen.
+
+    Args:
+        task_ids (iterable): IDs der gesuchten Aufgaben.
+
+    Returns:
+        list: Tupel der gefundenen Aufgaben (ohne feste Reihenfolge); gelöschte fehlen.
+    """
+    return get_repository().get_tasks_by_ids(task_ids)
+
+def query_tasks(status=None, start_from=None, start_to=None, order_by="due_date", limit=None):
+    """
+    Gibt gefilterte Aufgaben zurück, ohne die ganze Tabelle in Python zu laden.
+
+    Args:
+        status (str, optional): Nur Aufgaben mit diesem Status.
+        start_from (str, optional): Frühestes Startdatum ('YYYY-MM-DD').
+        start_to (str, optional): Spätestes Startdatum ('YYYY-MM-DD').
+        order_by (str, optional): Schlüssel aus ``TASK_ORDERINGS`` oder None.
+        limit (int, optional): Maximale Anzahl Zeilen.
+
+    Returns:
+        list: [(id, title, status, due_date, start_date, end_date, description), ...]
+    """
+    return get_repository().query_tasks(status, start_from, start_to, order_by, limit)
+
+def task_page_key(task):
+    """
+    Gibt den Keyset-Schlüssel (due_date, id) einer Aufgabe für ``query_task_page(after=...)`` zurück.
+    """
+    return (task[3], task[0])
+
+def query_task_page(status=None, start_from=None, start_to=None, after=None, limit=TASK_PAGE_SIZE):
+    """
+    Gibt eine Seite gefilterter Aufgaben zurück, sortiert wie ``query_tasks(order_by="due_date")``.
+
+    Args:
+        status, start_from, start_to: Optionale Filter wie bei ``query_tasks``.
+        after (tuple, optional): ``task_page_key()`` der letzten Zeile der vorigen Seite;
+            None für die erste Seite.
+        limit (int): Maximale Anzahl Zeilen; weniger bedeutet, dass keine weiteren folgen.
+
+    Returns:
+        list: [(id, title, status, due_date, start_date, end_date, description), ...]
+    """
+    return get_repository().query_task_page(status, start_from, start_to, after, limit)
+
+def search_tasks(query, limit=50):
+    """
+    Sucht Aufgaben über den FTS5-Index nach Wörtern in Titel und Beschreibung.
+
+    Args:
+        query (str): Suchtext; jedes Wort wird als Präfix gesucht, alle müssen vorkommen.
+        limit (int): Maximale Anzahl Treffer.
+
+    Returns:
+        list: Aufgaben-Tupel, beste Treffer zuerst (Titel-Treffer vor Beschreibungs-Treffern).
+        Bei mehr als ``SEARCH_RANK_CANDIDATES`` Treffern wird nur unter den
+        ersten davon gerankt.
+    """
+    return get_repository().search_tasks(query, limit)
+
+def iter_task_batches(status=None, start_from=None, start_to=None, order_by="id", batch_size=FETCH_BATCH_SIZE):
+    """
+    Liefert gefilterte Aufgaben blockweise, ohne die ganze Tabelle zu laden.
+
+    Yields:
+        list: Bis zu ``batch_size`` Aufgaben-Tupel.
+    """
+    return get_repository().iter_task_batches(status, start_from, start_to, order_by, batch_size)
+
+def get_task_stats():
+    """
+    Gibt Kennzahlen für das Dashboard zurück, ohne alle Aufgaben zu laden.
+
+    Returns:
+        dict: ``total`` (int), ``by_status`` ({status: Anzahl}) und
+        ``next_due`` ((id, title, due_date) der nächsten fälligen Aufgabe oder None).
+    """
+    return get_repository().get_task_stats()
+
+def get_revision():
+    """
+    Gibt die aktuelle Revision des Änderungsprotokolls zurück.
+
+    Returns:
+        int: Revision der letzten Änderung an ``tasks`` (0, falls es noch keine gab).
+    """
+    return get_repository().get_revision()
+
+def get_changes_since(rev):
+    """
+    Liefert die Änderungen an Aufgaben seit Revision ``rev`` (inkrementeller Abgleich).
+
+    Args:
+        rev (int): Zuletzt gesehene Revision, z.B. aus ``get_revision()`` oder
+            dem ``rev`` eines früheren Aufrufs.
+
+    Returns:
+        dict: ``rev`` (neue Revision), ``complete`` (False, falls benötigte
+        Einträge bereits aufgeräumt sind – dann komplett neu laden),
+        ``changed`` (aktuelle Aufgaben-Tupel neuer oder geänderter Aufgaben)
+        und ``deleted`` (IDs gelöschter Aufgaben).
+    """
+    return get_repository().get_changes_since(rev)
 
 def add_task(title, status="To Do", due_date=None, start_date=None, end_date=None, description=None):
     """
     Fügt eine neue Aufgabe hinzu.
     """
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute(
-        "INSERT INTO tasks (title, status, due_date, start_date, end_date, description) VALUES (?, ?, ?, ?, ?, ?)",
-        (title, status, due_date, start_date, end_date, description)
-    )
-    conn.commit()
-    conn.close()
+    return get_repository().add_task(title, status, due_date, start_date, end_date, description)
+
+def add_tasks(tasks):
+    """
+    Fügt viele Aufgaben auf einmal hinzu (ein Commit statt einem pro Aufgabe).
+
+    Args:
+        tasks (iterable): Tupel (title, status, due_date, start_date, end_date, description).
+    """
+    get_repository().add_tasks(tasks)
 
 def update_task_status(task_id, status):
     """
     Aktualisiert den Status einer Aufgabe.
+
+    Returns:
+        int: Anzahl geänderter Zeilen (0, falls es die Aufgabe nicht gibt).
+    """
+    return get_repository().update_task_status(task_id, status)
+
+def move_tasks(task_ids, status):
     """
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("UPDATE tasks SET status=? WHERE id=?", (status, task_id))
-    conn.commit()
-    conn.close()
+    Setzt den Status vieler Aufgaben auf einmal (eine Transaktion, ein ``executemany``).
+
+    Args:
+        task_ids (iterable): IDs der Aufgaben.
+        status (str): Neuer Status.
+
+    Returns:
+        int: Anzahl geänderter Zeilen (unbekannte IDs zählen nicht).
+    """
+    return get_repository().move_tasks(task_ids, status)
 
 def delete_task(task_id):
     """
     Löscht eine Aufgabe anhand ihrer ID.
     """
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("DELETE FROM tasks WHERE id=?", (task_id,))
-    conn.commit()
-    conn.close()
+    get_repository().delete_task(task_id)
+
+def delete_tasks(task_ids):
+    """
+    Löscht viele Aufgaben in einer Transaktion.
+
+    Args:
+        task_ids (iterable): IDs der Aufgaben.
+
+    Returns:
+        int: Anzahl gelöschter Zeilen.
+    """
+    return get_repository().delete_tasks(task_ids)
 
 def edit_task(task_id, new_title, new_start_date=None, new_end_date=None, new_description=None):
     """
     Bearbeitet eine Aufgabe (Titel, Start-/Enddatum, Beschreibung).
     """
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    if new_description is not None:
-        c.execute(
-            "UPDATE tasks SET title=?, start_date=?, end_date=?, description=? WHERE id=?",
-            (new_title, new_start_date, new_end_date, new_description, task_id)
-        )
-    else:
-        c.execute(
-            "UPDATE tasks SET title=?, start_date=?, end_date=? WHERE id=?",
-            (new_title, new_start_date, new_end_date, task_id)
-        )
-    conn.commit()
-    conn.close()
+    get_repository().edit_task(task_id, new_title, new_start_date, new_end_date, new_description)
+
+def edit_tasks(edits):
+    """
+    Bearbeitet viele Aufgaben in einer Transaktion.
+
+    Args:
+        edits (iterable): Tupel (task_id, title, start_date, end_date, description);
+            description None lässt die Beschreibung unverändert.
+
+    Returns:
+        int: Anzahl geänderter Zeilen.
+    """
+    return get_repository().edit_tasks(edits)
 
-def export_tasks_to_csv(filepath="tasks_export.csv"):
+CSV_HEADER = ["ID", "Titel", "Status", "Fälligkeitsdatum", "Startdatum", "Enddatum", "Beschreibung"]
+
+def export_tasks_to_csv(filepath="tasks_export.csv", status=None, start_from=None, start_to=None, compress=None,
+                        progress=None):
+    """
+    Exportiert Aufgaben als CSV-Datei.
+
+    Die Zeilen werden blockweise aus der Datenbank gelesen und sofort
+    geschrieben, der Speicherbedarf hängt also nicht von der Tabellengröße ab.
+
+    Args:
+        filepath (str): Zieldatei.
+        status, start_from, start_to: Optionale Filter wie bei ``query_tasks``.
+        compress (bool, optional): gzip-komprimiert schreiben. Standard: nur bei Endung ``.gz``.
+        progress (callable, optional): ``progress(rows)`` nach jedem Block.
+
+    Returns:
+        int: Anzahl exportierter Aufgaben.
+    """
+    if compress is None:
+        compress = filepath.endswith(".gz")
+    opener = gzip.open if compress else open
+    count = 0
+    try:
+        with opener(filepath, "wt", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_HEADER)
+            for batch in get_repository().iter_task_batches(status, start_from, start_to):
+                writer.writerows(batch)
+                count += len(batch)
+                if progress is not None:
+                    progress(count)
+    except BaseException:
+        # Keine halbe Exportdatei liegen lassen (z.B. nach Abbruch im Callback)
+        if os.path.exists(filepath):
+            os.remove(filepath)
+        raise
+    return count
+
+class ImportCancelled(Exception):
     """
-    Exportiert alle Aufgaben als CSV-Datei.
+    Wird ausgelöst, wenn ein CSV-Import über den Fortschritts-Callback abgebrochen wurde.
     """
-    tasks = get_tasks()
-    with open(filepath, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["ID", "Titel", "Status", "Fälligkeitsdatum", "Startdatum", "Enddatum", "Beschreibung"])
-        for task in tasks:
-            writer.writerow(task)
 
-def import_tasks_from_csv(filepath):
+def _csv_row_to_task(row):
+    """
+    Wandelt eine CSV-Zeile (deutsche oder englische Spaltennamen) in ein Aufgaben-Tupel um.
+    """
+    return (
+        row.get("Titel") or row.get("Title") or "",
+        row.get("Status", "To Do"),
+        row.get("Fälligkeitsdatum") or row.get("Due Date") or None,
+        row.get("Startdatum") or row.get("Start Date") or None,
+        row.get("Enddatum") or row.get("End Date") or None,
+        row.get("Beschreibung") or row.get("Description") or None,
+    )
+
+def import_tasks_from_csv(source, progress=None, chunk_size=CSV_IMPORT_CHUNK_SIZE):
     """
     Importiert Aufgaben aus einer CSV-Datei.
+
+    Die Datei wird blockweise gelesen und per ``executemany`` in einer
+    einzigen Transaktion eingefügt: entweder kommen alle Zeilen an oder keine.
+
+    Args:
+        source (str | binary file): Pfad zur CSV-Datei oder ein binärer Datenstrom
+            (z.B. ``sys.stdin.buffer``).
+        progress (callable, optional): ``progress(rows, bytes_read, bytes_total)``
+            nach jedem Block (bei Datenströmen ohne bekannte Größe ist ``bytes_total`` 0).
+            Gibt der Callback ``False`` zurück, wird abgebrochen.
+        chunk_size (int): Zeilen pro ``executemany``.
+
+    Returns:
+        int: Anzahl importierter Aufgaben.
+
+    Raises:
+        ImportCancelled: Der Import wurde abgebrochen (nichts wurde übernommen).
     """
-    with open(filepath, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            title = row.get("Titel") or row.get("Title") or ""
-            status = row.get("Status", "To Do")
-            due_date = row.get("Fälligkeitsdatum") or row.get("Due Date") or None
-            start_date = row.get("Startdatum") or row.get("Start Date") or None
-            end_date = row.get("Enddatum") or row.get("End Date") or None
-            description = row.get("Beschreibung") or row.get("Description") or None
-            add_task(
-                title,
-                status=status,
-                due_date=due_date,
-                start_date=start_date,
-                end_date=end_date,
-                description=description
-            )
+    if hasattr(source, "read"):
+        raw = source
+        total_bytes = 0
+        owned = False
+    else:
+        raw = open(source, "rb")
+        total_bytes = os.path.getsize(source)
+        owned = True
+    seekable = raw.seekable()
+    imported = 0
+    f = io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+    try:
+        with get_repository().transaction() as conn:
+            reader = csv.DictReader(f)
+            while True:
+                chunk = [_csv_row_to_task(row) for row in itertools.islice(reader, chunk_size)]
+                if not chunk:
+                    break
+                conn.executemany(INSERT_TASK_SQL, chunk)
+                imported += len(chunk)
+                bytes_read = raw.tell() if seekable else 0
+                if progress is not None and progress(imported, bytes_read, total_bytes) is False:
+                    raise ImportCancelled(f"Import nach {imported} Zeilen abgebrochen")
+    finally:
+        # Fremde Datenströme (stdin) nicht mit dem Wrapper schließen
+        f.detach()
+        if owned:
+            raw.close()
+    return imported
 
-def export_tasks_to_pdf(filepath="tasks_export.pdf"):
-    """
-    Exportiert alle Aufgaben als PDF-Datei.
-    """
-    tasks = get_tasks()
-    c = canvas.Canvas(filepath, pagesize=A4)
-    width, height = A4
-    y = height - 40
-    c.setFont("Helvetica-Bold", 14)
-    c.drawString(40, y, "Aufgabenliste")
-    y -= 30
-    c.setFont("Helvetica", 10)
-    headers = ["ID", "Titel", "Status", "Fälligkeitsdatum", "Startdatum", "Enddatum", "Beschreibung"]
-    c.drawString(40, y, " | ".join(headers))
-    y -= 20
-    for task in tasks:
-        line = " | ".join(str(x) if x else "" for x in task)
-        c.drawString(40, y, line)
-        y -= 18
-        if y < 40:
-            c.showPage()
-            y = height - 40
-    c.save()
+def export_tasks_to_pdf(filepath="tasks_export.pdf", status=None, start_from=None, start_to=None, progress=None):
+    """
+    Exportiert Aufgaben als PDF-Tabelle (Spalten mit Zeilenumbruch, Kopfzeile auf jeder Seite).
+
+    Args:
+        filepath (str): Zieldatei.
+        status, start_from, start_to: Optionale Filter wie bei ``query_tasks``.
+        progress (callable, optional): ``progress(rows, pages)`` nach jedem Block.
+
+    Returns:
+        dict: rows, pages, seconds und pages_per_second.
+    """
+    from logic.pdf_export import write_tasks_pdf
+    batches = get_repository().iter_task_batches(status, start_from, start_to)
+    return write_tasks_pdf(filepath, batches, progress)
 
 def check_user(username, password):
     """
     Prüft, ob ein Benutzer mit den angegebenen Zugangsdaten existiert.
+
+    Kostet wegen der Schlüsselableitung absichtlich ca. 100 ms; die
+    Oberfläche meldet über ``logic.auth.login`` im Hintergrund an.
+    Klartext-Passwörter älterer Datenbanken werden dabei in Hashes umgewandelt.
+    """
+    return get_repository().check_user(username, password)
+
+def set_password(username, password):
     """
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("SELECT * FROM users WHERE username=? AND password=?", (username, password))
-    user = c.fetchone()
-    conn.close()
-    return user is not None
+    Setzt das Passwort eines Benutzers neu (als gesalzener Hash).
+
+    Gemerkte Anmeldungen verwirft ``logic.auth.change_password``.
+    """
+    get_repository().set_password(username, password)
 
 def add_user(username, password):
     """
@@ -189,13 +1134,7 @@ def add_user(username, password):
     Returns:
         bool: True bei Erfolg, False falls Benutzername existiert.
     """
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    try:
-        c.execute("INSERT INTO users (username, password) VALUES (?, ?)", (username, password))
-        conn.commit()
-        success = True
-    except sqlite3.IntegrityError:
-        success = False
-    conn.close()
-    return success
\ No newline at end of file
+    return get_repository().add_user(username, password)
+
+# Laufzeitmessung aller Datenbankfunktionen (ohne PROJECTOS_PERF nur ein Flag-Test pro Aufruf)
+perf.instrument(globals(), "tasks_db", skip=("fts_query", "task_page_key", "get_repository"))
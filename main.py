@@ -1,9 +1,8 @@
-from PyQt6.QtWidgets import QApplication, QMessageBox, QDialog
+from PyQt6.QtWidgets import QApplication, QDialog
 import sys
-from gui.main_window import MainWindow
+from gui.main_window import show_main_window
 from gui.login import LoginDialog
-from logic.tasks_db import init_db, init_user_db, check_user, add_task
-from gui.dashboard import DashboardPage
+from logic.tasks_db import init_db, init_user_db, add_task
 from datetime import datetime, timedelta
 import sqlite3
 
@@ -39,15 +38,11 @@ def main():
 
     app = QApplication(sys.argv)
     login = LoginDialog()
+    # Falsche Zugangsdaten meldet der Dialog selbst; er schließt sich erst nach erfolgreicher Anmeldung
     if login.exec() == QDialog.DialogCode.Accepted:
-        username, password = login.get_credentials()
-        if check_user(username, password):
-            window = MainWindow()
-            window.dashboard_page = DashboardPage(username)
-            window.show()
-            sys.exit(app.exec())
-        else:
-            QMessageBox.critical(None, "Fehler", "Login fehlgeschlagen!")
+        username, _ = login.get_credentials()
+        show_main_window(username, login.token)
+        sys.exit(app.exec())
     else:
         sys.exit()
 
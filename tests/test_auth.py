@@ -0,0 +1,158 @@
+import unittest
+import os
+import sqlite3
+import sys
+import time
+from unittest import mock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt6.QtWidgets import QApplication, QDialog, QMessageBox
+
+from logic import auth, tasks_db
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+class TestAuth(unittest.TestCase):
+    TEST_DB = "test_auth.db"
+
+    def setUp(self):
+        # Geringere Kosten, damit die Tests schnell bleiben
+        patcher = mock.patch.object(auth, "SCRYPT_N", 2 ** 10)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        auth._sessions.clear()
+        tasks_db.DB_PATH = self.TEST_DB
+        self.remove_db()
+        tasks_db.init_db()
+
+    def tearDown(self):
+        tasks_db.close_db()
+        self.remove_db()
+
+    def remove_db(self):
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.TEST_DB + suffix):
+                os.remove(self.TEST_DB + suffix)
+
+    def user_row(self, username):
+        return tasks_db.get_repository().connection().execute(
+            "SELECT password, password_hash FROM users WHERE username=?", (username,)
+        ).fetchone()
+
+    def test_hash_and_verify(self):
+        first = auth.hash_password("geheim")
+        second = auth.hash_password("geheim")
+        self.assertNotEqual(first, second)  # eigenes Salt pro Hash
+        self.assertTrue(auth.verify_password("geheim", first))
+        self.assertFalse(auth.verify_password("Geheim", first))
+        self.assertFalse(auth.verify_password("geheim", "kaputt$1$2"))
+        self.assertFalse(auth.needs_rehash(first))
+        with mock.patch.object(auth, "SCRYPT_N", 2 ** 11):
+            self.assertTrue(auth.needs_rehash(first))
+            self.assertTrue(auth.verify_password("geheim", first))
+
+    def test_add_user_stores_only_hash(self):
+        self.assertTrue(tasks_db.add_user("anna", "geheim"))
+        self.assertFalse(tasks_db.add_user("anna", "anders"))
+        password, password_hash = self.user_row("anna")
+        self.assertEqual(password, "")
+        self.assertTrue(password_hash.startswith("scrypt$"))
+        self.assertTrue(tasks_db.check_user("anna", "geheim"))
+        self.assertFalse(tasks_db.check_user("anna", "falsch"))
+        self.assertFalse(tasks_db.check_user("niemand", "geheim"))
+
+    def test_plaintext_upgraded_on_login(self):
+        tasks_db.close_db()
+        self.remove_db()
+        conn = sqlite3.connect(self.TEST_DB)
+        conn.execute(
+            "CREATE TABLE users (id INTEGER PRIMARY KEY AUTOINCREMENT, username TEXT UNIQUE NOT NULL, "
+            "password TEXT NOT NULL)"
+        )
+        conn.execute("INSERT INTO users (username, password) VALUES ('alt', 'klartext')")
+        conn.commit()
+        conn.close()
+        tasks_db.init_db()
+        self.assertFalse(tasks_db.check_user("alt", "falsch"))
+        self.assertEqual(self.user_row("alt"), ("klartext", None))
+        self.assertTrue(tasks_db.check_user("alt", "klartext"))
+        password, password_hash = self.user_row("alt")
+        self.assertEqual(password, "")
+        self.assertTrue(auth.verify_password("klartext", password_hash))
+        # Höhere Kosten: der nächste Login ersetzt den Hash erneut
+        with mock.patch.object(auth, "SCRYPT_N", 2 ** 11):
+            self.assertTrue(tasks_db.check_user("alt", "klartext"))
+            self.assertFalse(auth.needs_rehash(self.user_row("alt")[1]))
+
+    def test_session_cache_skips_db_and_kdf(self):
+        tasks_db.add_user("anna", "geheim")
+        token = auth.login("anna", "geheim")
+        self.assertEqual(auth.session_user(token), "anna")
+        auth.logout(token)
+        self.assertIsNone(auth.session_user(token))
+        with mock.patch.object(tasks_db, "check_user", wraps=tasks_db.check_user) as check_user:
+            second = auth.login("anna", "geheim")
+            self.assertEqual(check_user.call_count, 0)
+            self.assertIsNone(auth.login("anna", "falsch"))
+            self.assertEqual(check_user.call_count, 1)
+        self.assertNotEqual(second, token)
+        auth.change_password("anna", "neu")
+        self.assertIsNone(auth.session_user(second))
+        self.assertIsNone(auth.login("anna", "geheim"))
+        self.assertIsNotNone(auth.login("anna", "neu"))
+
+    def test_session_expires(self):
+        now = [0.0]
+        cache = auth.SessionCache(ttl=10, clock=lambda: now[0])
+        cache.remember("anna", "geheim")
+        token = cache.open("anna")
+        now[0] = 10.0
+        self.assertIsNone(cache.user(token))
+        self.assertFalse(cache.check("anna", "geheim"))
+
+    def test_login_dialog_checks_in_background(self):
+        from gui.login import LoginDialog
+        tasks_db.add_user("anna", "geheim")
+        dialog = LoginDialog()
+        dialog.username.setText("anna")
+        dialog.password.setText("falsch")
+        dialog.start_login()
+        self.assertFalse(dialog.password.isEnabled())
+        self.wait_for(dialog)
+        self.assertEqual(dialog.result(), 0)
+        self.assertTrue(dialog.password.isEnabled())
+        self.assertEqual(dialog.password.text(), "")
+        dialog.password.setText("geheim")
+        dialog.start_login()
+        self.wait_for(dialog)
+        self.assertEqual(dialog.result(), QDialog.DialogCode.Accepted)
+        self.assertEqual(auth.session_user(dialog.token), "anna")
+        dialog.deleteLater()
+
+    def test_register_hashes_in_background(self):
+        from gui.login import LoginDialog, RegisterDialog
+        dialog = LoginDialog()
+        self.addCleanup(dialog.deleteLater)
+        with mock.patch.object(RegisterDialog, "exec", return_value=QDialog.DialogCode.Accepted), \
+                mock.patch.object(RegisterDialog, "get_credentials", return_value=("bert", "geheim")), \
+                mock.patch.object(QMessageBox, "information") as info, \
+                mock.patch.object(QMessageBox, "warning") as warning:
+            dialog.open_register()
+            self.assertFalse(dialog.register_btn.isEnabled())
+            self.assertFalse(dialog.buttons.isEnabled())
+            self.wait_for(dialog)
+            info.assert_called_once()
+            self.assertTrue(dialog.register_btn.isEnabled())
+            self.assertTrue(auth.verify_password("geheim", self.user_row("bert")[1]))
+            dialog.open_register()
+            self.wait_for(dialog)
+            warning.assert_called_once()
+
+    def wait_for(self, dialog):
+        deadline = time.monotonic() + 10
+        while dialog.job is not None and time.monotonic() < deadline:
+            app.processEvents()
+        self.assertIsNone(dialog.job)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+import io
+import json
+import os
+import subprocess
+import sys
+from contextlib import redirect_stdout, redirect_stderr
+from unittest import mock
+
+from logic import tasks_db
+from logic import cli
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class TestCli(unittest.TestCase):
+    TEST_DB = "test_cli.db"
+    CSV_FILE = "test_cli.csv"
+
+    def setUp(self):
+        tasks_db.DB_PATH = self.TEST_DB
+        tasks_db.init_db()
+        tasks_db.add_task("A", status="To Do", due_date="2025-05-01")
+        tasks_db.add_task("B", status="Done", due_date="2025-04-01")
+
+    def tearDown(self):
+        tasks_db.close_all_db()
+        for path in (self.TEST_DB, self.TEST_DB + "-wal", self.TEST_DB + "-shm", self.CSV_FILE):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def run_cli(self, *argv, stdin=""):
+        out, err = io.StringIO(), io.StringIO()
+        with redirect_stdout(out), redirect_stderr(err), mock.patch("sys.stdin", io.StringIO(stdin)):
+            code = cli.main(["--db", self.TEST_DB, *argv])
+        return code, [json.loads(l) for l in out.getvalue().splitlines()], err.getvalue()
+
+    def test_stats(self):
+        code, lines, _ = self.run_cli("stats")
+        self.assertEqual(code, 0)
+        self.assertEqual(lines[0]["by_status"], {"To Do": 1, "Done": 1})
+        self.assertEqual(lines[0]["next_due"]["title"], "B")
+
+    def test_export_jsonl_and_move_from_stdin(self):
+        code, tasks, err = self.run_cli("export", "--format", "jsonl", "--status", "To Do")
+        self.assertEqual([t["title"] for t in tasks], ["A"])
+        self.assertEqual(json.loads(err)["rows"], 1)
+        stdin = "".join(json.dumps(t) + "\n" for t in tasks)
+        code, lines, _ = self.run_cli("move", "--status", "Done", "-", stdin=stdin)
+        self.assertEqual(lines, [{"command": "move", "status": "Done", "requested": 1, "moved": 1}])
+        self.assertEqual(tasks_db.get_task_stats()["by_status"], {"Done": 2})
+
+    def test_changes_since(self):
+        code, lines, err = self.run_cli("changes")
+        self.assertEqual([(l["op"], l["title"]) for l in lines], [("upsert", "A"), ("upsert", "B")])
+        rev = json.loads(err)["rev"]
+        tasks_db.delete_task(1)
+        code, lines, err = self.run_cli("changes", "--since", str(rev))
+        self.assertEqual(lines, [{"op": "delete", "id": 1}])
+        self.assertEqual(json.loads(err)["rev"], rev + 1)
+
+    def test_import_file_and_error(self):
+        tasks_db.export_tasks_to_csv(self.CSV_FILE)
+        code, lines, _ = self.run_cli("import", self.CSV_FILE)
+        self.assertEqual((code, lines[0]["rows"]), (0, 2))
+        code, lines, err = self.run_cli("import", "fehlt.csv")
+        self.assertEqual(code, 1)
+        self.assertIn("error", json.loads(err))
+
+    def test_no_qt_or_matplotlib_import(self):
+        code = "import sys, logic.cli; print(any(m in sys.modules for m in ('PyQt6', 'matplotlib', 'pandas')))"
+        out = subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(out.strip(), "False")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt6.QtWidgets import QApplication
+
+from logic import tasks_db
+from logic.task_store import get_task_store
+from gui.dashboard import DashboardPage
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+class TestDashboardPage(unittest.TestCase):
+    TEST_DB = "test_dashboard.db"
+
+    def setUp(self):
+        tasks_db.DB_PATH = self.TEST_DB
+        tasks_db.init_db()
+        tasks_db.add_task("Idee", status="Done", due_date="2025-05-14")
+        tasks_db.add_task("Entwurf", status="To Do", due_date="2025-05-20")
+        self.page = DashboardPage("anna")
+
+    def tearDown(self):
+        self.page.deleteLater()
+        tasks_db.close_db()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.TEST_DB + suffix):
+                os.remove(self.TEST_DB + suffix)
+
+    def test_initial_stats(self):
+        self.assertEqual(self.page.value_labels["total"].text(), "2")
+        self.assertEqual(self.page.value_labels["Done"].text(), "1")
+        self.assertEqual(self.page.progress.value(), 50)
+        self.assertIn("Idee", self.page.next_label.text())
+
+    def test_updates_in_place_on_store_change(self):
+        layout = self.page.layout()
+        count = layout.count()
+        store = get_task_store()
+        task_id = store.add_task("Layout", status="In Progress", due_date="2025-05-01")
+        self.assertEqual(self.page.value_labels["total"].text(), "3")
+        self.assertEqual(self.page.value_labels["In Progress"].text(), "1")
+        self.assertIn("Layout", self.page.next_label.text())
+        store.move_task(task_id, "Done")
+        self.assertEqual(self.page.progress.value(), 66)
+        self.assertIs(self.page.layout(), layout)
+        self.assertEqual(layout.count(), count)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import unittest
+import os
+import sys
+from unittest import mock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt6.QtWidgets import QApplication
+
+from logic import tasks_db
+from logic.task_store import get_task_store
+import numpy as np
+import matplotlib.colors as mcolors
+from gui.gantt import BAR_COLORS, GanttPage, GanttIntervalIndex, prepare_gantt_data, bar_vertices
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+class TestGanttData(unittest.TestCase):
+    def test_prepare_filters_and_sorts(self):
+        tasks = [
+            (1, "Später", "To Do", None, "2025-05-10", "2025-05-12", None),
+            (2, "Früher", "Done", None, "2025-05-01", "2025-05-03", None),
+            (3, "Ohne Ende", "To Do", None, "2025-05-01", None, None),
+            (4, "Kaputt", "To Do", None, "kein Datum", "2025-05-03", None),
+            (5, "X" * 21, "To Do", None, "2025-05-01", "2025-05-03", None),
+        ]
+        ids, titles, statuses, starts, ends = prepare_gantt_data(tasks)
+        self.assertEqual(titles.tolist(), ["Früher", "Später"])
+        self.assertEqual((ids.tolist(), statuses.tolist()), ([2, 1], ["Done", "To Do"]))
+        self.assertEqual(list(ends - starts), [2.0, 2.0])
+
+    def test_bar_vertices_shape(self):
+        _, _, _, starts, ends = prepare_gantt_data([(1, "A", "To Do", None, "2025-05-01", "2025-05-04", None)])
+        verts = bar_vertices(starts, ends)
+        self.assertEqual(verts.shape, (1, 4, 2))
+        self.assertEqual(verts[0, 2, 0] - verts[0, 0, 0], 3.0)
+
+    def test_interval_index_matches_brute_force(self):
+        rng = np.random.default_rng(1)
+        starts = np.sort(rng.uniform(0, 1000, 2000))
+        ends = starts + rng.exponential(5, 2000)
+        ends[::500] += 800  # einige sehr lange Balken
+        index = GanttIntervalIndex(starts, ends)
+        for x0, x1 in [(0, 10), (400, 420), (990, 2000), (-5, -1)]:
+            expected = np.flatnonzero((starts <= x1) & (ends >= x0))
+            self.assertEqual(index.overlapping(x0, x1).tolist(), expected.tolist())
+
+class TestGanttPage(unittest.TestCase):
+    TEST_DB = "test_gantt.db"
+
+    def setUp(self):
+        tasks_db.DB_PATH = self.TEST_DB
+        tasks_db.init_db()
+        tasks_db.add_task("A", start_date="2025-05-01", end_date="2025-05-04")
+        self.page = GanttPage()
+
+    def tearDown(self):
+        self.page.deleteLater()
+        tasks_db.close_db()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.TEST_DB + suffix):
+                os.remove(self.TEST_DB + suffix)
+
+    def test_reuses_figure_and_collection(self):
+        figure, bars = self.page.figure, self.page.bars
+        get_task_store().add_task("B", start_date="2025-05-02", end_date="2025-05-06")
+        self.assertIs(self.page.figure, figure)
+        self.assertIs(self.page.bars, bars)
+        self.assertEqual(len(bars.get_paths()), 2)
+        self.assertEqual(len(figure.axes), 1)
+
+    def test_large_data_prepared_in_background(self):
+        with mock.patch("gui.gantt.ASYNC_PREPARE_ROWS", 2):
+            # Kompletter Neuaufbau (tasks_reset); einzelne Änderungen laufen inkrementell
+            tasks_db.add_task("B", start_date="2025-05-02", end_date="2025-05-06")
+            get_task_store().reload()
+            job = self.page._job
+            self.assertIsNotNone(job)
+            # Bis das Ergebnis da ist, bleibt das alte Diagramm stehen
+            self.assertEqual(len(self.page.bars.get_paths()), 1)
+            self.assertTrue(job.wait(10))
+            app.processEvents()
+        self.assertIsNone(self.page._job)
+        self.assertEqual(len(self.page.bars.get_paths()), 2)
+
+    def test_draws_only_visible_rows(self):
+        tasks_db.add_tasks(
+            (f"T{i}", "To Do", None, f"2025-{i % 12 + 1:02d}-01", f"2025-{i % 12 + 1:02d}-10", None)
+            for i in range(500)
+        )
+        get_task_store().reload()
+        self.page.resize(800, 600)
+        per_page = self.page.rows_per_page()
+        self.assertLess(per_page, 500)
+        self.assertEqual(len(self.page.bars.get_paths()), per_page)
+        self.assertEqual(self.page.scrollbar.maximum(), 501 - per_page)
+        # Auf den Anfang zoomen: nur noch Aufgaben, die den Zeitraum berühren
+        x0, _ = self.page.full_range()
+        self.page.set_window(x0, x0 + 20)
+        self.assertLess(self.page.scrollbar.maximum(), 501 - per_page)
+        self.assertLessEqual(len(self.page.bars.get_paths()), per_page)
+
+    def test_changes_applied_incrementally(self):
+        store = get_task_store()
+        tasks_db.add_tasks(
+            (f"T{i}", "To Do", None, f"2025-05-{i % 28 + 1:02d}", f"2025-06-{i % 28 + 1:02d}", None) for i in range(50)
+        )
+        store.reload()
+        self.page.resize(800, 2000)
+        index = self.page._index
+        with mock.patch("gui.gantt.prepare_gantt_data", wraps=prepare_gantt_data) as prepare, \
+                mock.patch.object(store, "tasks", wraps=store.tasks) as all_tasks:
+            # Statuswechsel: gleiche Zeile, nur die Farbe ändert sich
+            store.move_task(1, "Done")
+            self.assertIs(self.page._index, index)
+            row = self.page._ids.tolist().index(1)
+            self.assertEqual(self.page.bars.get_facecolor()[row][:3].tolist(), list(mcolors.to_rgb(BAR_COLORS["Done"])))
+            # Neuer und verschobener Balken: nur diese beiden werden aufbereitet
+            new_id = store.add_task("Neu", start_date="2025-05-15", end_date="2025-05-16")
+            store.edit_task(2, "T1", "2025-01-01", "2025-01-02")
+            store.delete_task(3)
+            all_tasks.assert_not_called()
+            self.assertEqual([len(call.args[0]) for call in prepare.call_args_list], [1, 1, 0])
+        self.assertEqual(self.page._ids[0], 2)
+        self.assertIn(new_id, self.page._ids.tolist())
+        self.assertNotIn(3, self.page._ids.tolist())
+        # Gleicher Stand wie nach einem kompletten Neuaufbau
+        expected = prepare_gantt_data(store.tasks())
+        self.assertEqual(sorted(self.page._ids.tolist()), sorted(expected[0].tolist()))
+        self.assertEqual(self.page._starts.tolist(), expected[3].tolist())
+        self.assertEqual(len(self.page._index.overlapping(*self.page.full_range())), len(expected[0]))
+
+    def test_empty_chart_shows_label(self):
+        get_task_store().delete_task(1)
+        self.assertTrue(self.page.canvas.isHidden())
+        self.assertFalse(self.page.empty_label.isHidden())
+
+if __name__ == "__main__":
+    unittest.main()
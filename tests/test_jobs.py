@@ -0,0 +1,103 @@
+import unittest
+import os
+import sys
+import threading
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QThreadPool
+
+from logic import tasks_db
+from logic.jobs import Job, start_job
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+def finish(job):
+    """
+    Wartet auf den Job und stellt die Signale im Haupt-Thread zu.
+
+    ``done`` kommt als letztes Signal an (siehe ``TestJobs.connect``); ein
+    einzelnes ``processEvents()`` reicht dafür nicht immer.
+    """
+    assert job.wait(10)
+    deadline = time.monotonic() + 10
+    while not job.delivered and time.monotonic() < deadline:
+        app.processEvents()
+    assert job.delivered
+
+class TestJobs(unittest.TestCase):
+    TEST_DB = "test_jobs.db"
+    CSV_FILE = "test_jobs.csv"
+
+    def setUp(self):
+        tasks_db.DB_PATH = self.TEST_DB
+        tasks_db.init_db()
+        self.events = []
+
+    def tearDown(self):
+        QThreadPool.globalInstance().waitForDone()
+        tasks_db.close_all_db()
+        for path in (self.TEST_DB, self.TEST_DB + "-wal", self.TEST_DB + "-shm", self.CSV_FILE):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def connect(self, job):
+        job.signals.progress.connect(lambda values: self.events.append(("progress", values)))
+        job.signals.finished.connect(lambda result: self.events.append(("finished", result)))
+        job.signals.failed.connect(lambda exc: self.events.append(("failed", type(exc))))
+        job.signals.cancelled.connect(lambda: self.events.append(("cancelled",)))
+        job.delivered = False
+        job.signals.done.connect(lambda: setattr(job, "delivered", True))
+        return job
+
+    def test_query_runs_in_worker_thread(self):
+        tasks_db.add_task("A")
+        threads = []
+
+        def query():
+            threads.append(threading.get_ident())
+            return tasks_db.get_task_stats()["total"]
+        finish(self.connect(start_job(query)))
+        self.assertEqual(self.events, [("finished", 1)])
+        self.assertNotEqual(threads, [threading.get_ident()])
+
+    def test_import_reports_progress(self):
+        tasks_db.add_tasks(("T", "To Do", None, None, None, None) for _ in range(25))
+        tasks_db.export_tasks_to_csv(self.CSV_FILE)
+        job = self.connect(start_job(tasks_db.import_tasks_from_csv, self.CSV_FILE, chunk_size=10,
+                                     report_progress=True))
+        finish(job)
+        self.assertEqual([e[1][0] for e in self.events if e[0] == "progress"], [10, 20, 25])
+        self.assertEqual(self.events[-1], ("finished", 25))
+        self.assertEqual(tasks_db.get_task_stats()["total"], 50)
+
+    def test_cancel_rolls_back_import(self):
+        tasks_db.add_tasks(("T", "To Do", None, None, None, None) for _ in range(25))
+        tasks_db.export_tasks_to_csv(self.CSV_FILE)
+        job = Job(tasks_db.import_tasks_from_csv, self.CSV_FILE, chunk_size=10, report_progress=True)
+        self.connect(job)
+        # Abbruch nach dem ersten Block, direkt im Worker-Thread
+        job.signals.progress.disconnect()
+        original = job.report
+
+        def report(*values):
+            job.cancel()
+            original(*values)
+        job.kwargs["progress"] = report
+        job.start()
+        finish(job)
+        self.assertEqual(self.events, [("cancelled",)])
+        self.assertEqual(tasks_db.get_task_stats()["total"], 25)
+
+    def test_cancel_before_start_and_failure(self):
+        job = Job(tasks_db.get_tasks)
+        self.connect(job)
+        job.cancel()
+        job.run()
+        app.processEvents()
+        finish(self.connect(start_job(tasks_db.query_tasks, order_by="nope")))
+        self.assertEqual(self.events, [("cancelled",), ("failed", ValueError)])
+
+if __name__ == "__main__":
+    unittest.main()
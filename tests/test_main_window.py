@@ -0,0 +1,114 @@
+import unittest
+import os
+import subprocess
+import sys
+import tempfile
+from unittest import mock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QCoreApplication, QEvent
+
+from logic import tasks_db
+from gui.main_window import MainWindow
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class TestMainWindow(unittest.TestCase):
+    TEST_DB = "test_main_window.db"
+
+    def setUp(self):
+        tasks_db.DB_PATH = self.TEST_DB
+        tasks_db.init_db()
+        self.window = MainWindow("anna")
+
+    def tearDown(self):
+        self.window.close()
+        tasks_db.close_db()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.TEST_DB + suffix):
+                os.remove(self.TEST_DB + suffix)
+
+    def test_only_dashboard_built_at_start(self):
+        self.assertEqual(list(self.window.pages), ["dashboard"])
+        self.assertEqual(self.window.stack.count(), 1)
+        self.assertIn("AN", self.window.pages["dashboard"].profile_btn.text())
+
+    def test_pages_built_once_on_navigation(self):
+        self.window.show_tasks()
+        tasks_page = self.window.stack.currentWidget()
+        self.window.show_dashboard()
+        self.window.show_tasks()
+        self.assertIs(self.window.stack.currentWidget(), tasks_page)
+        self.assertEqual(self.window.stack.count(), 2)
+        self.assertTrue(self.window.sidebar_buttons[1].isChecked())
+
+    def test_logout_releases_old_window(self):
+        from gui.main_window import show_main_window
+        old = show_main_window("anna", "token-anna")
+        destroyed = []
+        old.destroyed.connect(lambda: destroyed.append(1))
+        login = mock.Mock(token="token-bert")
+        login.exec.return_value = login.DialogCode.Accepted
+        login.get_credentials.return_value = ("bert", "")
+        with mock.patch("gui.login.LoginDialog", return_value=login), mock.patch("logic.auth.logout") as logout:
+            old.pages["dashboard"].logout()
+        logout.assert_called_once_with("token-anna")
+        self.assertFalse(old.sync_timer.isActive())
+        new = app.main_window
+        self.assertEqual(new.username, "bert")
+        self.assertTrue(new.sync_timer.isActive())
+        # Das alte Fenster wird freigegeben, nur das neue hängt noch an der Anwendung
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+        self.assertEqual(destroyed, [1])
+        new.close()
+
+    def test_close_saves_pending_reflection(self):
+        from logic import reflection_db
+        reflection_db.DB_PATH = self.TEST_DB + ".reflection"
+        reflection_db.init_reflection_db()
+        self.addCleanup(self.remove_reflection_db)
+        window = MainWindow("anna")
+        window.show_reflection()
+        page = window.pages["reflection"]
+        date = page.current_date()
+        page.text_edit.setPlainText("Noch nicht gespeichert")
+        self.assertTrue(page.autosave.is_dirty())
+        window.close()
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+        self.assertEqual(reflection_db.load_reflection(date), "Noch nicht gespeichert")
+
+    def remove_reflection_db(self):
+        from logic import reflection_db
+        reflection_db.close_reflection_db()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.TEST_DB + ".reflection" + suffix):
+                os.remove(self.TEST_DB + ".reflection" + suffix)
+
+class TestStartupImports(unittest.TestCase):
+    def test_heavy_modules_loaded_lazily(self):
+        # Frischer Interpreter, da die Testsuite matplotlib bereits geladen hat
+        code = (
+            "import sys\n"
+            "from PyQt6.QtWidgets import QApplication\n"
+            "from logic.tasks_db import init_db\n"
+            "from gui.main_window import MainWindow\n"
+            "init_db()\n"
+            "app = QApplication(sys.argv)\n"
+            "window = MainWindow()\n"
+            "print(sorted(m for m in ('matplotlib', 'pandas', 'reportlab') if m in sys.modules))\n"
+            "window.show_gantt()\n"
+            "print(sorted(m for m in ('matplotlib', 'pandas', 'reportlab') if m in sys.modules))\n"
+        )
+        env = dict(os.environ, QT_QPA_PLATFORM="offscreen", PYTHONPATH=ROOT)
+        with tempfile.TemporaryDirectory() as tmp:
+            out = subprocess.run(
+                [sys.executable, "-c", code], cwd=tmp, env=env, capture_output=True, text=True, check=True
+            ).stdout.splitlines()
+        self.assertEqual(out[0], "[]")
+        self.assertEqual(out[1], "['matplotlib', 'pandas']")
+
+if __name__ == "__main__":
+    unittest.main()
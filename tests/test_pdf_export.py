@@ -0,0 +1,41 @@
+import unittest
+import os
+from logic import tasks_db
+from logic.pdf_export import wrap_text, BODY_FONT
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+class TestPdfExport(unittest.TestCase):
+    TEST_DB = "test_pdf_export.db"
+    TEST_PDF = "test_pdf_export.pdf"
+
+    def setUp(self):
+        tasks_db.DB_PATH = self.TEST_DB
+        tasks_db.init_db()
+
+    def tearDown(self):
+        tasks_db.close_db()
+        for path in (self.TEST_DB, self.TEST_DB + "-wal", self.TEST_DB + "-shm", self.TEST_PDF):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_wrap_text_fits_width(self):
+        lines = wrap_text("Ein ziemlich langer Satz " * 5 + "X" * 80, 100)
+        self.assertGreater(len(lines), 1)
+        for line in lines:
+            self.assertLessEqual(stringWidth(line, *BODY_FONT), 100)
+
+    def test_wrap_text_truncates(self):
+        lines = wrap_text("Wort " * 500, 60, max_lines=4)
+        self.assertEqual(len(lines), 4)
+        self.assertTrue(lines[-1].endswith("…"))
+
+    def test_export_paginates(self):
+        tasks_db.add_tasks([(f"Aufgabe {i}", "To Do", None, None, None, "Text " * 30) for i in range(200)])
+        stats = tasks_db.export_tasks_to_pdf(self.TEST_PDF)
+        self.assertEqual(stats["rows"], 200)
+        self.assertGreater(stats["pages"], 1)
+        with open(self.TEST_PDF, "rb") as f:
+            self.assertTrue(f.read(5).startswith(b"%PDF"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import unittest
+import json
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt6.QtWidgets import QApplication
+
+from logic import perf, tasks_db
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+class TestPerf(unittest.TestCase):
+    TEST_DB = "test_perf.db"
+
+    def setUp(self):
+        tasks_db.DB_PATH = self.TEST_DB
+        tasks_db.init_db()
+        perf.reset()
+        self.addCleanup(perf.disable)
+
+    def tearDown(self):
+        tasks_db.close_db()
+        perf.reset()
+        for path in (self.TEST_DB, self.TEST_DB + "-wal", self.TEST_DB + "-shm", self.TEST_DB + ".json"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_latency_stats(self):
+        stats = perf.LatencyStats(window=4)
+        for ms in (0.05, 2, 3, 700, 4):
+            stats.add(ms, statements=2)
+        data = stats.snapshot()
+        self.assertEqual(data["calls"], 5)
+        self.assertEqual(data["statements"], 10)
+        self.assertAlmostEqual(data["mean_ms"], 709.05 / 5)
+        # Quantile und Histogramm nur über die letzten vier Messungen
+        self.assertEqual((data["p50_ms"], data["max_ms"]), (4, 700))
+        self.assertEqual(data["histogram"]["<=5"], 3)
+        self.assertEqual(data["histogram"]["<=1000"], 1)
+        self.assertEqual(sum(data["histogram"].values()), 4)
+
+    def test_disabled_records_nothing(self):
+        tasks_db.add_task("A")
+        tasks_db.get_task(1)
+        self.assertEqual(perf.snapshot(), {"enabled": False, "statements": 0, "timings": {}})
+
+    def test_times_db_calls_and_counts_statements(self):
+        # Verbindung besteht schon vor dem Einschalten
+        tasks_db.add_task("A")
+        perf.enable()
+        tasks_db.get_task(1)
+        tasks_db.move_tasks([1], "Done")
+        timings = perf.snapshot()["timings"]
+        self.assertEqual(timings["tasks_db.get_task"]["calls"], 1)
+        self.assertEqual(timings["tasks_db.get_task"]["statements"], 1)
+        # BEGIN, UPDATE, COMMIT – ohne Trigger-Wiederholungen und FTS-Interna
+        self.assertEqual(timings["tasks_db.move_tasks"]["statements"], 3)
+        self.assertEqual(perf.snapshot()["statements"], 4)
+        perf.dump_json(self.TEST_DB + ".json")
+        with open(self.TEST_DB + ".json", encoding="utf-8") as f:
+            self.assertIn("tasks_db.get_task", json.load(f)["timings"])
+
+    def test_generator_timed_over_iteration(self):
+        tasks_db.add_tasks(("T", "To Do", None, None, None, None) for _ in range(5))
+        perf.enable()
+        batches = tasks_db.iter_task_batches(batch_size=2)
+        # Erst nach dem Durchlaufen eingetragen, dann mit den Abfragen des Generators
+        self.assertNotIn("tasks_db.iter_task_batches", perf.snapshot()["timings"])
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+        timing = perf.snapshot()["timings"]["tasks_db.iter_task_batches"]
+        self.assertEqual(timing["calls"], 1)
+        self.assertGreaterEqual(timing["statements"], 1)
+        # Vorzeitiger Abbruch zählt ebenfalls als ein Aufruf
+        batches = tasks_db.iter_task_batches(batch_size=2)
+        next(batches)
+        batches.close()
+        self.assertEqual(perf.snapshot()["timings"]["tasks_db.iter_task_batches"]["calls"], 2)
+
+    def test_capture_statements_without_enable(self):
+        with perf.capture_statements() as statements:
+            task_id = tasks_db.add_task("A")
+            tasks_db.get_task(task_id)
+        self.assertEqual([s.split()[0] for s in statements], ["BEGIN", "INSERT", "COMMIT", "SELECT"])
+        self.assertEqual(perf.snapshot()["timings"], {})
+        # Danach wird nicht mehr mitgeschrieben
+        tasks_db.get_task(task_id)
+        self.assertEqual(len(statements), 4)
+
+    def test_identical_writes_counted_separately(self):
+        task_id = tasks_db.add_task("A")
+        repo = tasks_db.get_repository()
+        update = "UPDATE tasks SET status = 'Done' WHERE id = ?"
+        with perf.capture_statements() as statements:
+            with repo.transaction() as conn:
+                # Der erste Schreibzugriff löst Trigger aus (Änderungsprotokoll, Suchindex)
+                conn.execute(update, (task_id,))
+                conn.execute(update, (task_id,))
+                conn.executemany(update, [(task_id,), (task_id,)])
+        self.assertEqual([s.split()[0] for s in statements], ["BEGIN"] + ["UPDATE"] * 4 + ["COMMIT"])
+
+    def test_gui_timings_and_debug_page(self):
+        from gui.main_window import MainWindow
+        from gui.perf_page import PerfPage
+        plain = MainWindow()
+        self.assertNotIn("⏱ Leistung", [b.text() for b in plain.sidebar_buttons])
+        plain.close()
+        perf.enable()
+        window = MainWindow("anna")
+        window.show_tasks()
+        window.show_perf()
+        page = window.stack.currentWidget()
+        self.assertIsInstance(page, PerfPage)
+        self.assertTrue(window.sidebar_buttons[-1].isChecked())
+        names = [page.table.item(row, 0).text() for row in range(page.table.rowCount())]
+        self.assertIn("TasksPage.refresh", names)
+        self.assertIn("DashboardPage.refresh", names)
+        page.enabled_check.setChecked(False)
+        self.assertFalse(perf.enabled())
+        window.close()
+
+if __name__ == "__main__":
+    unittest.main()
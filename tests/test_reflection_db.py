@@ -0,0 +1,173 @@
+import unittest
+import os
+import sqlite3
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import Qt, QDate
+
+from logic import reflection_db
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+class TestReflectionDB(unittest.TestCase):
+    TEST_DB = "test_reflection.db"
+
+    def setUp(self):
+        reflection_db.DB_PATH = self.TEST_DB
+        self.remove_db()
+        reflection_db.init_reflection_db()
+
+    def tearDown(self):
+        reflection_db.close_reflection_db()
+        self.remove_db()
+
+    def remove_db(self):
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.TEST_DB + suffix):
+                os.remove(self.TEST_DB + suffix)
+
+    def test_save_and_load(self):
+        reflection_db.save_reflection("2025-05-14", "Erster Tag")
+        reflection_db.save_reflection("2025-05-14", "Erster Tag, überarbeitet")
+        self.assertEqual(reflection_db.load_reflection("2025-05-14"), "Erster Tag, überarbeitet")
+        self.assertEqual(reflection_db.load_reflection("2025-05-15"), "")
+
+    def test_cached_connection(self):
+        repo = reflection_db.get_reflection_repository()
+        conn = repo.connection()
+        reflection_db.save_reflection("2025-05-14", "A")
+        reflection_db.load_reflection("2025-05-14")
+        self.assertIs(reflection_db.get_reflection_repository(), repo)
+        self.assertIs(repo.connection(), conn)
+
+    def test_range_query(self):
+        for day, text in [("2025-04-30", "Vorher"), ("2025-05-01", "Mai"), ("2025-05-20", ""),
+                          ("2025-05-31", "Ende"), ("2025-06-01", "Juni")]:
+            reflection_db.save_reflection(day, text)
+        self.assertEqual(
+            reflection_db.get_reflections("2025-05-01", "2025-05-31"),
+            [("2025-05-01", "Mai"), ("2025-05-31", "Ende")],
+        )
+
+    def test_search_follows_updates(self):
+        reflection_db.save_reflection("2025-05-14", "Heute das Layout entworfen")
+        reflection_db.save_reflection("2025-05-15", "Tests geschrieben")
+        hits = reflection_db.search_reflections("entw")
+        self.assertEqual([h[0] for h in hits], ["2025-05-14"])
+        self.assertIn("»entworfen«", hits[0][2])
+        reflection_db.save_reflection("2025-05-14", "Nichts geschafft")
+        self.assertEqual(reflection_db.search_reflections("entw"), [])
+        self.assertEqual([h[0] for h in reflection_db.search_reflections("geschr")], ["2025-05-15"])
+
+    def test_save_many(self):
+        reflection_db.save_reflection("2025-05-14", "Alt")
+        reflection_db.save_reflections([("2025-05-14", "Neu"), ("2025-05-15", "Zweiter Tag")])
+        self.assertEqual(reflection_db.load_reflection("2025-05-14"), "Neu")
+        self.assertEqual(reflection_db.load_reflection("2025-05-15"), "Zweiter Tag")
+        self.assertEqual([h[0] for h in reflection_db.search_reflections("neu")], ["2025-05-14"])
+
+    def test_migrate_legacy_db(self):
+        reflection_db.close_reflection_db()
+        self.remove_db()
+        conn = sqlite3.connect(self.TEST_DB)
+        conn.execute("CREATE TABLE reflections (date TEXT PRIMARY KEY, text TEXT)")
+        conn.execute("INSERT INTO reflections VALUES ('2025-05-14', 'Alter Eintrag')")
+        conn.commit()
+        conn.close()
+        reflection_db.init_reflection_db()
+        self.assertEqual([h[0] for h in reflection_db.search_reflections("alter")], ["2025-05-14"])
+        columns = [row[1] for row in reflection_db.get_reflection_repository().connection().execute(
+            "PRAGMA table_info(reflections)"
+        )]
+        self.assertEqual(columns, ["id", "date", "text"])
+
+    def test_search_after_vacuum(self):
+        reflection_db.save_reflections([("2025-05-01", "Apfel"), ("2025-05-02", "Birne"), ("2025-05-03", "Kirsche")])
+        repo = reflection_db.get_reflection_repository()
+        with repo.transaction() as conn:
+            conn.execute("DELETE FROM reflections WHERE date = '2025-05-01'")
+        repo.connection().execute("VACUUM")
+        self.assertEqual([h[0] for h in reflection_db.search_reflections("kirsche")], ["2025-05-03"])
+        self.assertEqual([h[0] for h in reflection_db.search_reflections("birne")], ["2025-05-02"])
+        self.assertEqual(reflection_db.search_reflections("apfel"), [])
+        repo.connection().execute("INSERT INTO reflections_fts (reflections_fts) VALUES ('integrity-check')")
+
+class TestReflectionPage(unittest.TestCase):
+    TEST_DB = "test_reflection_page.db"
+
+    def setUp(self):
+        from gui.reflection import ReflectionPage
+        reflection_db.DB_PATH = self.TEST_DB
+        reflection_db.init_reflection_db()
+        reflection_db.save_reflection("2025-05-14", "Layout entworfen")
+        reflection_db.save_reflection("2025-05-20", "Tests geschrieben")
+        reflection_db.save_reflection("2025-06-02", "Doku")
+        self.page = ReflectionPage()
+        self.page.date_edit.setDate(QDate(2025, 5, 14))
+
+    def tearDown(self):
+        self.page.deleteLater()
+        reflection_db.close_reflection_db()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.TEST_DB + suffix):
+                os.remove(self.TEST_DB + suffix)
+
+    def timeline_dates(self):
+        items = [self.page.timeline.item(i) for i in range(self.page.timeline.count())]
+        return [item.data(Qt.ItemDataRole.UserRole) for item in items]
+
+    def test_timeline_and_search(self):
+        self.assertEqual(self.page.text_edit.toPlainText(), "Layout entworfen")
+        self.assertEqual(self.timeline_dates(), ["2025-05-14", "2025-05-20"])
+        self.page.period_combo.setCurrentText("Woche")
+        self.assertEqual(self.timeline_dates(), ["2025-05-14"])
+        self.page.search_input.setText("doku")
+        self.page.search_timer.timeout.emit()
+        self.assertEqual(self.timeline_dates(), ["2025-06-02"])
+        self.page._open_entry(self.page.timeline.item(0))
+        self.assertEqual(self.page.text_edit.toPlainText(), "Doku")
+
+    def wait_for_autosave(self):
+        job = self.page.autosave._job
+        if job is not None:
+            job.wait(5)
+        app.processEvents()
+
+    def test_autosave_after_pause(self):
+        self.page.text_edit.setPlainText("Layout entworfen und getestet")
+        self.assertTrue(self.page.autosave.timer.isActive())
+        self.assertEqual(self.page.status_label.text(), "Ungespeicherte Änderungen")
+        self.assertEqual(reflection_db.load_reflection("2025-05-14"), "Layout entworfen")
+        self.page.autosave.timer.timeout.emit()
+        self.wait_for_autosave()
+        self.assertEqual(reflection_db.load_reflection("2025-05-14"), "Layout entworfen und getestet")
+        self.assertFalse(self.page.autosave.is_dirty())
+        self.assertTrue(self.page.status_label.text().startswith("Gespeichert"))
+
+    def test_unchanged_text_not_written(self):
+        self.page.text_edit.setPlainText("Layout entworfen!")
+        self.page.text_edit.setPlainText("Layout entworfen")
+        self.assertFalse(self.page.autosave.is_dirty())
+        self.assertFalse(self.page.autosave.timer.isActive())
+
+    def test_date_change_flushes(self):
+        self.page.text_edit.setPlainText("Geändert")
+        self.page.date_edit.setDate(QDate(2025, 5, 20))
+        self.assertEqual(self.page.text_edit.toPlainText(), "Tests geschrieben")
+        # Zurück, bevor der Job fertig ist: der ungespeicherte Text bleibt sichtbar
+        self.page.date_edit.setDate(QDate(2025, 5, 14))
+        self.assertEqual(self.page.text_edit.toPlainText(), "Geändert")
+        self.wait_for_autosave()
+        self.assertEqual(reflection_db.load_reflection("2025-05-14"), "Geändert")
+        self.assertEqual(reflection_db.load_reflection("2025-05-20"), "Tests geschrieben")
+
+    def test_flush_now(self):
+        self.page.text_edit.setPlainText("Vor dem Beenden")
+        self.page.autosave.flush_now()
+        self.assertEqual(reflection_db.load_reflection("2025-05-14"), "Vor dem Beenden")
+        self.assertFalse(self.page.autosave.is_dirty())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,202 @@
+import unittest
+import csv
+import os
+import re
+import sqlite3
+import sys
+import time
+from unittest import mock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt6.QtWidgets import QApplication, QFileDialog, QMenu, QMessageBox
+from PyQt6.QtCore import QDate
+
+from logic import perf, task_store, tasks_db
+from logic.task_store import get_task_store
+from gui.task_model import TASK_ID_ROLE
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+SEED_PER_STATUS = 250
+SELECTION = 50
+IMPORT_ROWS = 300
+
+# Budget pro UI-Aktion: (maximale SQL-Anweisungen, maximale vollständige Scans
+# der Tabelle tasks). executemany zählt pro Zeile, da SQLite jede Ausführung meldet.
+BUDGETS = {
+    "tasks.open": (6, 0),                # pro Spalte erste Seite: mit und ohne Fälligkeit
+    "tasks.refresh": (6, 0),
+    "tasks.filter_status": (2, 0),
+    "tasks.search": (1, 0),
+    "tasks.scroll_next_page": (2, 0),    # zweite Abfrage nur beim Übergang zu "ohne Fälligkeit"
+    "tasks.context_menu": (0, 0),
+    # Kalter Store: je eine Abfrage nach ID für die abgelegten bzw. geänderten Karten,
+    # dazu BEGIN, ein UPDATE bzw. DELETE pro Karte, COMMIT
+    "tasks.drop_selection": (SELECTION + 4, 0),
+    "tasks.delete_selection": (SELECTION + 3, 0),
+    "dashboard.open": (2, 1),            # Kennzahlen: eine Aggregat-Abfrage über alle Aufgaben
+    "dashboard.task_moved": (5, 1),
+    "gantt.open": (4, 1),                # Store einmal laden
+    "gantt.task_moved": (3, 0),
+    "store.sync_idle": (1, 0),
+    "settings.import_csv": (IMPORT_ROWS + 8, 0),
+}
+
+class StatementBudgetTestCase(unittest.TestCase):
+    """
+    Führt UI-Aktionen auf einer befüllten Datenbank aus und prüft die dabei
+    ausgeführten SQL-Anweisungen (aller Threads) gegen ``BUDGETS``.
+    """
+    TEST_DB = "test_sql_budget.db"
+
+    def setUp(self):
+        # Eigener Store: Seiten anderer Tests hängen noch am gemeinsamen und würden mitzählen
+        patcher = mock.patch.object(task_store, "_store", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        tasks_db.DB_PATH = self.TEST_DB
+        self.remove_db()
+        tasks_db.init_db()
+        today = QDate.currentDate()
+        tasks_db.add_tasks(
+            (
+                f"{status} {i}", status,
+                today.addDays(i % 9).toString("yyyy-MM-dd") if i % 4 else None,
+                today.addDays(-(i % 20)).toString("yyyy-MM-dd"),
+                today.addDays(i % 7).toString("yyyy-MM-dd"),
+                f"Beschreibung {i}",
+            )
+            for status in ("To Do", "In Progress", "Done")
+            for i in range(SEED_PER_STATUS)
+        )
+        # Wie in der Anwendung: das Hauptfenster legt den Store vor allen Seiten an
+        get_task_store()
+        self.plans = sqlite3.connect(self.TEST_DB)
+        self.addCleanup(self.plans.close)
+
+    def tearDown(self):
+        tasks_db.close_db()
+        self.remove_db()
+
+    def remove_db(self):
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.TEST_DB + suffix):
+                os.remove(self.TEST_DB + suffix)
+
+    def full_scans(self, statements):
+        """
+        Gibt die Abfragen zurück, die laut Query-Plan die ganze Tabelle ``tasks`` lesen.
+        """
+        scans = []
+        for sql in statements:
+            if sql.split(None, 1)[0].upper() not in ("SELECT", "WITH"):
+                continue
+            plan = self.plans.execute("EXPLAIN QUERY PLAN " + sql).fetchall()
+            if any(re.match(r"SCAN tasks\b", row[-1]) for row in plan):
+                scans.append(sql)
+        return scans
+
+    def assert_budget(self, name, action):
+        """
+        Führt ``action`` aus (inkl. ausstehender Events) und prüft das Budget ``BUDGETS[name]``.
+
+        Returns:
+            Rückgabewert von ``action``.
+        """
+        max_statements, max_scans = BUDGETS[name]
+        with perf.capture_statements() as statements:
+            result = action()
+            app.processEvents()
+        scans = self.full_scans(statements)
+        listing = "\n".join(f"  {sql[:160]}" for sql in statements)
+        self.assertLessEqual(
+            len(statements), max_statements, f"{name}: {len(statements)} Anweisungen statt max. {max_statements}\n{listing}"
+        )
+        self.assertLessEqual(len(scans), max_scans, f"{name}: {len(scans)} volle Scans statt max. {max_scans}\n{listing}")
+        return result
+
+class TestTasksPageBudget(StatementBudgetTestCase):
+    def setUp(self):
+        super().setUp()
+        from gui.tasks import TasksPage
+        # Kalter Store: die Aufgaben-Seite darf ihn auch bei Drag & Drop nicht komplett laden
+        self.page = self.assert_budget("tasks.open", TasksPage)
+        self.addCleanup(self.page.deleteLater)
+
+    def column_ids(self, status, count):
+        model = self.page.models[status]
+        return [model.index(row).data(TASK_ID_ROLE) for row in range(count)]
+
+    def test_refresh_and_filters(self):
+        self.assert_budget("tasks.refresh", self.page.refresh)
+        self.assert_budget("tasks.filter_status", lambda: self.page.filter_combo.setCurrentText("Done"))
+        self.page.search_input.setText("Beschreibung 12")
+        self.assert_budget("tasks.search", self.page.refresh)
+
+    def test_scrolling_fetches_one_page(self):
+        model = self.page.models["Done"]
+        loaded = model.rowCount()
+        self.assertTrue(model.canFetchMore())
+        self.assert_budget("tasks.scroll_next_page", model.fetchMore)
+        self.assertGreater(model.rowCount(), loaded)
+
+    def test_context_menu_reads_nothing(self):
+        view = self.page.lists["To Do"]
+        with mock.patch.object(QMenu, "exec", return_value=None):
+            self.assert_budget("tasks.context_menu", lambda: view.open_menu(view.visualRect(view.model().index(0)).center()))
+
+    def test_drop_and_delete_selection(self):
+        view = self.page.lists["To Do"]
+        ids = self.column_ids("To Do", SELECTION)
+        event = mock.Mock()
+        event.mimeData.return_value = view.model().mimeData([view.model().index(row) for row in range(SELECTION)])
+        self.assert_budget("tasks.drop_selection", lambda: self.page.lists["Done"].dropEvent(event))
+        self.assertEqual({get_task_store().get(i)[2] for i in ids}, {"Done"})
+        self.assert_budget("tasks.delete_selection", lambda: self.page.delete_tasks(ids))
+
+    def test_idle_sync(self):
+        self.assert_budget("store.sync_idle", get_task_store().sync)
+
+class TestDashboardAndGanttBudget(StatementBudgetTestCase):
+    def test_dashboard(self):
+        from gui.dashboard import DashboardPage
+        page = self.assert_budget("dashboard.open", lambda: DashboardPage("anna"))
+        self.addCleanup(page.deleteLater)
+        self.assert_budget("dashboard.task_moved", lambda: get_task_store().move_task(1, "Done"))
+
+    def test_gantt(self):
+        from gui.gantt import GanttPage
+        page = self.assert_budget("gantt.open", GanttPage)
+        self.addCleanup(page.deleteLater)
+        self.assert_budget("gantt.task_moved", lambda: get_task_store().move_task(1, "Done"))
+
+class TestImportBudget(StatementBudgetTestCase):
+    def test_import_csv(self):
+        from gui.settings import SettingsPage
+        path = self.TEST_DB + ".csv"
+        self.addCleanup(os.remove, path)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Titel", "Status", "Fälligkeitsdatum", "Startdatum", "Enddatum", "Beschreibung"])
+            writer.writerows((f"Import {i}", "To Do", "", "2025-05-14", "", "") for i in range(IMPORT_ROWS))
+        page = SettingsPage()
+        self.addCleanup(page.deleteLater)
+
+        def run_import():
+            with mock.patch.object(QFileDialog, "getOpenFileName", return_value=(path, "")), \
+                    mock.patch.object(QMessageBox, "information") as info:
+                page.import_csv()
+                done = []
+                page.job.signals.done.connect(lambda: done.append(True))
+                deadline = time.monotonic() + 10
+                while not done and time.monotonic() < deadline:
+                    app.processEvents()
+                app.processEvents()
+                self.assertTrue(done)
+                info.assert_called_once()
+
+        self.assert_budget("settings.import_csv", run_import)
+        self.assertEqual(len(get_task_store().by_status("To Do")), SEED_PER_STATUS + IMPORT_ROWS)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,276 @@
+import unittest
+import os
+import sys
+from unittest import mock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt6.QtWidgets import QApplication, QListView
+from PyQt6.QtCore import QDate
+
+from logic import tasks_db
+from logic.task_store import task_sort_key
+from gui.task_model import TaskListModel, TASK_ROLE, decode_task_ids
+from gui.task_delegate import TaskCardDelegate, due_badge
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+def task(task_id, due_date=None, title="T", status="To Do"):
+    return (task_id, title, status, due_date, None, None, None)
+
+class TestTaskListModel(unittest.TestCase):
+    def setUp(self):
+        self.model = TaskListModel("To Do")
+        self.model.set_tasks([task(1, "2025-05-01"), task(2, "2025-05-10"), task(3)])
+        self.events = []
+        self.model.rowsInserted.connect(lambda _, first, last: self.events.append(("insert", first)))
+        self.model.rowsRemoved.connect(lambda _, first, last: self.events.append(("remove", first)))
+        self.model.rowsMoved.connect(lambda *args: self.events.append(("move", args[1], args[4])))
+        self.model.dataChanged.connect(lambda tl, br: self.events.append(("changed", tl.row())))
+        self.model.modelReset.connect(lambda: self.events.append(("reset",)))
+
+    def ids(self):
+        return [self.model.index(r).data(TASK_ROLE)[0] for r in range(self.model.rowCount())]
+
+    def test_insert_sorted(self):
+        self.model.insert_task(task(4, "2025-05-05"))
+        self.assertEqual(self.ids(), [1, 4, 2, 3])
+        self.assertEqual(self.events, [("insert", 1)])
+
+    def test_remove(self):
+        self.assertTrue(self.model.remove_task(2))
+        self.assertFalse(self.model.remove_task(99))
+        self.assertEqual(self.ids(), [1, 3])
+        self.assertEqual(self.events, [("remove", 1)])
+
+    def test_update_in_place(self):
+        self.model.update_task(task(2, "2025-05-10", title="Neu"))
+        self.assertEqual(self.events, [("changed", 1)])
+        self.assertEqual(self.model.task(2)[1], "Neu")
+
+    def test_update_moves_row(self):
+        self.model.update_task(task(1, "2025-06-01"))
+        self.assertEqual(self.ids(), [2, 1, 3])
+        self.model.update_task(task(3, "2025-01-01"))
+        self.assertEqual(self.ids(), [3, 2, 1])
+        self.assertEqual([e[0] for e in self.events], ["move", "move"])
+
+    def test_stale_index_returns_none(self):
+        index = self.model.index(2)
+        self.model.set_tasks([task(1)])
+        self.assertIsNone(index.data(TASK_ROLE))
+        self.assertEqual(decode_task_ids(self.model.mimeData([self.model.index(0), index])), [1])
+
+class TestPagedTaskListModel(unittest.TestCase):
+    def setUp(self):
+        self.tasks = [task(i, f"2025-05-{i:02d}") for i in range(1, 8)] + [task(8), task(9)]
+        self.calls = []
+        self.model = TaskListModel("To Do")
+        self.model.set_source(self.fetch, page_size=3)
+
+    def fetch(self, after, limit):
+        # Wie query_task_page: Keyset (due_date, id), ohne Fälligkeit ans Ende
+        self.calls.append(after)
+        if after is not None:
+            after_key = (after[0] is None, after[0] or "", after[1])
+            return [t for t in self.tasks if task_sort_key(t) > after_key][:limit]
+        return self.tasks[:limit]
+
+    def ids(self):
+        return [self.model.index(r).data(TASK_ROLE)[0] for r in range(self.model.rowCount())]
+
+    def test_fetches_pages_on_demand(self):
+        self.assertEqual(self.ids(), [1, 2, 3])
+        self.assertTrue(self.model.canFetchMore())
+        self.model.fetchMore()
+        self.model.fetchMore()
+        self.assertEqual(self.ids(), list(range(1, 10)))
+        self.assertEqual(self.calls[2], ("2025-05-06", 6))
+        self.model.fetchMore()
+        self.assertFalse(self.model.canFetchMore())
+        self.assertEqual(self.ids(), list(range(1, 10)))
+
+    def test_changes_beyond_loaded_rows_wait_for_their_page(self):
+        self.model.insert_task(task(10, "2025-04-30"))
+        self.model.insert_task(task(11, "2025-06-01"))
+        self.assertEqual(self.ids(), [10, 1, 2, 3])
+        self.model.update_task(task(2, "2025-05-20"))
+        self.assertEqual(self.ids(), [10, 1, 3])
+        self.model.set_tasks([task(1)])
+        self.assertFalse(self.model.canFetchMore())
+        self.model.insert_task(task(12, "2025-06-01"))
+        self.assertEqual(self.ids(), [12, 1])
+
+    def test_view_fetches_more_when_scrolled(self):
+        self.tasks = [task(i, f"2025-{1 + i // 28:02d}-{1 + i % 28:02d}") for i in range(1, 300)]
+        self.model.set_source(self.fetch, page_size=50)
+        view = QListView()
+        view.setItemDelegate(TaskCardDelegate(view))
+        view.resize(300, 400)
+        view.setModel(self.model)
+        view.show()
+        app.processEvents()
+        loaded = self.model.rowCount()
+        self.assertLess(loaded, len(self.tasks))
+        view.scrollToBottom()
+        app.processEvents()
+        self.assertGreater(self.model.rowCount(), loaded)
+        view.deleteLater()
+
+class TestTaskCardDelegate(unittest.TestCase):
+    def test_due_badge(self):
+        today = "2025-05-14"
+        self.assertIsNone(due_badge(task(1), today))
+        self.assertEqual(due_badge(task(1, "2025-05-13"), today), ("überfällig", "overdue"))
+        self.assertEqual(due_badge(task(1, "2025-05-14"), today), ("heute fällig", "soon"))
+        self.assertEqual(due_badge(task(1, "2025-05-16"), today), ("in 2 T. fällig", "soon"))
+        self.assertEqual(due_badge(task(1, "2025-06-01"), today), ("fällig 2025-06-01", "later"))
+        self.assertEqual(due_badge(task(1, "2025-05-01", status="Done"), today), ("erledigt", "done"))
+
+    def test_paints_cards_with_cached_pixmaps(self):
+        model = TaskListModel("To Do")
+        model.set_tasks([
+            (i, f"Aufgabe {i}", "To Do", "2025-05-01", "2025-05-01", "2025-05-03", "Text\nmit Umbruch")
+            for i in range(500)
+        ])
+        view = QListView()
+        delegate = TaskCardDelegate(view)
+        view.setItemDelegate(delegate)
+        view.setUniformItemSizes(True)
+        view.setModel(model)
+        view.resize(300, 600)
+        view.grab()
+        view.verticalScrollBar().setValue(view.verticalScrollBar().maximum())
+        view.grab()
+        heights = {view.visualRect(model.index(r)).height() for r in (0, 499)}
+        self.assertEqual(heights, {delegate.sizeHint(None, None).height()})
+        # Alle Karten teilen sich Hintergrund und Badge, statt pro Karte neu zu malen
+        self.assertEqual(len(delegate._pixmaps), 2)
+        self.assertIn("Text mit Umbruch", [key[0] for key in delegate._elided])
+        view.deleteLater()
+
+class TestTasksPage(unittest.TestCase):
+    TEST_DB = "test_task_model.db"
+
+    def setUp(self):
+        from gui.tasks import TasksPage
+        tasks_db.DB_PATH = self.TEST_DB
+        tasks_db.init_db()
+        today = QDate.currentDate().toString("yyyy-MM-dd")
+        tasks_db.add_task("Eins", start_date=today)
+        tasks_db.add_task("Zwei", status="In Progress")
+        tasks_db.add_task("Alt", start_date="2000-01-01")
+        self.page = TasksPage()
+
+    def tearDown(self):
+        self.page.deleteLater()
+        tasks_db.close_db()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.TEST_DB + suffix):
+                os.remove(self.TEST_DB + suffix)
+
+    def titles(self, status):
+        model = self.page.models[status]
+        return [model.index(r).data(TASK_ROLE)[1] for r in range(model.rowCount())]
+
+    def test_initial_load_applies_filter(self):
+        self.assertEqual(self.titles("To Do"), ["Eins"])
+        self.assertEqual(self.titles("In Progress"), ["Zwei"])
+
+    def test_search_is_debounced_and_narrows_columns(self):
+        self.page.store.add_task("Entwurf", status="In Progress")
+        self.page.search_input.setText("entw")
+        # Noch nicht gesucht, erst nach der Tipp-Pause
+        self.assertTrue(self.page.search_timer.isActive())
+        self.assertEqual(self.titles("In Progress"), ["Zwei", "Entwurf"])
+        self.page.search_timer.timeout.emit()
+        self.assertEqual(self.titles("In Progress"), ["Entwurf"])
+        self.assertEqual(self.titles("To Do"), [])
+        # Neue Aufgaben erscheinen während der Suche nur, wenn neu gesucht wird
+        self.page.store.add_task("Entwurf 2")
+        self.assertEqual(self.titles("To Do"), [])
+        self.page.search_input.clear()
+        self.page.refresh()
+        self.assertEqual(self.titles("To Do"), ["Eins", "Entwurf 2"])
+
+    def test_columns_load_first_page_only(self):
+        count = tasks_db.TASK_PAGE_SIZE + 50
+        tasks_db.add_tasks((f"Fertig {i}", "Done", f"2025-01-{1 + i % 28:02d}", None, None, None) for i in range(count))
+        self.page.refresh()
+        model = self.page.models["Done"]
+        self.assertEqual(model.rowCount(), tasks_db.TASK_PAGE_SIZE)
+        self.assertTrue(model.canFetchMore())
+        model.fetchMore()
+        self.assertEqual(model.rowCount(), count)
+        self.assertFalse(model.canFetchMore())
+        # Ohne Fälligkeit sortiert "Eins" hinter die erste Seite: erst mit ihr sichtbar, nicht doppelt
+        self.page.refresh()
+        self.page.move_task(1, "Done")
+        self.assertNotIn("Eins", self.titles("Done"))
+        model.fetchMore()
+        self.assertEqual(self.titles("Done").count("Eins"), 1)
+
+    def test_drop_moves_selection_in_one_batch(self):
+        self.page.store.add_task("Drei")
+        view = self.page.lists["To Do"]
+        view.selectAll()
+        dragged = view.selected_task_ids()
+        self.assertEqual(len(dragged), 2)
+        batches = []
+        self.page.store.tasks_changed.connect(batches.append)
+        event = mock.Mock()
+        event.mimeData.return_value = view.model().mimeData(view.selectionModel().selectedIndexes())
+        self.page.lists["Done"].dropEvent(event)
+        self.assertEqual(batches, [dragged])
+        self.assertEqual(self.titles("To Do"), [])
+        self.assertEqual(sorted(self.titles("Done")), ["Drei", "Eins"])
+        # Erneutes Ablegen in derselben Spalte schreibt nichts
+        self.page.lists["Done"].dropEvent(event)
+        self.assertEqual(len(batches), 1)
+
+    def test_drop_keeps_store_unloaded(self):
+        view = self.page.lists["To Do"]
+        event = mock.Mock()
+        event.mimeData.return_value = view.model().mimeData([view.model().index(0)])
+        with mock.patch.object(tasks_db, "get_tasks", wraps=tasks_db.get_tasks) as get_tasks:
+            self.page.lists["Done"].dropEvent(event)
+            self.page.delete_task(2)
+        # Nur die betroffenen IDs nachgeschlagen, nicht die ganze Tabelle geladen
+        get_tasks.assert_not_called()
+        self.assertFalse(self.page.store._is_loaded())
+        self.assertEqual(self.titles("To Do"), [])
+        self.assertEqual(self.titles("Done"), ["Eins"])
+        self.assertEqual(self.titles("In Progress"), [])
+
+    def test_move_and_delete_without_reset(self):
+        resets = []
+        for model in self.page.models.values():
+            model.modelReset.connect(lambda: resets.append(1))
+        self.page.move_task(1, "Done")
+        self.assertEqual(self.titles("To Do"), [])
+        self.assertEqual(self.titles("Done"), ["Eins"])
+        self.page.delete_task(2)
+        self.assertEqual(self.titles("In Progress"), [])
+        self.assertEqual(resets, [])
+        self.assertEqual(tasks_db.get_task(1)[2], "Done")
+
+    def test_context_menu_survives_reset(self):
+        from PyQt6.QtWidgets import QMenu
+        view = self.page.lists["To Do"]
+        model = view.model()
+        opened = []
+
+        def exec_menu(menu, pos):
+            # Ein Abgleich während des offenen Menüs setzt die Spalte zurück
+            model.set_tasks([])
+            opened.append(1)
+            return menu.actions()[1]
+
+        self.page.store.edit_task(1, "Eins", description="Neu")
+        with mock.patch.object(QMenu, "exec", exec_menu), \
+                mock.patch.object(self.page, "show_description") as show:
+            view.open_menu(view.visualRect(model.index(0)).center())
+        self.assertEqual(opened, [1])
+        show.assert_called_once_with(1, "Neu")
+
+if __name__ == "__main__":
+    unittest.main()
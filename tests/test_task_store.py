@@ -0,0 +1,102 @@
+import unittest
+import os
+from unittest import mock
+
+from logic import tasks_db
+from logic.task_store import TaskStore, SYNC_RESET_THRESHOLD
+
+class TestTaskStore(unittest.TestCase):
+    TEST_DB = "test_task_store.db"
+
+    def setUp(self):
+        tasks_db.DB_PATH = self.TEST_DB
+        tasks_db.init_db()
+        tasks_db.add_task("B", due_date="2025-05-10")
+        tasks_db.add_task("A", due_date="2025-05-01")
+        tasks_db.add_task("C", status="Done")
+        self.store = TaskStore()
+        self.changed = []
+        self.store.tasks_changed.connect(self.changed.append)
+
+    def tearDown(self):
+        tasks_db.close_db()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.TEST_DB + suffix):
+                os.remove(self.TEST_DB + suffix)
+
+    def test_loads_table_once(self):
+        with mock.patch.object(tasks_db, "get_tasks", wraps=tasks_db.get_tasks) as get_tasks:
+            self.assertEqual(self.store.get(1)[1], "B")
+            self.assertEqual([t[1] for t in self.store.by_status("To Do")], ["A", "B"])
+            self.store.move_task(1, "Done")
+            self.assertEqual([t[1] for t in self.store.by_status("Done")], ["B", "C"])
+            self.assertEqual(get_tasks.call_count, 1)
+
+    def test_writes_update_cache_and_notify(self):
+        self.store.get(1)
+        new_id = self.store.add_task("D", due_date="2025-04-01")
+        self.store.edit_task(2, "A2", "2025-05-01", "2025-05-02", "Text")
+        self.store.delete_task(3)
+        self.assertEqual(self.changed, [[new_id], [2], [3]])
+        self.assertEqual(self.store.get(2), tasks_db.get_task(2))
+        self.assertEqual(self.store.get(new_id), tasks_db.get_task(new_id))
+        self.assertIsNone(self.store.get(3))
+        self.assertEqual([t[1] for t in self.store.by_status("To Do")], ["D", "A2", "B"])
+
+    def test_batch_writes_notify_once(self):
+        self.store.get(1)
+        with mock.patch.object(tasks_db, "update_task_status") as single:
+            self.store.move_tasks([1, 2], "Done")
+            single.assert_not_called()
+        self.store.edit_tasks([(1, "B2", None, None, None), (3, "C2", None, None, "Text")])
+        self.store.delete_tasks([2, 3])
+        self.store.move_tasks([], "To Do")
+        self.assertEqual(self.changed, [[1, 2], [1, 3], [2, 3]])
+        self.assertEqual(self.store.by_status("Done"), [tasks_db.get_task(1)])
+        self.assertEqual(self.store.get(1)[1], "B2")
+        self.assertIsNone(self.store.get(3))
+
+    def test_sync_applies_external_changes(self):
+        self.store.get(1)
+        self.store.move_task(1, "In Progress")
+        # Schreibzugriffe an Store vorbei, z.B. Import oder Kommandozeile
+        tasks_db.edit_task(2, "A2")
+        tasks_db.delete_task(3)
+        new_id = tasks_db.add_task("D", due_date="2025-04-01")
+        with mock.patch.object(tasks_db, "get_tasks") as get_tasks:
+            self.assertEqual(self.store.sync(), [2, new_id, 3])
+            get_tasks.assert_not_called()
+        self.assertEqual(self.changed, [[1], [2, new_id, 3]])
+        self.assertEqual([t[1] for t in self.store.by_status("To Do")], ["D", "A2"])
+        self.assertIsNone(self.store.get(3))
+        self.assertEqual(self.store.sync(), [])
+        self.assertEqual(len(self.changed), 2)
+
+    def test_sync_before_first_load_sees_earlier_writes(self):
+        resets = []
+        self.store.tasks_reset.connect(lambda: resets.append(True))
+        # Schreibzugriff zwischen Anlegen des Stores und dem ersten Abgleich
+        tasks_db.add_task("Von außen")
+        self.store.sync()
+        self.assertEqual(resets, [True])
+        self.store.sync()
+        self.assertEqual(resets, [True])
+
+    def test_sync_resets_on_large_delta(self):
+        resets = []
+        self.store.tasks_reset.connect(lambda: resets.append(True))
+        self.store.tasks()
+        tasks_db.add_tasks(("T", "To Do", None, None, None, None) for _ in range(SYNC_RESET_THRESHOLD + 1))
+        self.store.sync()
+        self.assertEqual((len(resets), self.changed), (1, []))
+        self.assertEqual(len(self.store.tasks()), SYNC_RESET_THRESHOLD + 4)
+
+    def test_new_database_invalidates_cache(self):
+        self.assertIsNotNone(self.store.get(1))
+        tasks_db.close_db()
+        os.remove(self.TEST_DB)
+        tasks_db.init_db()
+        self.assertEqual(self.store.tasks(), [])
+
+if __name__ == "__main__":
+    unittest.main()
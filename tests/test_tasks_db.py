@@ -1,5 +1,7 @@
 import unittest
 import os
+import csv
+import gzip
 import sqlite3
 from logic import tasks_db
 
@@ -7,14 +9,20 @@ class TestTasksDB(unittest.TestCase):
     TEST_DB = "test_tasks.db"
 
     def setUp(self):
-        # Testdatenbank anlegen
+        # Testdatenbank anlegen (Reste eines abgebrochenen Laufs vorher entfernen)
         tasks_db.DB_PATH = self.TEST_DB
+        self.remove_db()
         tasks_db.init_db()
 
     def tearDown(self):
         # Testdatenbank löschen
-        if os.path.exists(self.TEST_DB):
-            os.remove(self.TEST_DB)
+        tasks_db.close_db()
+        self.remove_db()
+
+    def remove_db(self):
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.TEST_DB + suffix):
+                os.remove(self.TEST_DB + suffix)
 
     def test_add_and_get_task(self):
         tasks_db.add_task("Testaufgabe", status="To Do")
@@ -36,5 +44,233 @@ class TestTasksDB(unittest.TestCase):
         tasks_db.delete_task(task_id)
         self.assertEqual(len(tasks_db.get_tasks()), 0)
 
+    def test_repository_reuses_connection(self):
+        repo = tasks_db.get_repository()
+        self.assertIs(repo.connection(), repo.connection())
+        self.assertIs(repo, tasks_db.get_repository(self.TEST_DB))
+
+    def test_transaction_rollback(self):
+        repo = tasks_db.get_repository()
+        with self.assertRaises(RuntimeError):
+            with repo.transaction():
+                repo.add_task("A")
+                repo.add_task("B")
+                raise RuntimeError("Abbruch")
+        self.assertEqual(tasks_db.get_tasks(), [])
+
+    def test_nested_transaction_savepoint(self):
+        repo = tasks_db.get_repository()
+        with repo.transaction():
+            repo.add_task("Außen")
+            try:
+                with repo.transaction():
+                    repo.add_task("Innen")
+                    raise ValueError
+            except ValueError:
+                pass
+        self.assertEqual([t[1] for t in tasks_db.get_tasks()], ["Außen"])
+
+    def test_fresh_db_schema(self):
+        repo = tasks_db.get_repository()
+        self.assertEqual(repo.schema_version(), tasks_db.SCHEMA_VERSION)
+        columns = [col[1] for col in repo.connection().execute("PRAGMA table_info(tasks)")]
+        self.assertIn("description", columns)
+        mode = repo.connection().execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+    def test_migrate_is_idempotent(self):
+        tasks_db.add_task("Bleibt")
+        tasks_db.init_db()
+        tasks_db.init_user_db()
+        self.assertEqual([t[1] for t in tasks_db.get_tasks()], ["Bleibt"])
+
+    def test_migrate_legacy_db(self):
+        tasks_db.close_db()
+        self.remove_db()
+        conn = sqlite3.connect(self.TEST_DB)
+        conn.execute(
+            "CREATE TABLE tasks (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "title TEXT NOT NULL, status TEXT NOT NULL, due_date TEXT, start_date TEXT, end_date TEXT)"
+        )
+        conn.execute("INSERT INTO tasks (title, status) VALUES ('Alt', 'Done')")
+        conn.commit()
+        conn.close()
+        tasks_db.init_db()
+        self.assertEqual(tasks_db.get_tasks(), [(1, "Alt", "Done", None, None, None, None)])
+        self.assertEqual(tasks_db.get_repository().schema_version(), tasks_db.SCHEMA_VERSION)
+        # Bestehende Zeilen landen beim Migrieren im Suchindex
+        self.assertEqual([t[1] for t in tasks_db.search_tasks("alt")], ["Alt"])
+
+    def test_query_tasks_filters_and_sorts(self):
+        tasks_db.add_task("Spät", status="To Do", due_date="2025-06-10", start_date="2025-05-20")
+        tasks_db.add_task("Früh", status="To Do", due_date="2025-05-15", start_date="2025-05-14")
+        tasks_db.add_task("Ohne Datum", status="To Do")
+        tasks_db.add_task("Außerhalb", status="To Do", start_date="2024-01-01")
+        tasks_db.add_task("Fertig", status="Done", start_date="2025-05-14")
+        rows = tasks_db.query_tasks(status="To Do", start_from="2025-05-01", start_to="2025-05-31")
+        self.assertEqual([r[1] for r in rows], ["Früh", "Spät", "Ohne Datum"])
+        self.assertEqual(len(tasks_db.query_tasks()), 5)
+        with self.assertRaises(ValueError):
+            tasks_db.query_tasks(order_by="title; DROP TABLE tasks")
+
+    def test_query_task_page_keyset(self):
+        for i, due_date in enumerate(["2025-05-02", None, "", "2025-05-01", None, "2025-05-02", "2025-05-01"]):
+            tasks_db.add_task(f"T{i}", status="To Do", due_date=due_date)
+        tasks_db.add_task("Fertig", status="Done", due_date="2025-05-01")
+        expected = tasks_db.query_tasks(status="To Do")
+        pages, after = [], None
+        while True:
+            page = tasks_db.query_task_page(status="To Do", after=after, limit=3)
+            pages.append(page)
+            if len(page) < 3:
+                break
+            after = tasks_db.task_page_key(page[-1])
+        self.assertEqual([len(p) for p in pages], [3, 3, 1])
+        self.assertEqual([t for p in pages for t in p], expected)
+        # Beide Teilabfragen (mit und ohne Fälligkeit) laufen über den Index, ohne Sortierschritt
+        conn = tasks_db.get_repository().connection()
+        for sql in (
+            "SELECT id FROM tasks WHERE status = ? AND due_date IS NOT NULL AND (due_date, id) > (?, ?) "
+            "ORDER BY due_date, id LIMIT 3",
+            "SELECT id FROM tasks WHERE status = ? AND due_date IS NULL AND id > ? ORDER BY id LIMIT 3",
+        ):
+            params = ("To Do", "2025-05-01", 4) if "(?, ?)" in sql else ("To Do", 4)
+            plan = " ".join(row[-1] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, params))
+            self.assertIn("idx_tasks_status_due", plan)
+            self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_batch_writes(self):
+        ids = [tasks_db.add_task(f"T{i}", description=f"Text {i}") for i in range(5)]
+        self.assertEqual(tasks_db.move_tasks(ids[:3] + [999], "Done"), 3)
+        self.assertEqual([tasks_db.get_task(i)[2] for i in ids], ["Done"] * 3 + ["To Do"] * 2)
+        self.assertEqual(
+            tasks_db.edit_tasks([(ids[0], "Neu", "2025-05-01", None, None), (ids[1], "Auch", None, None, "Anders")]), 2
+        )
+        self.assertEqual(tasks_db.get_task(ids[0])[1:], ("Neu", "Done", None, "2025-05-01", None, "Text 0"))
+        self.assertEqual(tasks_db.get_task(ids[1])[6], "Anders")
+        self.assertEqual(tasks_db.delete_tasks(ids[3:]), 2)
+        self.assertEqual(len(tasks_db.get_tasks()), 3)
+        self.assertEqual(tasks_db.move_tasks([], "Done"), 0)
+
+    def test_get_tasks_by_ids(self):
+        ids = [tasks_db.add_task(f"T{i}") for i in range(tasks_db.ID_LOOKUP_CHUNK_SIZE + 3)]
+        found = tasks_db.get_tasks_by_ids(ids[::-1] + [999999])
+        self.assertEqual(sorted(t[0] for t in found), ids)
+        self.assertEqual(tasks_db.get_tasks_by_ids([]), [])
+
+    def test_get_task_stats(self):
+        self.assertEqual(tasks_db.get_task_stats(), {"total": 0, "by_status": {}, "next_due": None})
+        tasks_db.add_task("A", status="To Do", due_date="2025-06-10")
+        second = tasks_db.add_task("B", status="Done", due_date="2025-05-15")
+        tasks_db.add_task("C", status="In Progress", due_date="")
+        tasks_db.add_task("D", status="To Do", due_date="2025-05-15")
+        stats = tasks_db.get_task_stats()
+        self.assertEqual(stats["total"], 4)
+        self.assertEqual(stats["by_status"], {"To Do": 2, "In Progress": 1, "Done": 1})
+        # Bei gleicher Fälligkeit gewinnt die ältere Aufgabe
+        self.assertEqual(stats["next_due"], (second, "B", "2025-05-15"))
+
+    def test_search_tasks_ranked_and_synced(self):
+        in_description = tasks_db.add_task("Layout", description="Entwurf abstimmen")
+        in_title = tasks_db.add_task("Entwurf")
+        tasks_db.add_task("Doku")
+        self.assertEqual([t[0] for t in tasks_db.search_tasks("entw")], [in_title, in_description])
+        tasks_db.edit_task(in_title, "Skizze")
+        self.assertEqual([t[0] for t in tasks_db.search_tasks("entwurf")], [in_description])
+        tasks_db.delete_task(in_description)
+        self.assertEqual(tasks_db.search_tasks("entwurf"), [])
+        self.assertEqual(tasks_db.search_tasks("skiz doku"), [])
+        # FTS5-Syntax in der Eingabe führt nicht zu Fehlern
+        self.assertEqual(tasks_db.search_tasks('" AND ('), [])
+        self.assertEqual(tasks_db.search_tasks(""), [])
+
+    def test_changes_since(self):
+        self.assertEqual(tasks_db.get_revision(), 0)
+        kept = tasks_db.add_task("A")
+        gone = tasks_db.add_task("B")
+        rev = tasks_db.get_revision()
+        tasks_db.update_task_status(kept, "Done")
+        tasks_db.update_task_status(kept, "Done")  # ohne Änderung: kein Eintrag
+        tasks_db.edit_task(kept, "A2")
+        tasks_db.delete_task(gone)
+        new = tasks_db.add_task("C")
+        delta = tasks_db.get_changes_since(rev)
+        self.assertTrue(delta["complete"])
+        self.assertEqual(delta["rev"], rev + 4)
+        self.assertEqual(delta["changed"], [tasks_db.get_task(kept), tasks_db.get_task(new)])
+        self.assertEqual(delta["deleted"], [gone])
+        self.assertEqual(tasks_db.get_changes_since(delta["rev"])["changed"], [])
+
+    def test_pruned_changes_incomplete(self):
+        tasks_db.add_tasks(("T", "To Do", None, None, None, None) for _ in range(10))
+        self.assertEqual(tasks_db.get_repository().prune_changes(keep=3), 7)
+        self.assertFalse(tasks_db.get_changes_since(0)["complete"])
+        self.assertTrue(tasks_db.get_changes_since(7)["complete"])
+        self.assertEqual(len(tasks_db.get_changes_since(7)["changed"]), 3)
+        tasks_db.get_repository().prune_changes(keep=0)
+        self.assertTrue(tasks_db.get_changes_since(10)["complete"])
+        self.assertEqual(tasks_db.get_revision(), 10)
+
+    def test_query_tasks_uses_index(self):
+        plan = tasks_db.get_repository().connection().execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM tasks WHERE status = ? AND start_date >= ?", ("Done", "2025-01-01")
+        ).fetchall()
+        self.assertIn("USING", " ".join(row[-1] for row in plan))
+
+    def write_csv(self, rows):
+        path = self.TEST_DB + ".csv"
+        self.addCleanup(os.remove, path)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Titel", "Status", "Fälligkeitsdatum", "Startdatum", "Enddatum", "Beschreibung"])
+            writer.writerows(rows)
+        return path
+
+    def test_import_csv_in_chunks(self):
+        path = self.write_csv([(f"T{i}", "To Do", "", "2025-05-14", "", "") for i in range(25)])
+        calls = []
+        count = tasks_db.import_tasks_from_csv(path, progress=lambda *args: calls.append(args), chunk_size=10)
+        self.assertEqual(count, 25)
+        self.assertEqual([c[0] for c in calls], [10, 20, 25])
+        self.assertEqual(calls[-1][1], calls[-1][2])
+        self.assertEqual(len(tasks_db.get_tasks()), 25)
+        self.assertIsNone(tasks_db.get_tasks()[0][3])
+
+    def test_import_csv_cancel_rolls_back(self):
+        path = self.write_csv([(f"T{i}", "Done", "", "", "", "") for i in range(25)])
+        with self.assertRaises(tasks_db.ImportCancelled):
+            tasks_db.import_tasks_from_csv(path, progress=lambda rows, *_: rows < 20, chunk_size=10)
+        self.assertEqual(tasks_db.get_tasks(), [])
+
+    def test_export_csv_streaming_and_gzip(self):
+        tasks_db.add_tasks([(f"T{i}", "Done" if i % 2 else "To Do", None, None, None, None) for i in range(2500)])
+        path = self.TEST_DB + ".csv.gz"
+        self.addCleanup(os.remove, path)
+        self.assertEqual(tasks_db.export_tasks_to_csv(path, status="Done"), 1250)
+        with gzip.open(path, "rt", encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0], tasks_db.CSV_HEADER)
+        self.assertEqual(len(rows), 1251)
+        self.assertEqual({r[2] for r in rows[1:]}, {"Done"})
+
+    def test_export_csv_cancel_removes_file(self):
+        tasks_db.add_tasks([("T", "To Do", None, None, None, None)] * 10)
+        path = self.TEST_DB + ".csv"
+
+        def cancel(rows):
+            raise KeyboardInterrupt
+        with self.assertRaises(KeyboardInterrupt):
+            tasks_db.export_tasks_to_csv(path, progress=cancel)
+        self.assertFalse(os.path.exists(path))
+
+    def test_export_import_roundtrip(self):
+        tasks_db.add_task("Rund", status="In Progress", due_date="2025-06-01", description="Text")
+        path = self.TEST_DB + ".csv"
+        self.addCleanup(os.remove, path)
+        tasks_db.export_tasks_to_csv(path)
+        tasks_db.import_tasks_from_csv(path)
+        first, second = tasks_db.get_tasks()
+        self.assertEqual(first[1:], second[1:])
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file